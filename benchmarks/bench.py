@@ -0,0 +1,205 @@
+"""Benchmarks for Hand, Flop and the HDSC transform.
+
+Times Hand construction, every entry of Hand.FLAGS, outs_to,
+rest_of_the_deck, to_hdsc, and Flop construction and typing, over fixed,
+seeded corpora of flop hands:
+
+    random      uniformly dealt hands
+    flush       two-tone flops and suited hole cards sharing the suit
+    straight    connected flops and connected hole cards
+
+Run on one version of the code:
+
+    python benchmarks/bench.py --output new.json
+
+then compare two runs, failing if throughput dropped by more than 10%:
+
+    python benchmarks/bench.py --compare old.json new.json --threshold 0.1
+
+The checkout the script lives in is benchmarked, not an installed treys.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from deuces import Card, Deck  # noqa: E402
+
+from treys import Flop, Hand  # noqa: E402
+from treys.cache import classification_cache  # noqa: E402
+from treys.evaluator import warm_up  # noqa: E402
+
+
+def random_corpus(rng, size):
+    corpus = []
+    for _ in range(size):
+        deck = Deck.GetFullDeck()
+        rng.shuffle(deck)
+        corpus.append((deck[:2], deck[2:5]))
+    return corpus
+
+
+def _deal(rng, size, choose):
+    corpus = []
+    while len(corpus) < size:
+        strs = choose(rng)
+        cards = [Card.new(s) for s in strs]
+        if len(set(cards)) == 5:
+            corpus.append((cards[:2], cards[2:]))
+    return corpus
+
+
+def flush_corpus(rng, size):
+    def choose(rng):
+        (suit, other) = rng.sample("shdc", 2)
+        ranks = rng.sample(Card.STR_RANKS, 5)
+        suits = [suit, suit, suit, suit, other]
+        return [r + s for (r, s) in zip(ranks, suits)]
+    return _deal(rng, size, choose)
+
+
+def straight_corpus(rng, size):
+    def choose(rng):
+        low = rng.randrange(0, 9)
+        ranks = [Card.STR_RANKS[low + i] for i in rng.sample(range(5), 5)]
+        ranks[rng.randrange(5)] = rng.choice(Card.STR_RANKS)
+        return [r + rng.choice("shdc") for r in ranks]
+    return _deal(rng, size, choose)
+
+
+CORPORA = {
+    "random": random_corpus,
+    "flush": flush_corpus,
+    "straight": straight_corpus,
+}
+
+
+def _time(function, make_items, repeat):
+    """Return the best total time of calling `function` on all items.
+
+    The items are made again by `make_items`, untimed, before every run:
+    hands keep their rank once evaluated, so timing the same hands twice
+    would leave the evaluation out.
+    """
+    best = None
+    for _ in range(repeat):
+        items = make_items()
+        classification_cache.clear()
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def _result(seconds, calls):
+    return {
+        "calls": calls,
+        "seconds": seconds,
+        "us_per_call": 1e6 * seconds / calls,
+        "calls_per_second": calls / seconds if seconds else float("inf"),
+    }
+
+
+def run(size, seed, repeat):
+    """Run every benchmark on every corpus and return the results."""
+    ev = warm_up()
+    results = {}
+    for (corpus_name, make_corpus) in sorted(CORPORA.items()):
+        corpus = make_corpus(random.Random(seed), size)
+        boards = [board for (_, board) in corpus]
+
+        def hands(corpus=corpus):
+            return [Hand(cards, board, ev) for (cards, board) in corpus]
+
+        def bench(name, function, make_items):
+            seconds = _time(function, make_items, repeat)
+            results["%s/%s" % (corpus_name, name)] = _result(seconds, len(corpus))
+
+        bench("Hand.__init__", lambda hand: Hand(hand[0], hand[1], ev),
+              lambda: corpus)
+        bench("Hand.rest_of_the_deck", Hand.rest_of_the_deck, hands)
+        bench("Hand.outs_to", lambda hand: hand.outs_to(Hand.is_straight), hands)
+        bench("Hand.to_hdsc", _safe_hdsc, hands)
+        for flag in Hand.FLAGS:
+            bench("Hand.%s" % flag.__name__, flag, hands)
+        bench("Flop.__init__", Flop, lambda: boards)
+        bench("Flop.type", lambda board: Flop(board).type, lambda: boards)
+    return results
+
+
+def _safe_hdsc(hand):
+    try:
+        hand.to_hdsc()
+    except AssertionError:
+        pass
+
+
+def compare(old, new, threshold):
+    """Print the throughput change of each benchmark.
+
+    Returns the names of those slower by more than `threshold`.
+    """
+    regressions = []
+    for name in sorted(set(old["results"]) & set(new["results"])):
+        before = old["results"][name]["calls_per_second"]
+        after = new["results"][name]["calls_per_second"]
+        change = after / before - 1
+        marker = ""
+        if change < -threshold:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        print("%-50s %12.0f %12.0f %+7.1f%%%s" %
+              (name, before, after, 100 * change, marker))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=500,
+                        help="hands per corpus")
+    parser.add_argument("--seed", type=int, default=2017)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per benchmark, the best one is kept")
+    parser.add_argument("--output", help="JSON file to write (default: stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="compare two result files instead of running")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="throughput drop counted as a regression")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        return 1 if compare(old, new, args.threshold) else 0
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "size": args.size,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": run(args.size, args.seed, args.repeat),
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from treys.hand import Hand
+from deuces import Evaluator
+
+try:
+    import numpy as np
+    from treys import aio
+except ImportError:
+    np = None
+
+
+@skipIf(np is None, "numpy is not installed")
+class ServiceTests(TestCase):
+    """Test the batching asyncio classification service."""
+
+    _hands = [
+        (["Ks", "Jd"], ["Js", "Qs", "2h"]),
+        (["7s", "5s"], ["Ac", "8s", "6s"]),
+        (["8c", "8d"], ["8s", "Ah", "2s", "3d"]),
+        (["Ac", "Kd"], ["7s", "8c", "2d", "3h", "Qs"]),
+    ]
+
+    def _expected(self, flags):
+        ev = Evaluator()
+        results = []
+        for (cards, board) in self._hands:
+            hand = Hand(cards, board, ev)
+            values = [flag(hand) for flag in flags]
+            results.append({flag.__name__: bool(any(value) if isinstance(value, tuple)
+                                                else value)
+                            for (flag, value) in zip(flags, values)})
+        return results
+
+    def test_batches(self):
+        flags = [Hand.has_flush_draw, Hand.is_set, Hand.has_top_pair]
+        batches = []
+
+        async def run():
+            service = aio.ClassificationService(flags, max_batch=3, max_delay=0.01)
+            original = service.flush
+
+            def flush():
+                batches.append(len(service._pending))
+                original()
+            service.flush = flush
+            return await service.classify_many(self._hands)
+
+        self.assertEqual(asyncio.run(run()), self._expected(flags))
+        self.assertEqual(batches, [3, 1])
+
+    def test_module_classify_and_executor(self):
+        async def run():
+            with ThreadPoolExecutor(2) as executor:
+                service = aio.ClassificationService(executor=executor)
+                first = await service.classify(*self._hands[0])
+            return (first, await aio.classify(*self._hands[1]))
+
+        (first, second) = asyncio.run(run())
+        expected = self._expected(Hand.FLAGS)
+        self.assertEqual(first, expected[0])
+        self.assertEqual(second, expected[1])
+
+    def test_invalid_hand(self):
+        async def run(cards, board):
+            await aio.ClassificationService().classify(cards, board)
+
+        for (cards, board) in [(["Ks", "Ks"], ["Js", "Qs", "2h"]),
+                               (["Xx", "Kd"], ["Js", "Qs", "2h"]),
+                               (["As", "Kd"], ["Js", "Qs", 12345])]:
+            with self.assertRaises(ValueError):
+                asyncio.run(run(cards, board))
+
+
+if __name__ == '__main__':
+    main()
@@ -83,5 +83,39 @@ class HandTests(TestCase):
         not_suited = Hand(["As", "Kd"], ["2d", "3c", "5h"], self.ev)
         self.assertFalse(not_suited.hand_is_suited())
 
+    def test_compact_representation(self):
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        self.assertFalse(hasattr(hand, "__dict__"))
+        self.assertFalse(hasattr(hand._board, "__dict__"))
+        self.assertEqual(hand.cards, ["Jd", "Ks"])
+        self.assertEqual(hand.board, ["2h", "Js", "Qs"])
+        self.assertEqual(hand.ranks, [9, 11])
+        self.assertEqual(hand.suits, ["d", "s"])
+        self.assertEqual(hand._board_ranks, [0, 9, 10])
+
+    def test_lazy_evaluation(self):
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        self.assertIsNone(hand._rank)
+        self.assertFalse(hand.hand_is_suited())
+        self.assertIsNone(hand._rank)
+        self.assertEqual(hand.rank_class, 8)
+        hand.board = ["Js", "Qs", "Jh"]
+        self.assertEqual(hand.rank_class, 6)
+        hand.cards = ["Qd", "Jd"]
+        self.assertEqual(hand.rank_class, 3)
+
+    def test_no_validation(self):
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev, validate=False)
+        self.assertEqual(hand.rank_class, 8)
+        # Invalid hands are the caller's problem.
+        Hand(["Ks", "Ks"], ["Js", "Qs", "2h"], self.ev, validate=False)
+
+    def test_cards_are_shared(self):
+        first = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        second = Hand([Card.new("Ks"), Card.new("Jd")], ["Js", "Qs", "2h"], self.ev)
+        for (a, b) in zip(first._cards + first._board._cards,
+                          second._cards + second._board._cards):
+            self.assertIs(a, b)
+
 if __name__ == "__main__":
     main()
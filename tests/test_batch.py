@@ -0,0 +1,100 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+import random
+
+from treys.hand import Hand
+from treys.flop import Flop
+from deuces import Card, Deck, Evaluator
+
+try:
+    import numpy as np
+    from treys.batch import classify, flag_column, flop_paired, flop_ranks, \
+        flop_suit_counts, flop_types
+except ImportError:
+    np = None
+
+
+def _ints(strs):
+    return [Card.new(card_str) for card_str in strs]
+
+
+@skipIf(np is None, "numpy is not installed")
+class BatchTests(TestCase):
+    """Test the batch classification against the Hand methods."""
+
+    _hands = [
+        (["7s", "5s"], ["Ac", "8s", "6s"]),
+        (["9c", "8d"], ["7d", "5c", "2s"]),
+        (["Qh", "Qs"], ["2s", "3c", "8d"]),
+        (["As", "Kh"], ["Kd", "Tc", "2c"]),
+        (["2s", "2d"], ["2c", "4d", "8d"]),
+        (["As", "Qd"], ["2c", "2h", "8d"]),
+        (["Ac", "3c"], ["Kc", "Tc", "2c", "5h"]),
+        (["Ks", "Jd"], ["Js", "Qs", "2h", "3d", "Ts"]),
+    ]
+
+    def setUp(self):
+        self.ev = Evaluator()
+        self.cards = [_ints(cards) for (cards, _) in self._hands]
+        self.boards = [_ints(board) for (_, board) in self._hands]
+
+    def test_matches_hand_flags(self):
+        matrix = classify(self.cards, self.boards, self.ev)
+        self.assertEqual(matrix.shape, (len(self._hands), len(Hand.FLAGS)))
+        for (row, (cards, board)) in enumerate(zip(self.cards, self.boards)):
+            hand = Hand(cards, board, self.ev)
+            for (column, flag) in enumerate(Hand.FLAGS):
+                result = flag(hand)
+                if isinstance(result, tuple):
+                    result = any(result)
+                self.assertEqual(matrix[row, column], result)
+
+    def test_numpy_input(self):
+        cards = np.array(self.cards[:6])
+        boards = np.array(self.boards[:6])
+        self.assertTrue(
+            (classify(cards, boards, self.ev) ==
+             classify(self.cards[:6], self.boards[:6], self.ev)).all())
+
+    def test_packed(self):
+        matrix = classify(self.cards, self.boards, self.ev)
+        packed = classify(self.cards, self.boards, self.ev, packed=True)
+        self.assertEqual(packed.shape, (len(self._hands), 5))
+        unpacked = np.unpackbits(packed, axis=1)[:, :len(Hand.FLAGS)]
+        self.assertTrue((unpacked == matrix).all())
+
+    def test_flag_column(self):
+        self.assertEqual(flag_column(Hand.has_top_pair), 12)
+        self.assertEqual(flag_column("has_top_pair"), 12)
+
+    def test_flop_textures(self):
+        rng = random.Random(17)
+        for size in [3, 4, 5]:
+            boards = []
+            for _ in range(500):
+                deck = Deck.GetFullDeck()
+                rng.shuffle(deck)
+                boards.append(deck[:size])
+            boards.append(_ints(["Ks", "Kd", "Kh", "2c", "3c"][:size]))
+            ranks = flop_ranks(np.array(boards))
+            suit_counts = flop_suit_counts(boards)
+            paired = flop_paired(boards)
+            for (i, board) in enumerate(boards):
+                flop = Flop(board)
+                self.assertEqual(ranks[i].tolist(), flop.ranks)
+                self.assertEqual(suit_counts[i].tolist(),
+                                 [flop.suits.count(suit) for suit in "shdc"])
+                self.assertEqual(paired[i], flop.paired_board())
+            if size == 3:
+                types = flop_types(boards)
+                self.assertEqual(types.tolist(), [Flop(board).type for board in boards])
+            else:
+                self.assertRaises(AssertionError, flop_types, boards)
+        self.assertEqual(flop_paired([_ints(["Kd", "Kc", "7h", "2s"])]).tolist(), [True])
+
+
+if __name__ == "__main__":
+    main()
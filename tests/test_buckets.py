@@ -0,0 +1,111 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+import os
+import tempfile
+
+from treys.isomorphism import class_cards, class_index
+
+try:
+    import numpy as np
+    from treys import buckets
+    from treys.corpus import make_records, open_corpus
+except ImportError:
+    np = None
+
+
+@skipIf(np is None, "numpy is not installed")
+class BucketTests(TestCase):
+    """Test the flop bucket database generator."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "buckets")
+
+    def tearDown(self):
+        os.remove(self.path)
+        os.rmdir(self.dir)
+
+    def test_generate(self):
+        progress = []
+        count = buckets.generate(self.path, processes=2, chunk_size=64, count=300,
+                                 progress=lambda done, chunks: progress.append(done))
+        self.assertEqual(count, 300)
+        self.assertEqual(sorted(progress), [1, 2, 3, 4, 5])
+        self.assertFalse(os.path.exists(self.path + ".parts"))
+
+        records = open_corpus(self.path)
+        self.assertEqual(len(records), 300)
+        for index in [0, 63, 64, 299]:
+            (cards, board) = class_cards(index, 3)
+            self.assertEqual(class_index(cards, board), index)
+            self.assertEqual(records[index].tobytes(),
+                             make_records([(cards, board)])[0].tobytes())
+
+    def _interrupted_run(self, **options):
+        """Run generate, stopping it after its first chunk."""
+        def stop(done, chunks):
+            raise KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            buckets.generate(self.path, processes=1, progress=stop, **options)
+
+    def test_resume(self):
+        work_dir = self.path + ".parts"
+        self._interrupted_run(chunk_size=10, count=20)
+        first = os.path.join(work_dir, "chunk-000000.npy")
+        done = np.load(first)
+        done["rank"] = 1
+        np.save(first, done)
+
+        buckets.generate(self.path, processes=1, chunk_size=10, count=20)
+        records = open_corpus(self.path)
+        self.assertTrue((records["rank"][:10] == 1).all())
+        self.assertFalse((records["rank"][10:] == 1).any())
+        self.assertFalse(os.path.exists(work_dir))
+
+    def test_other_run_chunks(self):
+        work_dir = self.path + ".parts"
+        self._interrupted_run(chunk_size=30, count=100)
+        with self.assertRaises(ValueError):
+            buckets.generate(self.path, processes=1, chunk_size=50, count=100)
+        for name in os.listdir(work_dir):
+            os.remove(os.path.join(work_dir, name))
+
+        np.save(os.path.join(work_dir, "chunk-000000.npy"),
+                make_records([class_cards(index, 3) for index in range(30)]))
+        with self.assertRaises(ValueError):
+            buckets.generate(self.path, processes=1, chunk_size=50, count=100)
+        os.remove(os.path.join(work_dir, "chunk-000000.npy"))
+        os.rmdir(work_dir)
+
+        buckets.generate(self.path, processes=1, chunk_size=50, count=100)
+        self.assertEqual(len(open_corpus(self.path)), 100)
+
+    def test_short_chunk(self):
+        self._interrupted_run(chunk_size=10, count=20)
+        first = os.path.join(self.path + ".parts", "chunk-000000.npy")
+        np.save(first, np.load(first)[:8])
+        with self.assertRaises(ValueError):
+            buckets.generate(self.path, processes=1, chunk_size=10, count=20)
+        for name in os.listdir(self.path + ".parts"):
+            os.remove(os.path.join(self.path + ".parts", name))
+        os.rmdir(self.path + ".parts")
+
+    def test_own_work_dir(self):
+        work_dir = os.path.join(self.dir, "work")
+        os.makedirs(work_dir)
+        keep = os.path.join(work_dir, "keep-me.txt")
+        with open(keep, "w") as f:
+            f.write("mine")
+
+        buckets.generate(self.path, processes=1, chunk_size=10, count=20,
+                         work_dir=work_dir)
+        self.assertEqual(os.listdir(work_dir), ["keep-me.txt"])
+        os.remove(keep)
+        os.rmdir(work_dir)
+
+
+if __name__ == '__main__':
+    main()
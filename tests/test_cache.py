@@ -0,0 +1,81 @@
+from unittest import \
+    TestCase, \
+    main
+
+import gc
+from weakref import ref
+
+from treys.cache import ClassificationCache, classification_cache
+from treys.hand import Hand
+from deuces import Evaluator
+
+
+class _CustomEvaluator(Evaluator):
+    """An evaluator of its own type, not sharing cache entries."""
+
+
+class ClassificationCacheTests(TestCase):
+    """Test the bounded classification cache."""
+
+    def test_eviction(self):
+        cache = ClassificationCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_statistics(self):
+        cache = ClassificationCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+        self.assertEqual(tuple(cache.info()), (1, 1, 4096, 1))
+        cache.clear()
+        self.assertEqual(tuple(cache.info()), (0, 0, 4096, 0))
+
+    def test_resize(self):
+        cache = ClassificationCache(maxsize=None)
+        for i in range(10):
+            cache.put(i, i)
+        cache.resize(3)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.get(9), 9)
+        cache.resize(0)
+        cache.put("a", 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_equal_hands_share_entries(self):
+        ev = Evaluator()
+        classification_cache.clear()
+        first = Hand(["7s", "5s"], ["Ac", "8s", "6s"], ev)
+        first.has_flush_draw()
+        misses = classification_cache.info().misses
+        second = Hand(["5s", "7s"], ["6s", "Ac", "8s"], ev)
+        self.assertEqual(second.has_flush_draw(), (True, True))
+        info = classification_cache.info()
+        self.assertEqual(info.misses, misses)
+        self.assertEqual(info.hits, 1)
+
+    def test_evaluator_entries(self):
+        classification_cache.clear()
+        Hand(["7s", "5s"], ["Ac", "8s", "6s"], Evaluator()).has_flush_draw()
+        Hand(["7s", "5s"], ["Ac", "8s", "6s"], Evaluator()).has_flush_draw()
+        self.assertEqual(classification_cache.info().hits, 1)
+
+        custom = _CustomEvaluator()
+        Hand(["7s", "5s"], ["Ac", "8s", "6s"], custom).has_flush_draw()
+        self.assertEqual(classification_cache.info().hits, 1)
+        self.assertEqual(len(classification_cache), 2)
+
+        alive = ref(custom)
+        del custom
+        gc.collect()
+        self.assertIsNone(alive())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+import os
+import random
+import tempfile
+
+from treys.hand import Hand
+from deuces import Card, Deck, Evaluator
+
+try:
+    import numpy as np
+    from treys.corpus import CorpusWriter, flag_mask, make_records, \
+        open_corpus, select, write_corpus
+except ImportError:
+    np = None
+
+
+@skipIf(np is None, "numpy is not installed")
+class CorpusTests(TestCase):
+    """Test writing and mapping hand corpora."""
+
+    def setUp(self):
+        self.ev = Evaluator()
+        (fd, self.path) = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _hands(self, count, seed=16):
+        rng = random.Random(seed)
+        hands = []
+        for i in range(count):
+            deck = Deck.GetFullDeck()
+            rng.shuffle(deck)
+            hands.append((deck[:2], deck[2:5 + i % 3]))
+        return hands
+
+    def test_round_trip(self):
+        hands = self._hands(200)
+        self.assertEqual(write_corpus(self.path, hands, chunk_size=64,
+                                      evaluator=self.ev), 200)
+        records = open_corpus(self.path)
+        self.assertEqual(len(records), 200)
+        for ((cards, board), record) in zip(hands, records):
+            hand = Hand(cards, board, self.ev)
+            self.assertEqual(record["cards"].tolist(), list(hand._cards))
+            size = record["board_size"]
+            self.assertEqual(record["board"][:size].tolist(), list(hand._board._cards))
+            self.assertEqual(record["rank"], hand.rank)
+            self.assertEqual(record["rank_class"], hand.rank_class)
+            for (bit, flag) in enumerate(Hand.FLAGS):
+                self.assertEqual(bool(int(record["flags"]) >> bit & 1),
+                                 bool(any(flag(hand)) if isinstance(flag(hand), tuple)
+                                      else flag(hand)))
+            if size == 3:
+                self.assertEqual([Card.int_to_str(c) for c in record["hdsc"]],
+                                 hand.to_hdsc())
+            else:
+                self.assertEqual(record["hdsc"].tolist(), [0, 0])
+
+    def test_select(self):
+        records = make_records(self._hands(300), self.ev)
+        pairs = select(records, Hand.is_one_pair)
+        self.assertTrue(len(pairs))
+        self.assertTrue((pairs["rank_class"] == 8).all())
+        self.assertEqual(len(select(records, "is_one_pair", "is_flush")), 0)
+        self.assertEqual(flag_mask("is_straight_flush", "is_quads"), 3)
+
+    def test_incremental_writes(self):
+        hands = self._hands(20)
+        with CorpusWriter(self.path, self.ev) as writer:
+            writer.write(hands[:5])
+            writer.write(hands[5:])
+        self.assertEqual(len(open_corpus(self.path)), 20)
+
+    def test_bad_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a corpus, really not")
+        with self.assertRaises(ValueError):
+            open_corpus(self.path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+from unittest import \
+    TestCase, \
+    main
+
+from treys import deck
+from treys.hand import Hand
+from treys.outs import outs_masks
+from deuces import Card, Deck, Evaluator
+
+
+class DeckMaskTests(TestCase):
+    """Test the 52-bit deck masks."""
+
+    def test_full_deck(self):
+        self.assertEqual(deck.mask_cards(deck.FULL_DECK), Deck.GetFullDeck())
+        self.assertEqual(deck.count(deck.FULL_DECK), 52)
+
+    def test_card_mask(self):
+        mask = deck.card_mask(["2s", "Ac"])
+        self.assertEqual(mask, 1 | (1 << 51))
+        self.assertEqual(deck.mask_cards(mask), [Card.new("2s"), Card.new("Ac")])
+        self.assertTrue(deck.contains(mask, Card.new("Ac")))
+        self.assertFalse(deck.contains(mask, Card.new("Ad")))
+        self.assertRaises(TypeError, deck.card_mask, mask)
+
+    def test_remaining(self):
+        remaining = deck.remaining_cards(["Ks", "Jd"], ["Js", "Qs", "2h"], ["Ts"])
+        self.assertEqual(len(remaining), 46)
+        self.assertNotIn(Card.new("Ts"), remaining)
+        self.assertEqual(
+            deck.remaining_cards(["Ks", "Jd"], dead_mask=deck.card_mask(["Ts"])),
+            deck.remaining_cards(["Ks", "Jd"], ["Ts"]))
+
+    def test_rest_of_the_deck_with_dead_cards(self):
+        hand = Hand(["7s", "5s"], ["Ac", "8s", "6s"], Evaluator())
+        self.assertEqual(len(hand.rest_of_the_deck()), 47)
+        self.assertEqual(len(hand.rest_of_the_deck(["4s", "9d"])), 45)
+        self.assertEqual(len(hand.rest_of_the_deck([Card.new("Ts")])), 46)
+        self.assertEqual(len(hand.rest_of_the_deck(dead_mask=1)), 46)
+        self.assertRaises(TypeError, hand.rest_of_the_deck, Card.new("Ts"))
+
+    def test_outs_with_dead_cards(self):
+        hand = Hand(["7s", "5s"], ["Ac", "8s", "6s"], Evaluator())
+        self.assertEqual(hand.outs_to(Hand.is_straight_flush), 2)
+        self.assertEqual(hand.outs_to(Hand.is_straight_flush, ["4s"]), 1)
+        self.assertEqual(hand.outs_to(Hand.is_straight, ["4d", "4c", "4h"]), 3)
+        four_of_spades = deck.card_mask(["4s"])
+        self.assertEqual(
+            hand.outs_to(Hand.is_straight_flush, dead_mask=four_of_spades), 1)
+        self.assertEqual(
+            hand.outs_by_class(["9s"], dead_mask=four_of_spades)[1], 0)
+        self.assertRaises(TypeError, hand.outs_to, Hand.is_straight_flush,
+                          Card.new("4s"))
+
+    def test_outs_masks(self):
+        cards = [Card.new("7s"), Card.new("5s")]
+        board = [Card.new("Ac"), Card.new("8s"), Card.new("6s")]
+        masks = outs_masks(cards, board, Evaluator())
+        self.assertEqual(masks[1], deck.card_mask(["4s", "9s"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+from unittest import \
+    TestCase, \
+    main
+
+from treys.draws import STRAIGHTS, completion_table, flush_suits, \
+    has_straight, rank_mask, straight_draws
+from deuces import Card
+
+
+def _ints(strs):
+    return [Card.new(card_str) for card_str in strs]
+
+
+class DrawMaskTests(TestCase):
+    """Test the mask-based straight and flush draw analysis."""
+
+    def test_completion_table(self):
+        table = completion_table()
+        for mask in range(1 << 13):
+            completions = 0
+            for rank in range(13):
+                bit = 1 << rank
+                if not mask & bit and any(run & bit and (mask | bit) & run == run
+                                          for run in STRAIGHTS):
+                    completions |= bit
+            self.assertEqual(table[mask], completions)
+
+    def test_straight_draws(self):
+        def draw(cards, board):
+            return straight_draws(_ints(cards), _ints(board))
+
+        open_ended = draw(["7s", "5s"], ["Ac", "8d", "6s"])
+        self.assertTrue(open_ended.open_ended)
+        self.assertEqual(open_ended.completions, rank_mask(_ints(["4c", "9c"])))
+        self.assertTrue(draw(["2c", "3d"], ["4s", "5h", "Kd"]).open_ended)
+        self.assertTrue(draw(["9c", "8d"], ["7d", "5c", "2s"]).gutshot)
+        self.assertTrue(draw(["9c", "7d"], ["6d", "5c", "3s"]).double_gutter)
+        self.assertTrue(draw(["Kd", "Qd"], ["Js", "Ah", "2c"]).gutshot)
+        self.assertTrue(draw(["Ac", "Kd"], ["Qs", "8c", "2d"]).backdoor)
+        nothing = draw(["Ac", "Kd"], ["7s", "8c", "2d"])
+        self.assertEqual(nothing, (0, False, False, False, False))
+        self.assertTrue(has_straight(rank_mask(_ints(["Ac", "2d", "3s", "4h", "5c"]))))
+
+    def test_draws_by_street(self):
+        def draw(cards, board):
+            return straight_draws(_ints(cards), _ints(board))
+
+        self.assertFalse(draw(["Ac", "Kd"], ["Qs", "8c", "2d", "3h"]).backdoor)
+        self.assertTrue(draw(["9c", "8d"], ["7d", "6c", "2s", "Kh"]).open_ended)
+        self.assertEqual(draw(["9c", "8d"], ["7d", "6c", "2s", "Kh", "3d"]),
+                         (0, False, False, False, False))
+
+    def test_flush_suits(self):
+        spades = Card.CHAR_SUIT_TO_INT_SUIT["s"]
+        self.assertEqual(flush_suits(_ints(["As", "9d"]), _ints(["9s", "3s", "7s"]), 4),
+                         [spades])
+        self.assertEqual(flush_suits(_ints(["Ad", "9d"]), _ints(["9s", "3s", "7s"]), 3),
+                         [])
+        self.assertEqual(flush_suits(_ints(["Ad", "9s"]), _ints(["9h", "3s", "7s"]), 3),
+                         [spades])
+        turn = _ints(["9h", "3s", "7s", "Kc"])
+        self.assertEqual(flush_suits(_ints(["Ad", "9s"]), turn, 3), [])
+        self.assertEqual(flush_suits(_ints(["As", "9s"]), turn, 4), [spades])
+        river = _ints(["Kc", "Tc", "3s", "7h", "2d"])
+        self.assertEqual(flush_suits(_ints(["Ac", "9c"]), river, 4), [])
+        self.assertEqual(flush_suits(_ints(["Ac", "9c"]), river[:4] + _ints(["2c"]), 5),
+                         [Card.CHAR_SUIT_TO_INT_SUIT["c"]])
+
+
+if __name__ == '__main__':
+    main()
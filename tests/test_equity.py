@@ -0,0 +1,88 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+from treys.cards import INDEX_TO_CARD
+from deuces import Card, Evaluator
+
+try:
+    import numpy as np
+    from treys.equity import equity
+except ImportError:
+    np = None
+
+
+def _ints(strs):
+    return [Card.new(card_str) for card_str in strs]
+
+
+@skipIf(np is None, "numpy is not installed")
+class EquityTests(TestCase):
+    """Test the equity calculator."""
+
+    def setUp(self):
+        self.ev = Evaluator()
+
+    def test_exhaustive_turn(self):
+        hero = _ints(["As", "Kd"])
+        villain = _ints(["Qh", "Qs"])
+        board = _ints(["2c", "7d", "Ks", "Qc"])
+        result = equity(hero, [villain], board)
+        self.assertTrue(result.exhaustive)
+        self.assertEqual(result.trials, 44)
+        wins = 0
+        for card in INDEX_TO_CARD:
+            if card in hero + villain + board:
+                continue
+            if self.ev.evaluate(hero, board + [card]) < \
+                    self.ev.evaluate(villain, board + [card]):
+                wins += 1
+        self.assertAlmostEqual(result.equity, wins / 44.0)
+
+    def test_river_tie(self):
+        result = equity(["As", "2d"], [["Ac", "3d"]], ["Kh", "Kd", "Qs", "Qc", "Jh"])
+        self.assertEqual(result.trials, 1)
+        self.assertEqual(result.equity, 0.5)
+        self.assertEqual(result.tie, 1.0)
+
+    def test_dead_cards(self):
+        board = ["2c", "7d", "9h", "Ts"]
+        live = equity(["Jh", "Js"], [["Ac", "Ad"]], board)
+        dead = equity(["Jh", "Js"], [["Ac", "Ad"]], board, dead=["Jc", "Jd"])
+        self.assertEqual(live.trials, 44)
+        self.assertEqual(dead.trials, 42)
+        self.assertLess(dead.equity, live.equity)
+
+    def test_monte_carlo(self):
+        first = equity(["As", "Ah"], [["Ks", "Kh"]], trials=20000, seed=3)
+        second = equity(["As", "Ah"], [["Ks", "Kh"]], trials=20000, seed=3)
+        self.assertFalse(first.exhaustive)
+        self.assertEqual(first, second)
+        (low, high) = first.interval
+        self.assertLess(low, 0.8236)
+        self.assertGreater(high, 0.8236)
+
+    def test_ranges(self):
+        villains = [["Ks", "Kh"], [["Qc", "Qd"], ["Jc", "Jd"], ["Ac", "Qd"]]]
+        result = equity(["Ad", "Ac"], villains, ["2c", "7d", "9h"])
+        self.assertTrue(result.exhaustive)
+        self.assertEqual(result.trials, 2 * 903)
+        self.assertTrue(0.0 < result.equity < 1.0)
+
+    def test_blocked_range(self):
+        villains = [[["Ac", "Kd"], ["Ad", "Qd"]]]
+        for limit in [100000, 0]:
+            with self.assertRaises(ValueError):
+                equity(["Ad", "Ac"], villains, ["2c", "7d", "9h"],
+                       exhaustive_limit=limit, trials=100)
+            with self.assertRaises(ValueError):
+                equity(["Ad", "Ac"], [["Ks", "Kh"]], ["Ks", "7d", "9h"],
+                       exhaustive_limit=limit, trials=100)
+            with self.assertRaises(ValueError):
+                equity(["Ad", "Ac"], [["Ks", "Kh"], ["Kh", "Qs"]],
+                       exhaustive_limit=limit, trials=100)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+from unittest import \
+    TestCase, \
+    main
+
+from treys import evaluator
+from treys.hand import Hand
+from deuces import Evaluator
+
+
+class CountingEvaluator(Evaluator):
+    calls = 0
+
+    def evaluate(self, cards, board):
+        CountingEvaluator.calls += 1
+        return Evaluator.evaluate(self, cards, board)
+
+
+class SharedEvaluatorTests(TestCase):
+    """Test the process-wide evaluator."""
+
+    def tearDown(self):
+        evaluator.set_evaluator(None)
+
+    def test_shared(self):
+        self.assertIs(evaluator.get_evaluator(), evaluator.get_evaluator())
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"])
+        self.assertIs(hand.ev, evaluator.get_evaluator())
+
+    def test_warm_up(self):
+        self.assertIs(evaluator.warm_up(), evaluator.get_evaluator())
+
+    def test_swap(self):
+        custom = CountingEvaluator()
+        evaluator.set_evaluator(custom)
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"])
+        self.assertIs(hand.ev, custom)
+        # Hands are evaluated on first use, once.
+        self.assertEqual(CountingEvaluator.calls, 0)
+        hand.rank_class
+        hand.rank
+        self.assertEqual(CountingEvaluator.calls, 1)
+        evaluator.set_evaluator(None)
+        self.assertIsNot(evaluator.get_evaluator(), custom)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from unittest import \
+    TestCase, \
+    main
+
+from weakref import ref
+
+from treys.features import RULES
+from treys.hand import Hand
+from deuces import Evaluator
+
+
+class FeatureTests(TestCase):
+    """Test the flag rules and the features Hand keeps for them."""
+
+    def setUp(self):
+        self.ev = Evaluator()
+
+    def test_every_flag_has_a_rule(self):
+        self.assertEqual(set(RULES), set(flag.__name__ for flag in Hand.FLAGS))
+
+    def test_features_follow_changes(self):
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        self.assertTrue(hand.has_middle_pair())
+        hand.cards = ["Qc", "Qd"]
+        self.assertFalse(hand.has_middle_pair())
+        self.assertTrue(hand.has_top_set())
+
+    def test_features_do_not_keep_hands_alive(self):
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        for flag in Hand.FLAGS:
+            flag(hand)
+        alive = ref(hand)
+        del hand
+        self.assertIsNone(alive())
+
+
+if __name__ == "__main__":
+    main()
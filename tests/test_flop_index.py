@@ -0,0 +1,56 @@
+from unittest import \
+    TestCase, \
+    main
+
+from itertools import combinations
+
+from treys import flop_index
+from treys.cards import INDEX_TO_CARD, card_index
+from treys.flop import Flop
+from deuces import Card
+
+
+class FlopIndexTests(TestCase):
+    """Test the precomputed flop index."""
+
+    def test_numbers_are_dense(self):
+        numbers = set(flop_index.flop_number([INDEX_TO_CARD[i] for i in indices])
+                      for indices in combinations(range(52), 3))
+        self.assertEqual(numbers, set(range(flop_index.NUM_FLOPS)))
+
+    def test_canonical_classes(self):
+        canonical = set(flop_index.canonical_number(n)
+                        for n in range(flop_index.NUM_FLOPS))
+        self.assertEqual(len(canonical), flop_index.NUM_CANONICAL_FLOPS)
+        ids = set(flop_index.canonical_id(n) for n in range(flop_index.NUM_FLOPS))
+        self.assertEqual(ids, set(range(flop_index.NUM_CANONICAL_FLOPS)))
+
+    def test_permutation_maps_to_canonical(self):
+        for number in range(0, flop_index.NUM_FLOPS, 97):
+            permutation = flop_index.suit_permutation(number)
+            mapped = [INDEX_TO_CARD[(card_index(card) & ~3) | permutation[card_index(card) & 3]]
+                      for card in flop_index.flop_cards(number)]
+            self.assertEqual(flop_index.flop_number(mapped),
+                             flop_index.canonical_number(number))
+
+    def test_isomorphic_flops_share_canonical(self):
+        a = [Card.new(c) for c in ["Ks", "Kh", "2s"]]
+        b = [Card.new(c) for c in ["Kd", "2d", "Kc"]]
+        self.assertEqual(flop_index.canonical_number(flop_index.flop_number(a)),
+                         flop_index.canonical_number(flop_index.flop_number(b)))
+        self.assertEqual(Flop(a).canonical(), Flop(b).canonical())
+
+    def test_info(self):
+        info = flop_index.info([Card.new(c) for c in ["2h", "3h", "4h"]])
+        self.assertEqual(info.type, 6)
+        self.assertTrue(info.monotone)
+        self.assertFalse(info.paired)
+
+        info = flop_index.info([Card.new(c) for c in ["Qh", "Qs", "Kh"]])
+        self.assertEqual(info.type, 3)
+        self.assertTrue(info.paired)
+        self.assertFalse(info.monotone)
+
+
+if __name__ == "__main__":
+    main()
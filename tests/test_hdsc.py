@@ -0,0 +1,70 @@
+from unittest import \
+    TestCase, \
+    main
+
+import os
+import tempfile
+
+from treys import flop_index, hdsc
+from treys.hand import Hand
+from deuces import Evaluator
+
+
+class HDSCTableTests(TestCase):
+    """Test the precomputed HDSC table."""
+
+    _hands = [
+        (["Qc", "Qs"], ["2c", "3c", "8c"]),
+        (["2d", "Qd"], ["2c", "3d", "8h"]),
+        (["Qs", "Qd"], ["2c", "2d", "8d"]),
+        (["As", "Qd"], ["2c", "2h", "8d"]),
+        (["Td", "As"], ["2c", "9d", "Ad"]),
+        (["3h", "4h"], ["2c", "9d", "Ah"]),
+        (["3c", "Ts"], ["2c", "Tc", "Td"]),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev = Evaluator()
+        cls.hands = [Hand(cards, board, cls.ev) for (cards, board) in cls._hands]
+        ids = set(flop_index.canonical_id(flop_index.flop_number(hand._board._cards))
+                  for hand in cls.hands)
+        (fd, cls.path) = tempfile.mkstemp()
+        os.close(fd)
+        hdsc.generate(cls.path, processes=2, canonical_ids=ids)
+
+    @classmethod
+    def tearDownClass(cls):
+        hdsc.unload_table()
+        os.remove(cls.path)
+
+    def test_lookup_matches_transform(self):
+        table = hdsc.load_table(self.path)
+        for hand in self.hands:
+            self.assertEqual(table.lookup(hand._cards, hand._board._cards),
+                             hand.to_hdsc(use_table=False))
+        hdsc.unload_table()
+
+    def test_isomorphic_hand(self):
+        table = hdsc.load_table(self.path)
+        hand = Hand(["Qd", "Qh"], ["2d", "3d", "8d"], self.ev)
+        self.assertEqual(table.lookup(hand._cards, hand._board._cards), ["Qh", "Qc"])
+        self.assertEqual(hand.to_hdsc(), ["Qh", "Qc"])
+        hdsc.unload_table()
+
+    def test_missing_rows_fall_back(self):
+        hdsc.load_table(self.path)
+        hand = Hand(["As", "Kh"], ["Kd", "Tc", "2c"], self.ev)
+        self.assertEqual(hand.to_hdsc(), hand.to_hdsc(use_table=False))
+        hdsc.unload_table()
+        self.assertIsNone(hdsc.active_table())
+
+    def test_rejects_other_files(self):
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b"not a table at all")
+            f.flush()
+            self.assertRaises(ValueError, hdsc.HDSCTable, f.name)
+
+
+if __name__ == "__main__":
+    main()
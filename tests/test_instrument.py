@@ -0,0 +1,63 @@
+from unittest import \
+    TestCase, \
+    main
+
+from treys import instrument
+from treys.cache import classification_cache
+from treys.hand import Hand
+from deuces import Evaluator
+
+
+class InstrumentTests(TestCase):
+    """Test the opt-in profiling of Hand."""
+
+    def setUp(self):
+        self.ev = Evaluator()
+        classification_cache.clear()
+        instrument.reset()
+
+    def tearDown(self):
+        instrument.disable()
+
+    def test_disabled_costs_nothing(self):
+        originals = dict(vars(Hand))
+        flags = list(Hand.FLAGS)
+        with instrument.profiling():
+            self.assertTrue(instrument.is_enabled())
+            self.assertIsNot(Hand.has_flush_draw, originals["has_flush_draw"])
+        self.assertFalse(instrument.is_enabled())
+        self.assertEqual(dict(vars(Hand)), originals)
+        self.assertEqual(Hand.FLAGS, flags)
+        self.assertNotIn("get", vars(classification_cache))
+
+    def test_counts(self):
+        with instrument.profiling():
+            hand = Hand(["Ks", "Td"], ["Js", "Qs", "2h"], self.ev)
+            for flag in Hand.FLAGS:
+                flag(hand)
+            hand.has_flush_draw()
+            self.assertEqual(hand.outs_to(Hand.is_straight), 8)
+            hand.outs_to(Hand.is_set)
+        stats = instrument.statistics()
+        self.assertEqual(stats["methods"]["__init__"]["calls"], 1)
+        self.assertGreater(stats["methods"]["has_flush_draw"]["calls"], 2)
+        self.assertGreater(stats["methods"]["has_top_pair"]["seconds"], 0)
+        self.assertEqual(stats["outs_to_sub_hands"], 47)
+        self.assertEqual(stats["cache"]["has_flush_draw"]["misses"], 1)
+        self.assertGreater(stats["cache"]["has_flush_draw"]["hit_rate"], 0.5)
+
+        # Nothing is counted any more.
+        Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev).has_top_pair()
+        self.assertEqual(instrument.statistics(), stats)
+
+    def test_prometheus(self):
+        with instrument.profiling():
+            Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev).has_flush_draw()
+        text = instrument.prometheus()
+        self.assertIn('treys_method_calls_total{method="has_flush_draw"} 1\n', text)
+        self.assertIn("# TYPE treys_outs_to_sub_hands_total counter\n", text)
+        self.assertIn('treys_cache_misses_total{method="has_flush_draw"} 1\n', text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+from unittest import \
+    TestCase, \
+    main
+
+import random
+from itertools import combinations
+
+from treys.cards import COMBO_CARDS, permute_suits
+from treys.flop_index import SUIT_PERMUTATIONS
+from treys.isomorphism import canonicalize, class_cards, class_index, \
+    num_classes
+from deuces import Card, Deck
+
+
+class IsomorphismTests(TestCase):
+    """Test canonical forms and class indices of hands and boards."""
+
+    def test_class_counts(self):
+        self.assertEqual(num_classes(0), 169)
+        self.assertEqual(num_classes(3), 1286792)
+        self.assertEqual(num_classes(4), 55190538)
+        self.assertEqual(num_classes(5), 2428287420)
+
+    def test_preflop_classes(self):
+        indices = set(class_index(cards, []) for cards in COMBO_CARDS)
+        self.assertEqual(indices, set(range(169)))
+
+    def test_flop_classes_of_a_board_are_dense(self):
+        board = [Card.new(card) for card in ["As", "Kd", "2s"]]
+        indices = set()
+        for cards in combinations(Deck.GetFullDeck(), 2):
+            if not set(cards) & set(board):
+                index = class_index(cards, board)
+                self.assertTrue(0 <= index < num_classes(3))
+                indices.add(index)
+        # Hearts and clubs are not on the board: swapping them maps combos
+        # onto one another.
+        self.assertLess(len(indices), 1176)
+
+    def test_invariance_and_round_trip(self):
+        rng = random.Random(19)
+        for board_size in [0, 3, 4, 5]:
+            for _ in range(200):
+                deck = Deck.GetFullDeck()
+                rng.shuffle(deck)
+                (cards, board) = (deck[:2], deck[2:2 + board_size])
+                index = class_index(cards, board)
+                permutation = rng.choice(SUIT_PERMUTATIONS)
+                self.assertEqual(
+                    class_index([permute_suits(c, permutation) for c in cards],
+                                [permute_suits(c, permutation) for c in board]),
+                    index)
+
+                (new_cards, new_board, p) = canonicalize(cards, board)
+                self.assertEqual(class_cards(index, board_size),
+                                 (new_cards, new_board))
+                self.assertEqual(class_index(new_cards, new_board), index)
+                self.assertEqual(sorted(permute_suits(c, p) for c in cards),
+                                 list(new_cards))
+
+    def test_turn_and_river_are_told_apart(self):
+        flop = ["Ah", "Kh", "2c"]
+        self.assertNotEqual(class_index(["5s", "6s"], flop + ["7h", "8d"]),
+                            class_index(["5s", "6s"], flop + ["8d", "7h"]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+from unittest import \
+    TestCase, \
+    main
+
+from treys.hand import Hand
+from treys.outs import outs_by_class, rank_to_class
+from deuces import Card, Evaluator
+
+
+class OutsTests(TestCase):
+    """Test the outs enumeration."""
+
+    _hands = [
+        {"cards": ["7s", "5s"], "board": ["Ac", "8s", "6s"]},
+        {"cards": ["9c", "8d"], "board": ["7d", "5c", "2s"]},
+        {"cards": ["Qh", "Qs"], "board": ["2s", "3c", "8d"]},
+        {"cards": ["As", "Kh"], "board": ["Kd", "Tc", "2c", "7h"]},
+    ]
+
+    def setUp(self):
+        self.ev = Evaluator()
+
+    def test_rank_to_class(self):
+        for rank in [1, 10, 11, 166, 167, 1600, 1609, 3325, 6186, 7462]:
+            self.assertEqual(rank_to_class(rank), self.ev.get_rank_class(rank))
+
+    def test_counts_cover_the_deck(self):
+        hand = Hand(**self._hands[0], evaluator=self.ev)
+        self.assertEqual(sum(hand.outs_by_class()), 47)
+        turn = Hand(**self._hands[3], evaluator=self.ev)
+        self.assertEqual(sum(turn.outs_by_class()), 46)
+
+    def test_open_ender(self):
+        cards = [Card.new(c) for c in ["9c", "8d"]]
+        board = [Card.new(c) for c in ["7d", "6c", "2s"]]
+        self.assertEqual(outs_by_class(cards, board, self.ev)[5], 8)
+
+    def test_matches_building_hands(self):
+        for hand_dict in self._hands:
+            hand = Hand(evaluator=self.ev, **hand_dict)
+            for flag in [Hand.is_straight_flush, Hand.is_flush,
+                         Hand.is_straight, Hand.is_two_pair, Hand.is_one_pair]:
+                expected = 0
+                for card in hand.rest_of_the_deck():
+                    new_hand = Hand(hand._cards, hand._board._cards + (card,), self.ev)
+                    if flag(new_hand):
+                        expected += 1
+                self.assertEqual(hand.outs_to(flag), expected)
+
+
+if __name__ == "__main__":
+    main()
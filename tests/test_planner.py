@@ -0,0 +1,61 @@
+from unittest import \
+    TestCase, \
+    main
+
+import random
+
+from treys.hand import Hand
+from treys.planner import FlagPlan, evaluate_flags
+from deuces import Deck, Evaluator
+
+
+class PlannerTests(TestCase):
+    """Test that planned flags match the Hand predicates."""
+
+    def setUp(self):
+        self.ev = Evaluator()
+
+    def test_matches_predicates(self):
+        rng = random.Random(14)
+        plan = FlagPlan()
+        for board_size in [3, 4, 5]:
+            for _ in range(150):
+                deck = Deck.GetFullDeck()
+                rng.shuffle(deck)
+                hand = Hand(deck[:2], deck[2:2 + board_size], self.ev)
+                results = plan.evaluate(hand)
+                for flag in Hand.FLAGS:
+                    self.assertEqual(results[flag.__name__], flag(hand),
+                                     "%s: %s" % (hand, flag.__name__))
+
+    def test_matches_predicates_on_special_boards(self):
+        hands = [
+            (["Ks", "Jd"], ["Js", "Qs", "2h"]),
+            (["8c", "8d"], ["Ad", "Ac", "Ks"]),
+            (["8c", "8d"], ["8s", "8h", "2s"]),
+            (["4s", "5s"], ["6s", "7d", "Kh"]),
+            (["As", "Ks"], ["2s", "7s", "Th", "3s"]),
+        ]
+        plan = FlagPlan()
+        for (cards, board) in hands:
+            hand = Hand(cards, board, self.ev)
+            results = plan.evaluate(hand)
+            self.assertEqual(results,
+                             {flag.__name__: flag(hand) for flag in Hand.FLAGS})
+
+    def test_selection(self):
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        results = evaluate_flags(hand, [Hand.has_backdoor_flush, "has_middle_pair"])
+        self.assertEqual(list(results), ["has_backdoor_flush", "has_middle_pair"])
+        self.assertEqual(results["has_backdoor_flush"], (True, False))
+        self.assertTrue(results["has_middle_pair"])
+        self.assertEqual(FlagPlan(["is_one_pair"]).evaluate_cards(
+            ["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev), {"is_one_pair": True})
+
+    def test_unknown_flag(self):
+        with self.assertRaises(KeyError):
+            FlagPlan(["has_nothing"])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+from unittest import \
+    TestCase, \
+    main
+
+import gc
+
+from treys.hand import Hand
+from treys.flop import Flop
+from treys.pool import clear_pools, intern_flop, intern_hand, pool_sizes
+from deuces import Card, Evaluator
+
+
+class PoolTests(TestCase):
+    """Test Hand and Flop interning."""
+
+    def setUp(self):
+        self.ev = Evaluator()
+        clear_pools()
+
+    def test_equal_inputs_share_objects(self):
+        hand = intern_hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        same = intern_hand([Card.new("Jd"), Card.new("Ks")],
+                           ["2h", "Qs", "Js"], self.ev)
+        self.assertIs(hand, same)
+        self.assertIs(hand._board, intern_flop(["Qs", "2h", "Js"]))
+        self.assertIsNot(hand, intern_hand(["Ks", "Jd"], ["Js", "Qs", "2h"],
+                                           Evaluator()))
+
+    def test_unused_objects_are_collected(self):
+        hand = intern_hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        self.assertEqual(pool_sizes(), (1, 1))
+        del hand
+        gc.collect()
+        self.assertEqual(pool_sizes(), (0, 0))
+
+    def test_shared_objects_are_frozen(self):
+        hand = intern_hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        with self.assertRaises(AttributeError):
+            hand.cards = ["Ac", "2c"]
+        with self.assertRaises(AttributeError):
+            hand.board = ["Ac", "2c", "3c"]
+        with self.assertRaises(AttributeError):
+            intern_flop(["Js", "Qs", "2h"]).cards = ["Ac", "2c", "3c"]
+        self.assertEqual(intern_hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev).cards,
+                         ["Jd", "Ks"])
+
+        hand = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        hand.cards = ["Ac", "2c"]
+        hands = {hand: 1}
+        with self.assertRaises(AttributeError):
+            hand.cards = ["Ks", "Jd"]
+        self.assertIn(hand, hands)
+        flop = Flop(["As", "2c", "3d"])
+        flops = {flop}
+        with self.assertRaises(AttributeError):
+            flop.cards = ["As", "2c", "4d"]
+        self.assertIn(flop, flops)
+
+    def test_hash_and_equality(self):
+        a = Hand(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        b = Hand(["Jd", "Ks"], ["2h", "Js", "Qs"], self.ev)
+        c = Hand(["Ks", "Jd"], ["Js", "Qs", "2h", "3c"], self.ev)
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+        self.assertEqual(len({a, b, c}), 2)
+        self.assertEqual({Flop(["As", "2c", "3d"]): 1}[Flop(["3d", "As", "2c"])], 1)
+        self.assertNotEqual(Flop(["As", "2c", "3d"]), "As 2c 3d")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+from unittest import \
+    TestCase, \
+    main
+
+from treys.cards import COMBO_CARDS
+from treys.hand import Hand
+from treys.preflop import CLASS_COMBOS, CLASS_LABELS, COMBO_CLASS, \
+    COMBO_PAIRED, COMBO_RANKS, COMBO_SUITED, class_combos, class_id, \
+    combo_id, label
+from deuces import Card, Evaluator
+
+
+class PreflopTests(TestCase):
+    """Test the preflop combo feature tables."""
+
+    def test_classes(self):
+        self.assertEqual(len(CLASS_LABELS), 169)
+        self.assertEqual(CLASS_LABELS[:3], ["AA", "AKs", "AQs"])
+        self.assertEqual(CLASS_LABELS[13], "AKo")
+        self.assertEqual(CLASS_LABELS[-1], "22")
+        self.assertEqual(sorted(len(combos) for combos in CLASS_COMBOS),
+                         [4] * 78 + [6] * 13 + [12] * 78)
+        self.assertEqual(len(class_combos("AKs")), 4)
+        self.assertEqual(len(class_combos("72o")), 12)
+        with self.assertRaises(ValueError):
+            class_id("27o")
+
+    def test_combos(self):
+        self.assertEqual(label(combo_id(["Ah", "Kh"])), "AKs")
+        self.assertEqual(label(combo_id(["2c", "7d"])), "72o")
+        with self.assertRaises(ValueError):
+            combo_id(["As", "As"])
+        self.assertEqual(label(combo_id(["Td", "Ts"])), "TT")
+        for (combo, cards) in enumerate(COMBO_CARDS):
+            self.assertEqual(combo_id(cards), combo)
+            self.assertEqual(combo_id(reversed(cards)), combo)
+            self.assertIn(combo, CLASS_COMBOS[COMBO_CLASS[combo]])
+            self.assertEqual(COMBO_RANKS[combo], sorted(map(Card.get_rank_int, cards)))
+            self.assertEqual(COMBO_PAIRED[combo],
+                             Card.get_rank_int(cards[0]) == Card.get_rank_int(cards[1]))
+            self.assertEqual(COMBO_SUITED[combo],
+                             Card.get_suit_int(cards[0]) == Card.get_suit_int(cards[1]))
+
+    def test_hand_uses_the_table(self):
+        ev = Evaluator()
+        hand = Hand(["Kh", "Ah"], ["2c", "3d", "4s"], ev)
+        self.assertTrue(hand.hand_is_suited())
+        self.assertFalse(hand.pair_in_hand())
+        self.assertEqual(hand.ranks, [11, 12])
+        hand.ranks.append(0)
+        self.assertEqual(hand.ranks, [11, 12])
+        hand.cards = ["Ts", "Td"]
+        self.assertTrue(hand.pair_in_hand())
+        self.assertFalse(hand.hand_is_suited())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+from treys.hand import Hand
+from deuces import Evaluator
+
+try:
+    import numpy
+    from treys.range_analysis import analyze_range, analyze_ranges, frequencies, \
+        make_pool, unblocked_combos
+except ImportError:
+    numpy = None
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class RangeAnalysisTests(TestCase):
+    """Test the range-vs-board classification."""
+
+    _board = ["Js", "Qs", "2h"]
+
+    def test_blocked_combos(self):
+        self.assertEqual(len(unblocked_combos(self._board)), 1176)
+        combos = [["As", "Ks"], ["Js", "Jd"], ["2h", "3h"]]
+        self.assertEqual(len(unblocked_combos(self._board, combos)), 1)
+
+    def test_counts_match_hands(self):
+        ev = Evaluator()
+        combos = [["As", "Ks"], ["Ah", "Kh"], ["Jd", "Td"], ["Qd", "Qh"],
+                  ["Js", "Jd"], ["8c", "9c"], ["Kd", "Jc"]]
+        flags = [Hand.has_top_pair, Hand.is_set, Hand.has_flush_draw,
+                 Hand.has_straight_draw, Hand.has_gutshot_straight_draw]
+        breakdown = analyze_range(self._board, combos, flags, workers=1)
+        self.assertEqual(breakdown.combos, 6)
+        hands = [Hand(combo, self._board, ev) for combo in combos if combo[0] != "Js"]
+        for flag in flags:
+            expected = 0
+            for hand in hands:
+                result = flag(hand)
+                if isinstance(result, tuple):
+                    result = any(result)
+                expected += result
+            self.assertEqual(breakdown.counts[flag.__name__], expected)
+
+    def test_process_pool(self):
+        flags = ["is_one_pair", "has_flush_draw", "has_gutshot_straight_draw"]
+        single = analyze_range(self._board, flags=flags, workers=1)
+        with make_pool(2) as pool:
+            pooled = analyze_range(self._board, flags=flags, executor=pool)
+            again = analyze_range(["2c", "7d", "9h"], flags=flags, executor=pool)
+        self.assertEqual(single, pooled)
+        self.assertEqual(single, analyze_range(self._board, flags=flags, workers=2))
+        self.assertEqual(again, analyze_range(["2c", "7d", "9h"], flags=flags))
+        self.assertEqual(single.combos, 1176)
+        self.assertAlmostEqual(frequencies(single)["is_one_pair"],
+                               single.counts["is_one_pair"] / 1176.0)
+
+    def test_many_boards(self):
+        boards = [self._board, ["2c", "7d", "9h", "Ts"], ["Ah", "Kh", "5c"]]
+        combos = [["As", "Ks"], ["Js", "Td"], ["9c", "8c"]]
+        jobs = [(board, combos) for board in boards] + [(self._board, None)]
+        breakdowns = analyze_ranges(jobs, workers=1)
+        self.assertEqual(breakdowns,
+                         [analyze_range(board, combos) for (board, combos) in jobs])
+        self.assertEqual([b.combos for b in breakdowns], [2, 3, 3, 1176])
+
+
+if __name__ == "__main__":
+    main()
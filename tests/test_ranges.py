@@ -0,0 +1,71 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+from treys.hand import Hand
+from treys.preflop import combo_id, label
+from deuces import Evaluator
+
+try:
+    import numpy as np
+    from treys.ranges import Range
+except ImportError:
+    np = None
+
+
+def _labels(r):
+    return sorted(set(label(combo) for (combo, _) in r.combos()))
+
+
+@skipIf(np is None, "numpy is not installed")
+class RangeTests(TestCase):
+    """Test weighted ranges."""
+
+    def test_notation(self):
+        self.assertEqual(Range.parse("AA").combo_count(), 6)
+        self.assertEqual(Range.parse("AK").combo_count(), 16)
+        self.assertEqual(_labels(Range.parse("TT+")), ["AA", "JJ", "KK", "QQ", "TT"])
+        self.assertEqual(_labels(Range.parse("A5s-A2s")), ["A2s", "A3s", "A4s", "A5s"])
+        self.assertEqual(_labels(Range.parse("77-TT")), ["77", "88", "99", "TT"])
+        self.assertEqual(_labels(Range.parse("KTo+")), ["KJo", "KQo", "KTo"])
+        self.assertEqual(_labels(Range.parse("KAs")), ["AKs"])
+        self.assertEqual(Range.parse("AhKh").combos(), [(combo_id(["Ah", "Kh"]), 1.0)])
+        r = Range.parse("QQ+, AKs:0.5, AKo:0.25")
+        self.assertEqual(r.combo_count(), 18 + 4 + 12)
+        self.assertEqual(r.total(), 18 + 2 + 3)
+        for bad in ["AKx", "A", "AAs", "AKs-QJs", "TT-AKs", "AK:x", "Zh2c", "AsAs"]:
+            with self.assertRaises(ValueError):
+                Range.parse(bad)
+
+    def test_set_operations(self):
+        a = Range.parse("TT+")
+        b = Range.parse("JJ-88:0.5")
+        self.assertEqual((a | b).combo_count(), 7 * 6)
+        self.assertEqual((a & b).total(), 2 * 6 * 0.5)
+        self.assertEqual(_labels(a - b), ["AA", "KK", "QQ"])
+        self.assertAlmostEqual(b.normalized().total(), 1.0)
+        with self.assertRaises(ValueError):
+            Range().normalized()
+        self.assertEqual(Range.full().combo_count(), 1326)
+
+    def test_board_blocking(self):
+        r = Range.parse("AA, AKs").without(["As", "Kd", "2c"])
+        self.assertEqual(r.combo_count(), 3 + 2)
+        self.assertEqual(Range.full().without(["As", "Kd", "2c"]).combo_count(), 1176)
+
+    def test_flag_frequencies(self):
+        ev = Evaluator()
+        board = ["Js", "Qs", "2h"]
+        r = Range.parse("AKs, JJ:0.5, 22")
+        frequencies = r.flag_frequencies(board, [Hand.has_flush_draw, "is_set"], ev)
+        # AKs: 4 combos, one flush draw; JJ: 3 sets at 0.5; 22: 3 sets
+        total = 4 + 1.5 + 3
+        self.assertAlmostEqual(frequencies["has_flush_draw"], 1 / total)
+        self.assertAlmostEqual(frequencies["is_set"], 4.5 / total)
+        self.assertEqual(Range().flag_frequencies(board), dict.fromkeys(
+            [flag.__name__ for flag in Hand.FLAGS], 0.0))
+
+
+if __name__ == '__main__':
+    main()
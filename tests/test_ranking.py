@@ -0,0 +1,72 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+from treys.cards import INDEX_TO_CARD
+from deuces import Card, Evaluator
+
+try:
+    import numpy as np
+    from treys.ranking import card_indices, rank_hands
+except ImportError:
+    np = None
+
+
+class _RankingEvaluator(Evaluator):
+    """An evaluator of another type, asked for every hand."""
+
+    def __init__(self):
+        Evaluator.__init__(self)
+        self.calls = 0
+
+    def evaluate(self, cards, board):
+        self.calls += 1
+        return Evaluator.evaluate(self, cards, board)
+
+
+@skipIf(np is None, "numpy is not installed")
+class RankingTests(TestCase):
+    """Test the vectorized hand ranking against the evaluator."""
+
+    def setUp(self):
+        self.ev = Evaluator()
+
+    def _expected(self, indices, evaluator):
+        return [evaluator.evaluate([INDEX_TO_CARD[i] for i in row[:2]],
+                                   [INDEX_TO_CARD[i] for i in row[2:]])
+                for row in indices.tolist()]
+
+    def test_rank_hands(self):
+        rng = np.random.default_rng(7)
+        for size in [5, 6, 7]:
+            indices = np.argsort(rng.random((2000, 52)), axis=1)[:, :size]
+            self.assertEqual(rank_hands(indices, self.ev).tolist(),
+                             self._expected(indices, self.ev))
+
+    def test_flushes(self):
+        hands = [["Ah", "Kh", "Qh", "Jh", "Th", "9h", "2c"],
+                 ["2s", "3s", "4s", "5s", "As", "Ad", "Ac"],
+                 ["7d", "7c", "7h", "2h", "2s", "Th", "Jh"],
+                 ["9c", "2c", "5c", "Jc", "Kc", "Qc"],
+                 ["3d", "8d", "Td", "Qd", "Ad"]]
+        for hand in hands:
+            indices = card_indices([[Card.new(card) for card in hand]])
+            self.assertEqual(rank_hands(indices, self.ev).tolist(),
+                             self._expected(indices, self.ev))
+
+    def test_other_evaluator(self):
+        evaluator = _RankingEvaluator()
+        rng = np.random.default_rng(3)
+        indices = np.argsort(rng.random((50, 52)), axis=1)[:, :7]
+        self.assertEqual(rank_hands(indices, evaluator).tolist(),
+                         self._expected(indices, self.ev))
+        self.assertEqual(evaluator.calls, 50)
+
+    def test_card_indices(self):
+        ints = np.array(INDEX_TO_CARD).reshape(13, 4)
+        self.assertEqual(card_indices(ints).ravel().tolist(), list(range(52)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from unittest import \
+    TestCase, \
+    main, \
+    skipIf
+
+import io
+
+from treys.hand import Hand
+from deuces import Card
+
+try:
+    import numpy
+    from treys.stream import classify_lines, classify_stream, parse_line, read_hands
+except ImportError:
+    numpy = None
+
+
+_HISTORY = """# a few hands
+Ks Jd | Js Qs 2h
+AhAd 2c7d9hTs
+
+7s 5s Ac 8s 6s 4d 2d
+"""
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class StreamTests(TestCase):
+    """Test the streaming hand-history reader."""
+
+    def test_parse_line(self):
+        (cards, board) = parse_line("Ks Jd | Js Qs 2h")
+        self.assertEqual(cards, [Card.new("Ks"), Card.new("Jd")])
+        self.assertEqual(board, [Card.new("Js"), Card.new("Qs"), Card.new("2h")])
+        self.assertEqual(parse_line("AhAd|2c7d9h"), parse_line("Ah Ad 2c 7d 9h"))
+        self.assertIsNone(parse_line("  "))
+        self.assertIsNone(parse_line("# comment"))
+
+    def test_invalid_lines(self):
+        for line in ["Ks Jd Js", "Ks Jd Js Qs Xh", "Ks Ks Js Qs 2h", "Ks Jd Js Q"]:
+            self.assertRaises(ValueError, parse_line, line)
+        lines = ["Ks Jd Js Qs 2h", "oops", "Ah Ad 2c 7d 9h"]
+        self.assertRaises(ValueError, list, read_hands(lines))
+        self.assertEqual([n for (n, _, _) in read_hands(lines, skip_invalid=True)],
+                         [1, 3])
+
+    def test_chunks(self):
+        chunks = list(classify_stream(io.StringIO(_HISTORY), chunk_size=2))
+        self.assertEqual([len(chunk.hands) for chunk in chunks], [2, 1])
+        self.assertEqual([n for chunk in chunks for (n, _, _) in chunk.hands], [2, 3, 5])
+        self.assertEqual(chunks[0].flags.shape, (2, len(Hand.FLAGS)))
+
+    def test_flag_subset(self):
+        flags = [Hand.has_top_pair, "is_straight", Hand.has_straight_flush_draw]
+        results = list(classify_lines(io.StringIO(_HISTORY), flags))
+        self.assertEqual(len(results), 3)
+        (number, cards, board, values) = results[0]
+        self.assertEqual(number, 2)
+        hand = Hand(cards, board)
+        self.assertEqual(values, {"has_top_pair": hand.has_top_pair(),
+                                  "is_straight": False,
+                                  "has_straight_flush_draw": False})
+        self.assertTrue(results[2][3]["is_straight"])
+
+
+if __name__ == "__main__":
+    main()
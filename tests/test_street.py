@@ -0,0 +1,100 @@
+from unittest import \
+    TestCase, \
+    main
+
+import random
+
+from treys.hand import Hand
+from treys.street import Street
+from deuces import Card, Deck, Evaluator
+
+
+class StreetTests(TestCase):
+    """Test turn and river support and the incremental board extension."""
+
+    def setUp(self):
+        self.ev = Evaluator()
+
+    def test_deal_matches_new_hands(self):
+        rng = random.Random(12)
+        for _ in range(200):
+            deck = Deck.GetFullDeck()
+            rng.shuffle(deck)
+            hand = Hand(deck[:2], deck[2:5], self.ev)
+            for card in deck[5:7]:
+                hand = hand.deal(card)
+                fresh = Hand(hand._cards, hand._board._cards, self.ev)
+                self.assertEqual(hand.rank, fresh.rank)
+                self.assertEqual(hand.rank_class, fresh.rank_class)
+                self.assertEqual(hand.board, fresh.board)
+
+    def test_street_replay(self):
+        street = Street(["Ks", "Jd"], ["Js", "Qs", "2h"], self.ev)
+        self.assertEqual(street.name, "flop")
+        street.deal("Ts")
+        self.assertEqual(street.name, "turn")
+        self.assertEqual(street.flush_suits(4), [Card.CHAR_SUIT_TO_INT_SUIT["s"]])
+        street.deal("Ad")
+        self.assertEqual(street.name, "river")
+        self.assertEqual(street.rank_class, 5)
+        self.assertEqual(street.paired_ranks(), [9])
+        hand = street.hand()
+        self.assertEqual(hand.rank, Hand(["Ks", "Jd"], street.board, self.ev).rank)
+        self.assertRaises(AssertionError, street.deal, "3c")
+
+    def test_turn_draws(self):
+        hand = Hand(["9c", "8d"], ["7d", "5c", "2s", "Kh"], self.ev)
+        self.assertTrue(hand.has_gutshot_straight_draw())
+        hand = Hand(["9c", "8d"], ["7d", "6c", "2s", "Kh"], self.ev)
+        self.assertTrue(hand.has_straight_draw())
+        self.assertEqual(hand.outs_to(Hand.is_straight), 8)
+
+    def test_turn_backdoors(self):
+        hand = Hand(["Ks", "7d"], ["Qs", "Ts", "2c", "3h"], self.ev)
+        self.assertEqual(hand.has_backdoor_flush(), (False, False))
+        self.assertEqual(hand.has_flush_draw(), (False, False))
+
+    def test_no_draws_on_the_river(self):
+        hand = Hand(["9c", "8d"], ["7d", "6c", "2s", "Kh", "3d"], self.ev)
+        self.assertFalse(hand.has_straight_draw())
+        self.assertFalse(hand.has_gutshot_straight_draw())
+        self.assertEqual(hand.outs_to(Hand.is_straight), 0)
+        hand = Hand(["Ac", "3c"], ["Kc", "Tc", "2d", "5h", "7h"], self.ev)
+        self.assertEqual(hand.has_flush_draw(), (False, False))
+
+    def test_middle_pair_on_later_streets(self):
+        hand = Hand(["As", "9h"], ["Kd", "Tc", "9c", "2d"], self.ev)
+        self.assertTrue(hand.has_middle_pair())
+        hand = Hand(["As", "Th"], ["Kd", "Tc", "9c", "2d", "4h"], self.ev)
+        self.assertTrue(hand.has_middle_pair())
+        hand = Hand(["As", "2h"], ["Kd", "Tc", "9c", "2d"], self.ev)
+        self.assertFalse(hand.has_middle_pair())
+
+    def test_paired_turn_and_river_boards(self):
+        hand = Hand(["Qs", "Qd"], ["Ks", "Kd", "7h", "2c"], self.ev)
+        self.assertTrue(hand.paired_board())
+        self.assertTrue(hand.has_under_high_pair())
+        self.assertFalse(hand.has_under_top_pair())
+        hand = Hand(["5s", "5d"], ["3s", "3d", "Th", "Kc", "Ah"], self.ev)
+        self.assertTrue(hand.paired_board())
+        self.assertTrue(hand.has_over_low_pair())
+        hand = Hand(["As", "Kc"], ["Ad", "7h", "7d", "Kd"], self.ev)
+        self.assertFalse(hand.has_top_two_pair())
+        hand = Hand(["As", "Kc"], ["Ad", "7h", "7d", "7c"], self.ev)
+        self.assertFalse(hand.paired_board())
+
+    def test_sets_on_later_streets(self):
+        hand = Hand(["Ks", "Kc"], ["2d", "7h", "Kd", "Tc"], self.ev)
+        self.assertTrue(hand.has_top_set())
+        hand = Hand(["Ts", "Tc"], ["2d", "7h", "Td", "Kc", "3s"], self.ev)
+        self.assertTrue(hand.has_middle_set())
+        self.assertFalse(hand.has_top_set())
+
+    def test_middle_pair_on_paired_board(self):
+        hand = Hand(["As", "Qh"], ["2d", "2c", "8c"], self.ev)
+        self.assertTrue(hand.is_one_pair())
+        self.assertFalse(hand.has_middle_pair())
+
+
+if __name__ == "__main__":
+    main()
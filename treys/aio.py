@@ -0,0 +1,116 @@
+"""Classification from asyncio code, batched.
+
+Classifying a hand blocks, so a ClassificationService collects the
+hands of concurrent requests into micro-batches, closed when `max_batch`
+hands are waiting or `max_delay` seconds after the first one, and
+classifies each batch with batch.classify in an executor, off the event
+loop. Every request gets its own result back:
+
+    service = ClassificationService(flags=["has_flush_draw", "is_set"])
+    flags = await service.classify(["Ks", "Jd"], ["Js", "Qs", "2h"])
+
+`executor` can be a thread or a process pool, or None for the loop's
+default executor.
+
+Requires numpy.
+"""
+
+import asyncio
+from weakref import WeakKeyDictionary
+
+from .batch import FLAG_NAMES, classify as classify_batch, flag_column
+from .cards import card_tuple
+
+
+def _classify_rows(cards, boards, columns):
+    """Classify a batch, returning the selected flags of each hand as lists."""
+    return classify_batch(cards, boards)[:, columns].tolist()
+
+
+class ClassificationService:
+    """Classifies hands for coroutines, in micro-batches."""
+
+    def __init__(self, flags=None, max_batch=256, max_delay=0.002, executor=None):
+        """Classify `flags` (entries of Hand.FLAGS or names, all by default)."""
+        if flags is None:
+            flags = FLAG_NAMES
+        self.names = [flag if isinstance(flag, str) else flag.__name__
+                      for flag in flags]
+        self._columns = [flag_column(name) for name in self.names]
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.executor = executor
+        self._pending = []
+        self._timer = None
+
+    async def classify(self, cards, board):
+        """Return {flag name: bool} for two hole cards and a 3 to 5 card board.
+
+        Cards are strings or ints. Raises ValueError for invalid hands.
+        """
+        try:
+            cards = card_tuple(cards)
+            board = card_tuple(board)
+        except KeyError as error:
+            raise ValueError("invalid card %r" % error.args[0])
+        if len(cards) != 2 or len(board) not in [3, 4, 5] or \
+                len(set(cards + board)) != len(cards) + len(board):
+            raise ValueError("invalid hand %r on %r" % (cards, board))
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((cards, board, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+        return await future
+
+    async def classify_many(self, hands):
+        """Classify (hole cards, board) pairs; returns a list of results."""
+        return await asyncio.gather(*(self.classify(cards, board)
+                                      for (cards, board) in hands))
+
+    def flush(self):
+        """Send the waiting hands to the executor now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        (batch, self._pending) = (self._pending, [])
+        if not batch:
+            return
+        loop = batch[0][2].get_loop()
+        done = loop.run_in_executor(
+            self.executor, _classify_rows,
+            [list(cards) for (cards, _, _) in batch],
+            [list(board) for (_, board, _) in batch],
+            self._columns)
+        done.add_done_callback(lambda done: self._resolve(batch, done))
+
+    def _resolve(self, batch, done):
+        error = None if done.cancelled() else done.exception()
+        for (i, (_, _, future)) in enumerate(batch):
+            if future.done():
+                continue
+            if done.cancelled():
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(dict(zip(self.names, done.result()[i])))
+
+
+_services = WeakKeyDictionary()
+
+
+async def classify(cards, board):
+    """Classify a hand with all flags, batched with concurrent calls.
+
+    Uses one ClassificationService, with the default settings, per event
+    loop.
+    """
+    loop = asyncio.get_running_loop()
+    service = _services.get(loop)
+    if service is None:
+        service = _services[loop] = ClassificationService()
+    return await service.classify(cards, board)
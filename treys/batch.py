@@ -0,0 +1,215 @@
+"""Batch classification of (hole cards, board) pairs.
+
+Computes every entry of Hand.FLAGS for many hands at once, as columns of
+a boolean matrix, without creating Hand objects: the rules of the flags
+(see features) are evaluated on arrays of features, and hands are
+ranked all at once too (see ranking). The flop_* functions
+are the Flop properties' equivalents, over arrays of boards.
+
+Requires numpy.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+from . import features
+from .cards import SUIT_INTS
+from .draws import completion_table
+from .evaluator import get_evaluator
+from .hand import Hand
+from .outs import CLASS_BOUNDS, outs_by_class
+from .ranking import card_indices, rank_hands
+
+
+FLAG_NAMES = [flag.__name__ for flag in Hand.FLAGS]
+
+
+def flag_column(flag):
+    """Return the column index of a flag (function or name) in the matrix."""
+    if not isinstance(flag, str):
+        flag = flag.__name__
+    return FLAG_NAMES.index(flag)
+
+
+def _as_card_array(cards, width=None):
+    array = np.asarray(cards, dtype=np.int64)
+    if array.ndim == 1:
+        array = array.reshape(1, -1)
+    assert array.ndim == 2
+    if width is not None:
+        assert array.shape[1] == width
+    return array
+
+
+def _ranks(cards):
+    return (cards >> 8) & 0xF
+
+
+def _suits(cards):
+    return (cards >> 12) & 0xF
+
+
+_CLASS_BOUNDS = np.array(CLASS_BOUNDS)
+
+_COMPLETION_COUNTS = np.array(
+    [bin(mask).count("1") for mask in completion_table()], dtype=np.int8)
+
+
+def _paired(ranks):
+    """Whether a rank is on exactly two cards of each row, see Flop.paired_board."""
+    counts = (ranks[:, :, None] == ranks[:, None, :]).sum(axis=2)
+    return (counts == 2).any(axis=1)
+
+
+def _features(cards, boards, evaluator):
+    """Compute the features of features.RULES, one array entry per hand."""
+    hand_ranks = np.sort(_ranks(cards), axis=1)
+    board_ranks = np.sort(_ranks(boards), axis=1)
+    all_cards = np.concatenate([cards, boards], axis=1)
+    all_suits = _suits(all_cards)
+    (low, high) = (hand_ranks[:, 0], hand_ranks[:, 1])
+    top = board_ranks[:, -1]
+    bottom = board_ranks[:, 0]
+
+    f = SimpleNamespace()
+    f.street = boards.shape[1]
+    ranks = rank_hands(card_indices(all_cards), evaluator)
+    f.rank_class = (np.searchsorted(_CLASS_BOUNDS, ranks) + 1).astype(np.int8)
+    f.low = low
+    f.high = high
+    f.pair = low == high
+    f.no_pair = ~f.pair
+    f.bottom = bottom
+    f.second_lowest = board_ranks[:, 1]
+    f.third_lowest = board_ranks[:, 2]
+    f.third = board_ranks[:, -3]
+    f.second = board_ranks[:, -2]
+    f.top = top
+    f.paired_board = _paired(board_ranks)
+    f.unpaired_board = ~f.paired_board
+    f.higher_than_pair = (board_ranks > low[:, None]).sum(axis=1)
+    f.overcards = (hand_ranks > top[:, None]).sum(axis=1)
+    f.pairs_middle_card = np.zeros(len(cards), dtype=bool)
+    for rank in [low, high]:
+        f.pairs_middle_card |= (board_ranks == rank[:, None]).any(axis=1) & \
+            (rank > bottom) & (rank < top)
+
+    # The suits of the lowest and highest card int, as in Hand.
+    f.low_suited = (all_suits == _suits(cards.min(axis=1))[:, None]).sum(axis=1)
+    f.high_suited = (all_suits == _suits(cards.max(axis=1))[:, None]).sum(axis=1)
+
+    # Straight draws are only looked at for one pair and high card hands,
+    # and there are none on the river.
+    rank_masks = np.bitwise_or.reduce(all_cards >> 16, axis=1) & 0x1FFF
+    f.completions = _COMPLETION_COUNTS[rank_masks]
+    if f.street == 5:
+        f.completions[:] = 0
+    f.completions[f.rank_class < 8] = 0
+
+    f.any_flush_draw = _any(features.has_flush_draw(f))
+    # The outs to a straight flush, of straight draws with a flush draw only.
+    f.straight_flush_outs = np.zeros(len(cards), dtype=np.int8)
+    card_rows = cards.tolist()
+    board_rows = boards.tolist()
+    for i in np.flatnonzero(f.any_flush_draw & (f.completions > 0)):
+        counts = outs_by_class(card_rows[i], board_rows[i], evaluator)
+        f.straight_flush_outs[i] = counts[1]
+    return f
+
+
+def _any(flag):
+    """A flag as one boolean array, true for tuples when any element is."""
+    if isinstance(flag, tuple):
+        return np.logical_or.reduce(flag)
+    return flag
+
+
+def _classify_block(cards, boards, evaluator):
+    f = _features(cards, boards, evaluator)
+    matrix = np.empty((len(cards), len(FLAG_NAMES)), dtype=bool)
+    for (column, name) in enumerate(FLAG_NAMES):
+        matrix[:, column] = _any(features.RULES[name](f))
+    return matrix
+
+
+def classify(cards, boards, evaluator=None, packed=False):
+    """Evaluate every flag in Hand.FLAGS for many hands at once.
+
+    `cards` holds two card ints per hand, `boards` three to five card ints
+    per hand; either can be a list of lists or a 2D numpy array. Boards of
+    mixed lengths are accepted as lists.
+
+    Returns a (hands, len(Hand.FLAGS)) boolean matrix, with columns in
+    Hand.FLAGS order (names in FLAG_NAMES). Flags returning a tuple, like
+    has_flush_draw, are True when any element is.
+    If `packed` is set, the columns are packed into bytes with
+    numpy.packbits, eight flags per byte.
+    """
+    evaluator = evaluator or get_evaluator()
+    cards = _as_card_array(cards, 2)
+    assert len(boards) == len(cards)
+
+    if isinstance(boards, np.ndarray):
+        blocks = [(np.arange(len(cards)), _as_card_array(boards))]
+    else:
+        rows_by_size = {}
+        for (i, board) in enumerate(boards):
+            rows_by_size.setdefault(len(board), []).append(i)
+        blocks = [(np.asarray(rows), _as_card_array([boards[i] for i in rows]))
+                  for rows in rows_by_size.values()]
+
+    matrix = np.empty((len(cards), len(FLAG_NAMES)), dtype=bool)
+    for (rows, block_boards) in blocks:
+        assert block_boards.shape[1] in [3, 4, 5]
+        matrix[rows] = _classify_block(cards[rows], block_boards, evaluator)
+
+    if packed:
+        return np.packbits(matrix, axis=1)
+    return matrix
+
+
+# Board textures.
+# Boards are (N, 3), (N, 4) or (N, 5) arrays of card ints; flop types
+# are only defined for (N, 3) ones.
+
+_BIT_COUNTS = np.array([bin(i).count("1") for i in range(1 << 13)], dtype=np.int8)
+
+# Flop types by number of distinct ranks and of distinct suits, 0 for
+# combinations Flop.type has no type for.
+_FLOP_TYPES = np.zeros((6, 5), dtype=np.int8)
+_FLOP_TYPES[1, :] = 1
+_FLOP_TYPES[2, 3] = 2
+_FLOP_TYPES[2, 2] = 3
+_FLOP_TYPES[3, 3] = 4
+_FLOP_TYPES[3, 2] = 5
+_FLOP_TYPES[3, 1] = 6
+
+
+def _distinct_ranks(boards):
+    return _BIT_COUNTS[np.bitwise_or.reduce(boards >> 16, axis=1)]
+
+
+def flop_types(boards):
+    """Return the Flop.type of every flop, as an int8 array."""
+    boards = _as_card_array(boards, 3)
+    suits = _BIT_COUNTS[np.bitwise_or.reduce(_suits(boards), axis=1)]
+    return _FLOP_TYPES[_distinct_ranks(boards), suits]
+
+
+def flop_ranks(boards):
+    """Return the sorted ranks of every board, like Flop.ranks."""
+    return np.sort(_ranks(_as_card_array(boards)), axis=1)
+
+
+def flop_suit_counts(boards):
+    """Return the number of cards of each suit, one column per suit.
+
+    Columns are in cards.SUIT_INTS order: spades, hearts, diamonds, clubs.
+    """
+    suits = _suits(_as_card_array(boards))
+    return (suits[:, :, None] == np.array(SUIT_INTS)).sum(axis=1)
+
+
+def flop_paired(boards):
+    """Return whether every board is paired, like Flop.paired_board."""
+    return _paired(_ranks(_as_card_array(boards)))
@@ -0,0 +1,151 @@
+"""The flop bucket database: every flop hand, up to suit isomorphism.
+
+Each of the 1,286,792 classes of (hole cards, flop) pairs (see
+isomorphism) gets the corpus record (see corpus) of its canonical hand:
+rank, rank class, Hand.FLAGS bitfield and HDSC cards. Records are
+written in class index order, so a hand's record is found at
+isomorphism.class_index(cards, flop).
+
+The classes are split into chunks, computed by a pool of worker
+processes. Each finished chunk is saved to a work directory, so an
+interrupted run picks up where it stopped when started again; the
+chunks are joined into the output file at the end. The work directory
+holds a manifest of the run's class count and chunk size, and chunks
+are only reused by a run with the same ones.
+
+Command line:
+
+    treys-buckets OUTPUT [--processes N] [--chunk-size N] [--work-dir DIR]
+
+Requires numpy.
+"""
+
+import argparse
+import json
+import os
+import sys
+from multiprocessing import Pool
+
+import numpy as np
+
+from .corpus import CorpusWriter, make_records
+from .evaluator import warm_up
+from .isomorphism import class_cards, num_classes
+
+
+_MANIFEST = "manifest.json"
+
+
+def _chunk_path(work_dir, chunk):
+    return os.path.join(work_dir, "chunk-%06d.npy" % chunk)
+
+
+def _check_manifest(work_dir, manifest):
+    """Write the run's manifest, or check it against the one of the work dir.
+
+    Raises ValueError if the work directory holds chunks of another run.
+    """
+    path = os.path.join(work_dir, _MANIFEST)
+    if os.path.exists(path):
+        with open(path) as f:
+            found = json.load(f)
+        if found != manifest:
+            raise ValueError("%s holds the chunks of another run (%r, not %r); "
+                             "remove it or run with the same settings"
+                             % (work_dir, found, manifest))
+        return
+    if any(name.startswith("chunk-") for name in os.listdir(work_dir)):
+        raise ValueError("%s holds chunks without a manifest; remove them"
+                         % work_dir)
+    with open(path, "w") as f:
+        json.dump(manifest, f)
+
+
+def _compute_chunk(task):
+    """Compute and save the records of one chunk of classes."""
+    (work_dir, chunk, start, stop) = task
+    records = make_records([class_cards(index, 3) for index in range(start, stop)])
+    path = _chunk_path(work_dir, chunk)
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        np.save(f, records)
+    os.replace(temporary, path)
+    return chunk
+
+
+def generate(path, processes=None, chunk_size=16384, work_dir=None,
+             count=None, progress=None):
+    """Compute the flop bucket database and write it to `path`.
+
+    The work is spread over `processes` worker processes (all cores by
+    default), `chunk_size` classes at a time. Finished chunks are kept in
+    `work_dir` (`path` + ".parts" by default) until the database is
+    written, and are not computed again if the run is restarted with the
+    same `chunk_size` and `count`; ValueError is raised if the work
+    directory holds chunks of a run with other ones.
+    `count` limits the database to the first classes; meant for testing.
+    `progress`, if given, is called with (chunks done, chunks) as chunks
+    complete.
+    """
+    total = num_classes(3) if count is None else count
+    default_work_dir = not work_dir
+    if default_work_dir:
+        work_dir = path + ".parts"
+    os.makedirs(work_dir, exist_ok=True)
+    _check_manifest(work_dir, {"total": total, "chunk_size": chunk_size})
+
+    chunks = [(work_dir, chunk, start, min(start + chunk_size, total))
+              for (chunk, start) in enumerate(range(0, total, chunk_size))]
+    pending = [task for task in chunks
+               if not os.path.exists(_chunk_path(work_dir, task[1]))]
+    done = len(chunks) - len(pending)
+    if pending:
+        with Pool(processes, initializer=warm_up) as pool:
+            for _ in pool.imap_unordered(_compute_chunk, pending):
+                done += 1
+                if progress is not None:
+                    progress(done, len(chunks))
+
+    with CorpusWriter(path) as writer:
+        for (_, chunk, start, stop) in chunks:
+            records = np.load(_chunk_path(work_dir, chunk))
+            if len(records) != stop - start:
+                raise ValueError("chunk %d has %d records, not %d"
+                                 % (chunk, len(records), stop - start))
+            writer.write_records(records)
+
+    # Only this run's files go; the directory too if it is the default one.
+    for (_, chunk, _, _) in chunks:
+        os.remove(_chunk_path(work_dir, chunk))
+    os.remove(os.path.join(work_dir, _MANIFEST))
+    if default_work_dir and not os.listdir(work_dir):
+        os.rmdir(work_dir)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate the flop bucket database.")
+    parser.add_argument("output", help="database file to write")
+    parser.add_argument("--processes", type=int,
+                        help="worker processes (default: one per core)")
+    parser.add_argument("--chunk-size", type=int, default=16384,
+                        help="classes per chunk")
+    parser.add_argument("--work-dir",
+                        help="directory of finished chunks (default: OUTPUT.parts)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="do not report progress")
+    args = parser.parse_args(argv)
+
+    def progress(done, chunks):
+        sys.stderr.write("\r%d/%d chunks" % (done, chunks))
+        if done == chunks:
+            sys.stderr.write("\n")
+
+    generate(args.output, args.processes, args.chunk_size, args.work_dir,
+             progress=None if args.quiet else progress)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
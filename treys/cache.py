@@ -0,0 +1,117 @@
+"""A bounded cache for hand classification results.
+
+Results are keyed by the method, the hand's sorted cards and board and
+its evaluator, so equal hands share entries whatever Hand object
+computed them, and no reference to Hand objects is kept. Stock deuces
+evaluators all rank alike and share entries; other evaluators are told
+apart by weak reference, so that entries do not keep them alive.
+"""
+
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from threading import Lock
+from weakref import ref
+
+from deuces import Evaluator
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class ClassificationCache:
+    """A least-recently-used cache with hit/miss statistics.
+
+    `maxsize` bounds the number of entries; None means unbounded and 0
+    disables caching.
+    """
+
+    def __init__(self, maxsize=4096):
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Return the value stored for `key`, counting a hit or a miss."""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries if full."""
+        if self._maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        if self._maxsize is not None:
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def resize(self, maxsize):
+        """Change the size bound, evicting entries that no longer fit."""
+        with self._lock:
+            self._maxsize = maxsize
+            if maxsize == 0:
+                self._data.clear()
+            self._evict()
+
+    def info(self):
+        """Return the statistics, as a CacheInfo."""
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def evaluator_key(evaluator):
+    """Return the cache key part of an evaluator, see the module documentation."""
+    if type(evaluator) is Evaluator:
+        return Evaluator
+    try:
+        return ref(evaluator)
+    except TypeError:
+        return evaluator
+
+
+# Shared by all Hand objects.
+classification_cache = ClassificationCache()
+
+
+def cached_method(method):
+    """Memoize a Hand method in classification_cache.
+
+    The key is the method, the hand's cards, board and evaluator, and the
+    arguments, which must be hashable.
+    """
+    @wraps(method)
+    def wrapper(self, *args):
+        key = (method, self._cards, self._board._cards, evaluator_key(self.ev), args)
+        result = classification_cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = method(self, *args)
+            classification_cache.put(key, result)
+        return result
+    return wrapper
@@ -0,0 +1,92 @@
+"""Dense card indices, for table lookups.
+
+A card's index is 4 * rank + suit position, so indices run from 0 (2s)
+to 51 (Ac) and sort the same way as the deuces card ints.
+"""
+
+from deuces import Card
+
+
+# deuces suit ints, in index order: spades, hearts, diamonds, clubs
+SUIT_INTS = [1, 2, 4, 8]
+SUIT_CHARS = "shdc"
+
+_SUIT_POSITION = {suit: position for (position, suit) in enumerate(SUIT_INTS)}
+
+INDEX_TO_CARD = [Card.new(rank + suit)
+                 for rank in Card.STR_RANKS
+                 for suit in SUIT_CHARS]
+
+CARD_TO_INDEX = {card: index for (index, card) in enumerate(INDEX_TO_CARD)}
+
+
+def card_index(card):
+    """Return the index (0 to 51) of a card int."""
+    return CARD_TO_INDEX[card]
+
+
+def index_rank(index):
+    """Return the rank (0 to 12) of a card index."""
+    return index >> 2
+
+
+def index_suit(index):
+    """Return the suit position (0 to 3) of a card index."""
+    return index & 3
+
+
+def suit_position(card):
+    """Return the suit position (0 to 3) of a card int."""
+    return _SUIT_POSITION[Card.get_suit_int(card)]
+
+
+def to_ints(cards):
+    """Return a list of card ints, from card strings or ints."""
+    if cards and isinstance(cards[0], str):
+        return [Card.new(card_str) for card_str in cards]
+    return list(cards)
+
+
+NUM_COMBOS = 1326
+
+
+def combo_index(first, second):
+    """Return the index (0 to 1325) of a two card combo, from card ints.
+
+    Combos are numbered by the colex rank of their card indices.
+    """
+    a = CARD_TO_INDEX[first]
+    b = CARD_TO_INDEX[second]
+    if a > b:
+        (a, b) = (b, a)
+    return b * (b - 1) // 2 + a
+
+
+# The two card ints of every combo, lower card first.
+COMBO_CARDS = [(INDEX_TO_CARD[a], INDEX_TO_CARD[b])
+               for b in range(52) for a in range(b)]
+
+
+def combo_cards(index):
+    """Return the two card ints of a combo index, lower card first."""
+    return COMBO_CARDS[index]
+
+
+def permute_suits(card, permutation):
+    """Return the card int with its suit position `s` moved to permutation[s]."""
+    index = CARD_TO_INDEX[card]
+    return INDEX_TO_CARD[(index & ~3) | permutation[index & 3]]
+
+
+# Card strings and ints to the shared card int objects of INDEX_TO_CARD.
+_SHARED_CARDS = {card: card for card in INDEX_TO_CARD}
+_SHARED_CARDS.update((Card.int_to_str(card), card) for card in INDEX_TO_CARD)
+_SHARED_LOOKUP = _SHARED_CARDS.__getitem__
+
+
+def card_tuple(cards):
+    """Return a sorted tuple of card ints, from card strings or ints.
+
+    The ints are shared objects, so storing them costs no memory per card.
+    """
+    return tuple(sorted(map(_SHARED_LOOKUP, cards)))
@@ -0,0 +1,179 @@
+"""Binary files of classified hands, read through memory maps.
+
+A corpus file holds one fixed-width record per hand, so that a reader
+maps the file as a numpy structured array and filters it by flag
+without deserializing anything.
+
+File layout: the 8 byte MAGIC, then as little-endian integers the
+format version (uint32), the record size (uint32), the number of
+records (uint64) and the number of flags (uint32), then the records.
+Record fields, all little-endian and unaligned (see RECORD):
+
+    cards       2 x uint32   sorted hole card ints
+    board       5 x uint32   sorted board card ints, 0 past the board size
+    board_size  uint8        3, 4 or 5
+    rank        uint16       the evaluator's hand rank
+    rank_class  uint8        1 (straight flush) to 9 (high card)
+    flags       uint64       bit i set if Hand.FLAGS[i] holds (any() of
+                             tuple results)
+    hdsc        2 x uint32   card ints of Hand.to_hdsc, 0 when there is
+                             none (turn, river, or untransformable hand)
+
+Requires numpy.
+"""
+
+import struct
+
+import numpy as np
+from deuces import Card
+
+from .batch import FLAG_NAMES, classify, flag_column
+from .cards import card_tuple
+from .evaluator import get_evaluator
+from .flop import Flop
+from .hand import Hand
+from .outs import rank_to_class
+
+
+MAGIC = b"TRYCORP1"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQI")
+
+RECORD = np.dtype([
+    ("cards", "<u4", 2),
+    ("board", "<u4", 5),
+    ("board_size", "u1"),
+    ("rank", "<u2"),
+    ("rank_class", "u1"),
+    ("flags", "<u8"),
+    ("hdsc", "<u4", 2),
+])
+
+_FLAG_WEIGHTS = np.uint64(1) << np.arange(len(FLAG_NAMES), dtype=np.uint64)
+
+
+def flag_mask(*flags):
+    """Return the bits of the given flags (functions or names) in `flags`."""
+    mask = 0
+    for flag in flags:
+        mask |= 1 << flag_column(flag)
+    return mask
+
+
+def select(records, *flags):
+    """Return the records having all the given flags."""
+    mask = np.uint64(flag_mask(*flags))
+    return records[(records["flags"] & mask) == mask]
+
+
+def _hdsc(hand):
+    try:
+        return [Card.new(card) for card in hand.to_hdsc()]
+    except AssertionError:
+        return [0, 0]
+
+
+def make_records(hands, evaluator=None):
+    """Classify hands and return their records, as a RECORD array.
+
+    `hands` is a sequence of (hole cards, board) pairs, as card ints or
+    strings.
+    """
+    evaluator = evaluator or get_evaluator()
+    records = np.zeros(len(hands), dtype=RECORD)
+    cards = [card_tuple(c) for (c, _) in hands]
+    boards = [card_tuple(b) for (_, b) in hands]
+
+    matrix = classify([list(c) for c in cards], [list(b) for b in boards],
+                      evaluator)
+    records["flags"] = (matrix.astype(np.uint64) * _FLAG_WEIGHTS).sum(
+        axis=1, dtype=np.uint64)
+    records["cards"] = cards
+    for (i, (hole, board)) in enumerate(zip(cards, boards)):
+        rank = evaluator.evaluate(hole, board)
+        record = records[i]
+        record["board"][:len(board)] = board
+        record["board_size"] = len(board)
+        record["rank"] = rank
+        record["rank_class"] = rank_to_class(rank)
+        if len(board) == 3:
+            record["hdsc"] = _hdsc(Hand._trusted(hole, Flop(board), evaluator, rank))
+    return records
+
+
+class CorpusWriter:
+    """Writes a corpus file, one chunk of hands at a time.
+
+    Use as a context manager, or call close() to finish the file.
+    """
+
+    def __init__(self, path, evaluator=None):
+        self.path = path
+        self.evaluator = evaluator
+        self.count = 0
+        self._file = open(path, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, RECORD.itemsize,
+                                      self.count, len(FLAG_NAMES)))
+
+    def write(self, hands):
+        """Classify and append (hole cards, board) pairs."""
+        self.write_records(make_records(hands, self.evaluator))
+
+    def write_records(self, records):
+        """Append already made records (see make_records)."""
+        records = np.asarray(records, dtype=RECORD)
+        self._file.seek(0, 2)
+        records.tofile(self._file)
+        self.count += len(records)
+
+    def close(self):
+        """Write the final record count and close the file."""
+        if not self._file.closed:
+            self._write_header()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_corpus(path, hands, chunk_size=65536, evaluator=None):
+    """Classify (hole cards, board) pairs into a new corpus file.
+
+    `hands` can be any iterable; at most `chunk_size` hands are held in
+    memory at once. Returns the number of records written.
+    """
+    with CorpusWriter(path, evaluator) as writer:
+        chunk = []
+        for hand in hands:
+            chunk.append(hand)
+            if len(chunk) == chunk_size:
+                writer.write(chunk)
+                chunk = []
+        if chunk:
+            writer.write(chunk)
+    return writer.count
+
+
+def open_corpus(path):
+    """Map a corpus file read-only, as a numpy structured array of RECORD."""
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("%s is not a hand corpus" % path)
+    (magic, version, record_size, count, flags) = _HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.itemsize:
+        raise ValueError("%s is not a version %d hand corpus" % (path, VERSION))
+    if flags != len(FLAG_NAMES):
+        raise ValueError("%s was written with %d flags, not %d" %
+                         (path, flags, len(FLAG_NAMES)))
+    if count == 0:
+        return np.zeros(0, dtype=RECORD)
+    return np.memmap(path, dtype=RECORD, mode="r", offset=_HEADER.size,
+                     shape=(count,))
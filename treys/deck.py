@@ -0,0 +1,64 @@
+"""52-bit deck masks.
+
+Bit `i` of a mask stands for the card of index `i` (see cards), so sets
+of cards, dead cards and the rest of the deck are plain ints, and
+enumerating them is a bit iteration.
+"""
+
+from .cards import CARD_TO_INDEX, INDEX_TO_CARD, to_ints
+
+
+FULL_DECK = (1 << 52) - 1
+
+CARD_BITS = {card: 1 << index for (index, card) in enumerate(INDEX_TO_CARD)}
+
+
+def card_mask(cards):
+    """Return the mask of a collection of card ints or strings.
+
+    A single int is refused: a card int could be taken for a mask.
+    """
+    if isinstance(cards, int):
+        raise TypeError("expected a collection of cards, not the int %r" % cards)
+    mask = 0
+    for card in to_ints(list(cards)):
+        mask |= CARD_BITS[card]
+    return mask
+
+
+def mask_cards(mask):
+    """Return the card ints of a mask, in index order."""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(INDEX_TO_CARD[low.bit_length() - 1])
+        mask ^= low
+    return cards
+
+
+def count(mask):
+    """Return the number of cards in a mask."""
+    return bin(mask).count("1")
+
+
+def remaining_mask(*dead, dead_mask=0):
+    """Return the mask of the cards left in the deck.
+
+    Every argument is a collection of dead cards: hole cards, board,
+    opponent cards, burned or mucked cards. `dead_mask` is a mask of more
+    dead cards.
+    """
+    mask = FULL_DECK & ~dead_mask
+    for cards in dead:
+        mask &= ~card_mask(cards)
+    return mask
+
+
+def remaining_cards(*dead, dead_mask=0):
+    """Return the card ints left in the deck, see remaining_mask."""
+    return mask_cards(remaining_mask(*dead, dead_mask=dead_mask))
+
+
+def contains(mask, card):
+    """Return True if the card int is in the mask."""
+    return bool(mask >> CARD_TO_INDEX[card] & 1)
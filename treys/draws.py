@@ -0,0 +1,138 @@
+"""Straight and flush draws, from rank and suit masks.
+
+A rank mask has bit r set when a card of rank r (0 for deuces to 12 for
+aces) is among the cards. The ranks completing a straight only depend
+on it, and are read from a table of all 8,192 masks, so draws are found
+without evaluating a single hand:
+
+    open-ended      four ranks in a row, both ends completing a straight
+    double gutter   two completing ranks, without four in a row
+    gutshot         one completing rank
+    backdoor        no completing rank, but two more ranks would do
+
+Like Hand's, these draws count straights made on the board alone too.
+straight_draw reads a rank mask alone, as if two cards were to come;
+straight_draws and flush_suits take the street from the board: there
+are no draws on the river, and backdoor draws, needing two more cards,
+only exist on the flop.
+"""
+
+from collections import namedtuple
+
+from .cards import SUIT_INTS
+
+
+# The five rank runs making straights, the wheel (A2345) first.
+STRAIGHTS = [0x100F] + [0x1F << low for low in range(9)]
+
+StraightDraw = namedtuple(
+    "StraightDraw",
+    ["completions", "open_ended", "double_gutter", "gutshot", "backdoor"])
+StraightDraw.__doc__ = """The straight draws of a rank mask.
+
+`completions` is the mask of the ranks completing a straight, the
+others are booleans (see the module documentation).
+"""
+
+_completions = None
+
+_NO_DRAW = StraightDraw(0, False, False, False, False)
+
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+def completion_table():
+    """Return the completing ranks mask of every rank mask, built on first use."""
+    global _completions
+    if _completions is None:
+        table = [0] * (1 << 13)
+        for run in STRAIGHTS:
+            for missing in [1 << rank for rank in range(13) if run & 1 << rank]:
+                needed = run ^ missing
+                free = 0x1FFF & ~run
+                # every mask holding `needed` but not `missing`
+                subset = free
+                while True:
+                    table[needed | subset] |= missing
+                    if not subset:
+                        break
+                    subset = (subset - 1) & free
+        _completions = table
+    return _completions
+
+
+def rank_mask(cards):
+    """Return the rank mask of card ints."""
+    mask = 0
+    for card in cards:
+        mask |= card >> 16
+    return mask & 0x1FFF
+
+
+def has_straight(mask):
+    """Return whether a rank mask holds a straight."""
+    return any(mask & run == run for run in STRAIGHTS)
+
+
+def straight_completions(mask):
+    """Return the mask of the ranks completing a straight."""
+    return completion_table()[mask]
+
+
+def completion_count(mask):
+    """Return the number of ranks completing a straight."""
+    return _popcount(completion_table()[mask])
+
+
+def _open_ended(mask, completions):
+    """Whether four ranks in a row have completing ranks on both ends."""
+    for low in range(9):
+        four = 0xF << low
+        if mask & four == four:
+            below = 1 << (low - 1) if low else 1 << 12
+            above = 1 << (low + 4)
+            if completions & below and completions & above:
+                return True
+    return False
+
+
+def straight_draw(mask):
+    """Return the StraightDraw of a rank mask."""
+    completions = completion_table()[mask]
+    count = _popcount(completions)
+    open_ended = count >= 2 and _open_ended(mask, completions)
+    backdoor = not count and not has_straight(mask) and \
+        any(_popcount(mask & run) == 3 for run in STRAIGHTS)
+    return StraightDraw(completions, open_ended, count >= 2 and not open_ended,
+                        count == 1, backdoor)
+
+
+def straight_draws(cards, board):
+    """Return the StraightDraw of hole cards and board, as card ints.
+
+    Only the draws possible with the cards to come are set.
+    """
+    if len(board) == 5:
+        return _NO_DRAW
+    draw = straight_draw(rank_mask(tuple(cards) + tuple(board)))
+    if draw.backdoor and len(board) != 3:
+        return draw._replace(backdoor=False)
+    return draw
+
+
+def flush_suits(cards, board, count):
+    """Return the suit ints of which hole cards and board hold `count` cards.
+
+    Only suits of the hole cards count: four cards make a flush draw,
+    three a backdoor flush draw. Fewer than five cards only count when
+    enough cards are to come: none on the river, and three only on the
+    flop.
+    """
+    if count < 5 and count < len(board):
+        return []
+    hole_suits = set((card >> 12) & 0xF for card in cards)
+    suits = [(card >> 12) & 0xF for card in tuple(cards) + tuple(board)]
+    return [suit for suit in SUIT_INTS
+            if suit in hole_suits and suits.count(suit) == count]
@@ -0,0 +1,172 @@
+"""Showdown equity of a hand against opponent hands or ranges.
+
+Runouts are enumerated exhaustively when there are few of them, and
+sampled (seeded Monte Carlo) otherwise. Either way, every showdown of a
+query is ranked at once over numpy arrays, see ranking.
+
+Requires numpy.
+"""
+
+from collections import namedtuple
+from itertools import combinations, product
+from math import sqrt
+from statistics import NormalDist
+
+import numpy as np
+
+from .cards import CARD_TO_INDEX, to_ints
+from .ranking import rank_hands
+
+
+EquityResult = namedtuple(
+    "EquityResult",
+    ["equity", "win", "tie", "trials", "exhaustive", "interval"])
+EquityResult.__doc__ = """Hero's showdown equity.
+
+`equity` counts ties as the share of the pot won, `win` and `tie` are
+the fractions of showdowns won outright and tied. `trials` is the number
+of showdowns evaluated, `exhaustive` whether they were all of them, and
+`interval` the confidence interval of the equity (a single point when
+exhaustive).
+"""
+
+
+def _card_indices(cards):
+    return [CARD_TO_INDEX[card] for card in to_ints(list(cards))]
+
+
+def _is_hand(player):
+    return len(player) == 2 and isinstance(player[0], (int, str))
+
+
+def _players(hero, villains, dead):
+    """Return a list of combos per player, the hero first.
+
+    Villain combos sharing a card with the hero's cards or `dead` are
+    dropped; a player left without any raises ValueError.
+    """
+    hero = _card_indices(hero)
+    if len(set(hero)) != 2 or set(hero) & dead:
+        raise ValueError("the hero's cards are not live")
+    players = [[hero]]
+    blocked = dead | set(hero)
+    for (p, villain) in enumerate(villains, 1):
+        if _is_hand(villain):
+            combos = [_card_indices(villain)]
+        else:
+            combos = [_card_indices(combo) for combo in villain]
+        combos = [combo for combo in combos
+                  if combo[0] != combo[1] and not set(combo) & blocked]
+        if not combos:
+            raise ValueError("every combo of player %d is blocked" % p)
+        players.append(combos)
+    return players
+
+
+def _showdowns(player_cards, boards):
+    """Return hero's pot share, win and tie arrays for each showdown.
+
+    `player_cards` is (N, players, 2), `boards` (N, 5), both card indices.
+    """
+    (n, players, _) = player_cards.shape
+    hands = np.concatenate(
+        [player_cards, np.broadcast_to(boards[:, None, :], (n, players, 5))],
+        axis=2)
+    ranks = rank_hands(hands.reshape(n * players, 7)).reshape(n, players)
+    best = ranks.min(axis=1)
+    hero_best = ranks[:, 0] == best
+    winners = (ranks == best[:, None]).sum(axis=1)
+    share = np.where(hero_best, 1.0 / winners, 0.0)
+    return (share, hero_best & (winners == 1), hero_best & (winners > 1))
+
+
+def _exhaustive(players, board, dead):
+    player_cards = []
+    boards = []
+    for assignment in product(*players):
+        used = [i for combo in assignment for i in combo]
+        if len(set(used)) != len(used) or set(used) & dead:
+            continue
+        deck = [i for i in range(52) if i not in dead and i not in used]
+        for runout in combinations(deck, 5 - len(board)):
+            player_cards.append(assignment)
+            boards.append(board + list(runout))
+    return (np.array(player_cards, dtype=np.int64).reshape(len(boards), len(players), 2),
+            np.array(boards, dtype=np.int64).reshape(len(boards), 5))
+
+
+def _sample(players, board, dead, trials, rng):
+    """Draw `trials` random showdowns, returned like _exhaustive."""
+    count = len(players)
+    player_cards = np.empty((trials, count, 2), dtype=np.int64)
+    for (p, combos) in enumerate(players):
+        combos = np.array(combos, dtype=np.int64)
+        player_cards[:, p] = combos[rng.integers(len(combos), size=trials)]
+
+    # Drop samples where players share a card.
+    flat = np.sort(player_cards.reshape(trials, 2 * count), axis=1)
+    valid = (flat[:, 1:] != flat[:, :-1]).all(axis=1)
+    player_cards = player_cards[valid]
+
+    keys = rng.random((len(player_cards), 52))
+    keys[:, sorted(dead)] = 2.0
+    np.put_along_axis(keys, player_cards.reshape(len(player_cards), -1), 2.0, axis=1)
+    runouts = np.argsort(keys, axis=1)[:, :5 - len(board)]
+    boards = np.concatenate(
+        [np.broadcast_to(np.array(board, dtype=np.int64), (len(runouts), len(board))),
+         runouts], axis=1)
+    return (player_cards, boards)
+
+
+def _runout_count(players, board, dead):
+    left = 52 - len(dead) - 2 * len(players)
+    count = 1
+    for i in range(5 - len(board)):
+        count = count * (left - i) // (i + 1)
+    for combos in players:
+        count *= len(combos)
+    return count
+
+
+def equity(hero, villains, board=(), dead=(), trials=100000, seed=None,
+           exhaustive_limit=100000, confidence=0.95):
+    """Compute the hero's showdown equity.
+
+    `hero` is two cards; `villains` a list of opponents, each either two
+    cards or a range given as a list of two card combos (picked with
+    equal weights). `board` holds the known board cards (0 to 5) and
+    `dead` the other cards out of the deck. Cards are strings or ints.
+
+    All showdowns are evaluated when there are at most `exhaustive_limit`
+    of them; otherwise `trials` are sampled, with a numpy random
+    generator seeded with `seed`.
+
+    Returns an EquityResult. Raises ValueError when no showdown is
+    possible: the hero's cards are dead, every combo of a villain is
+    blocked by the hero's cards, the board or `dead`, or the villains
+    can't all hold their cards at once.
+    """
+    board = _card_indices(board)
+    dead = set(_card_indices(dead)) | set(board)
+    players = _players(hero, villains, dead)
+    assert len(board) <= 5
+
+    exhaustive = _runout_count(players, board, dead) <= exhaustive_limit
+    if exhaustive:
+        (player_cards, boards) = _exhaustive(players, board, dead)
+    else:
+        rng = np.random.default_rng(seed)
+        (player_cards, boards) = _sample(players, board, dead, trials, rng)
+    if not len(boards):
+        raise ValueError("no possible showdown")
+
+    (share, win, tie) = _showdowns(player_cards, boards)
+    mean = float(share.mean())
+    if exhaustive:
+        interval = (mean, mean)
+    else:
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        margin = z * float(share.std()) / sqrt(len(share))
+        interval = (max(0.0, mean - margin), min(1.0, mean + margin))
+    return EquityResult(mean, float(win.mean()), float(tie.mean()),
+                        len(share), exhaustive, interval)
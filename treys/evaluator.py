@@ -0,0 +1,58 @@
+"""The process-wide evaluator shared by Hand, Flop and the batch code.
+
+Building a deuces Evaluator builds its lookup tables, so it is created
+once, on first use, and reused by everything that is not given an
+evaluator explicitly.
+"""
+
+from threading import Lock
+
+from deuces import Evaluator
+
+from . import flop_index
+from .cache import classification_cache
+
+
+_evaluator = None
+_lock = Lock()
+
+
+def get_evaluator():
+    """Return the shared evaluator, creating it on first call."""
+    global _evaluator
+    if _evaluator is None:
+        with _lock:
+            if _evaluator is None:
+                _evaluator = Evaluator()
+    return _evaluator
+
+
+def set_evaluator(evaluator):
+    """Replace the shared evaluator.
+
+    `evaluator` needs the deuces Evaluator's `evaluate` and
+    `get_rank_class` methods. None goes back to a deuces Evaluator,
+    created on next use. Cached classifications are dropped.
+    """
+    global _evaluator
+    with _lock:
+        _evaluator = evaluator
+    classification_cache.clear()
+
+
+def warm_up():
+    """Create the shared evaluator and the flop index now, not on first use.
+
+    With numpy, the tables of the batch ranking (see ranking) are built
+    too. Meant for the initializer of worker processes.
+    """
+    evaluator = get_evaluator()
+    flop_index.tables()
+    if type(evaluator) is Evaluator:
+        try:
+            from . import ranking
+        except ImportError:
+            pass
+        else:
+            ranking.tables(evaluator)
+    return evaluator
@@ -0,0 +1,316 @@
+"""The rules of Hand.FLAGS, over features of the hand.
+
+Every flag is derived from a few features (rank class, hole card and
+board ranks, board pairing, suit counts, straight completions...). The
+rules below are the only definition of the flags: the Hand predicates,
+the flag planner (see planner) and the batch classification (see batch)
+all evaluate them.
+
+A rule reads the features as attributes of its argument, which are
+either plain values for one hand (see HandFeatures) or numpy arrays with
+one entry per hand. Rules combine booleans with & and | only, so that
+they work on both; negated features are features of their own.
+"""
+
+from weakref import proxy
+
+from . import draws
+from .preflop import COMBO_PAIRED, COMBO_RANKS, COMBO_SUITS
+
+
+class _feature:
+    """A HandFeatures attribute computed on first access, then stored."""
+
+    def __init__(self, compute):
+        self.compute = compute
+        self.name = compute.__name__
+
+    def __get__(self, f, owner=None):
+        if f is None:
+            return self
+        value = f.__dict__[self.name] = self.compute(f)
+        return value
+
+
+class HandFeatures:
+    """The features of one Hand.
+
+    The ranks and the street, read from tables, are set at once; the
+    other features are computed on first access.
+    """
+
+    def __init__(self, hand):
+        # A proxy, so that a hand keeping its features can be collected
+        # as soon as it's not used.
+        self.hand = proxy(hand)
+        (self.low, self.high) = COMBO_RANKS[hand._combo]
+        self.pair = COMBO_PAIRED[hand._combo]
+        self.no_pair = not self.pair
+        self.board_ranks = board_ranks = hand._board._rank_list()
+        self.bottom = board_ranks[0]
+        self.top = board_ranks[-1]
+        self.street = len(board_ranks)
+
+    @_feature
+    def rank_class(self):
+        return self.hand.rank_class
+
+    # More board ranks, by position.
+    @_feature
+    def second_lowest(self):
+        return self.board_ranks[1]
+
+    @_feature
+    def third_lowest(self):
+        return self.board_ranks[2]
+
+    @_feature
+    def third(self):
+        return self.board_ranks[-3]
+
+    @_feature
+    def second(self):
+        return self.board_ranks[-2]
+
+    @_feature
+    def paired_board(self):
+        return self.hand._board.paired_board()
+
+    @_feature
+    def unpaired_board(self):
+        return not self.paired_board
+
+    @_feature
+    def higher_than_pair(self):
+        """The number of board ranks above the lowest hole card."""
+        return sum(1 for rank in self.board_ranks if rank > self.low)
+
+    @_feature
+    def overcards(self):
+        return (self.low > self.top) + (self.high > self.top)
+
+    @_feature
+    def pairs_middle_card(self):
+        """Whether a hole card pairs a board card between the top and bottom ones."""
+        return any(self.bottom < rank < self.top and rank in self.board_ranks
+                   for rank in (self.low, self.high))
+
+    @_feature
+    def suits(self):
+        """The suits of the hand's and board's cards."""
+        hand = self.hand
+        return [(card >> 12) & 0xF for card in hand._cards + hand._board._cards]
+
+    # Cards of the suits of the lowest and highest hole card int.
+    @_feature
+    def low_suited(self):
+        return self.suits.count(COMBO_SUITS[self.hand._combo][0])
+
+    @_feature
+    def high_suited(self):
+        return self.suits.count(COMBO_SUITS[self.hand._combo][1])
+
+    @_feature
+    def completions(self):
+        """The number of ranks completing a straight, see draws."""
+        # Straight draws are only looked at for one pair and high card
+        # hands, and there are none on the river.
+        if self.rank_class < 8 or self.street == 5:
+            return 0
+        hand = self.hand
+        return draws.completion_count(draws.rank_mask(hand._cards + hand._board._cards))
+
+    @_feature
+    def any_flush_draw(self):
+        return any(self.hand.has_flush_draw())
+
+    @_feature
+    def straight_flush_outs(self):
+        """The outs to a straight flush, of straight draws with a flush draw.
+
+        Other hands don't pay for the outs enumeration, and have none.
+        """
+        if not self.completions or not self.any_flush_draw:
+            return 0
+        return self.hand.outs_by_class()[1]
+
+
+# Made hands
+
+def is_straight_flush(f):
+    return f.rank_class == 1
+
+
+def is_quads(f):
+    return f.rank_class == 2
+
+
+def is_full_house(f):
+    return f.rank_class == 3
+
+
+def is_flush(f):
+    return f.rank_class == 4
+
+
+def is_straight(f):
+    return f.rank_class == 5
+
+
+def is_trips(f):
+    return (f.rank_class == 6) & f.no_pair
+
+
+def is_set(f):
+    return (f.rank_class == 6) & f.pair
+
+
+def is_two_pair(f):
+    return f.rank_class == 7
+
+
+def is_one_pair(f):
+    return f.rank_class == 8
+
+
+def is_high_card(f):
+    return f.rank_class == 9
+
+
+# Pairs
+
+def has_overpair(f):
+    return f.pair & (f.low > f.top)
+
+
+def has_overpair_to_paired_board(f):
+    return has_overpair(f) & f.paired_board
+
+
+def has_top_pair(f):
+    return ((f.low == f.top) | (f.high == f.top)) & is_one_pair(f)
+
+
+def has_under_top_pair(f):
+    return f.pair & f.unpaired_board & (f.higher_than_pair == 1)
+
+
+def has_bottom_pair(f):
+    return ((f.low == f.bottom) | (f.high == f.bottom)) & is_one_pair(f)
+
+
+def has_middle_pair(f):
+    return f.no_pair & is_one_pair(f) & f.pairs_middle_card
+
+
+def has_under_middle_pair(f):
+    return f.pair & f.unpaired_board & (f.higher_than_pair == 2)
+
+
+def has_under_pair(f):
+    return f.pair & (f.low < f.bottom)
+
+
+# Two pairs
+
+def has_top_two_pair(f):
+    return f.no_pair & f.unpaired_board & (f.low == f.second) & (f.high == f.top)
+
+
+def has_top_and_bottom(f):
+    return f.no_pair & f.unpaired_board & (f.low == f.bottom) & (f.high == f.top)
+
+
+def has_bottom_two_pair(f):
+    return f.no_pair & f.unpaired_board & \
+        (f.low == f.bottom) & (f.high == f.second_lowest)
+
+
+def has_under_high_pair(f):
+    return f.pair & f.paired_board & (f.top == f.second) & (f.second != f.third) & \
+        (f.third < f.low) & (f.low < f.top)
+
+
+def has_over_low_pair(f):
+    return f.pair & f.paired_board & \
+        (f.bottom == f.second_lowest) & (f.second_lowest != f.third_lowest) & \
+        (f.second_lowest < f.low) & (f.low < f.third_lowest)
+
+
+def has_under_pair_to_paired(f):
+    return f.paired_board & has_under_pair(f)
+
+
+# Sets
+
+def has_top_set(f):
+    return is_set(f) & (f.low == f.top)
+
+
+def has_middle_set(f):
+    return is_set(f) & (f.bottom < f.low) & (f.low < f.top)
+
+
+def has_bottom_set(f):
+    return is_set(f) & (f.low == f.bottom)
+
+
+# Draws
+
+def _suit_draw(f, possible, count):
+    """The (high, low) flags of a draw to `count` cards of a suit.
+
+    A pair in hand only draws with its high card.
+    """
+    high = possible & (f.high_suited == count)
+    low = possible & (f.low_suited == count)
+    return (high | (low & f.pair), low & f.no_pair)
+
+
+def has_flush_draw(f):
+    return _suit_draw(f, (f.rank_class != 4) & (f.street < 5), 4)
+
+
+def has_straight_draw(f):
+    return f.completions >= 2
+
+
+def has_gutshot_straight_draw(f):
+    return f.completions == 1
+
+
+def has_straight_flush_draw(f):
+    return has_straight_draw(f) & (f.straight_flush_outs >= 2)
+
+
+def has_gutshot_straight_flush_draw(f):
+    return has_gutshot_straight_draw(f) & (f.straight_flush_outs == 1)
+
+
+def has_backdoor_flush(f):
+    return _suit_draw(f, f.street == 3, 3)
+
+
+# Overcards
+
+def has_two_overcards(f):
+    return f.overcards == 2
+
+
+def has_one_over(f):
+    return f.overcards == 1
+
+
+RULES = {rule.__name__: rule for rule in [
+    is_straight_flush, is_quads, is_full_house, is_flush, is_straight,
+    is_trips, is_set, is_two_pair, is_one_pair, is_high_card,
+    has_overpair, has_overpair_to_paired_board, has_top_pair,
+    has_under_top_pair, has_bottom_pair, has_middle_pair,
+    has_under_middle_pair, has_under_pair, has_top_two_pair,
+    has_top_and_bottom, has_bottom_two_pair, has_under_high_pair,
+    has_over_low_pair, has_under_pair_to_paired, has_top_set,
+    has_middle_set, has_bottom_set, has_flush_draw, has_straight_draw,
+    has_gutshot_straight_draw, has_straight_flush_draw,
+    has_gutshot_straight_flush_draw, has_backdoor_flush,
+    has_two_overcards, has_one_over,
+]}
@@ -1,27 +1,35 @@
 from deuces import Card
 
+from . import flop_index
+from .cards import card_tuple
+
 class Flop:
     """Represents a Texas/Omaha Hold'em flop.
 
     Does not verify uniqueness of the cards or validity.
     """
 
-    _cards = []
-    _flop_type = 0
-
+    __slots__ = ("_cards", "_flop_type", "_ranks", "_frozen", "__weakref__")
 
     def __init__(self, cards):
         """Initialize a flop.
 
-        Sorts the internal vector, but does not calculate type.
+        Keeps the sorted card ints in a tuple, but does not calculate type.
         """
 
-        if isinstance(cards[0], str):
-            self._cards = [Card.new(card_str) for card_str in cards]
-        else:
-            self._cards = list(cards)
+        self._cards = card_tuple(cards)
+        self._flop_type = 0
+        self._ranks = None
+        self._frozen = False
 
-        self._cards.sort()
+    def extended(self, card):
+        """Return a new board with a card int added."""
+        board = Flop.__new__(Flop)
+        board._cards = tuple(sorted(self._cards + (card,)))
+        board._flop_type = 0
+        board._ranks = None
+        board._frozen = False
+        return board
 
     def __str__(self):
         """Provide a pretty looking string representation."""
@@ -29,8 +37,25 @@ class Flop:
 
     def __eq__(self, other):
         """Equality condition."""
+        if not isinstance(other, Flop):
+            return NotImplemented
         return self._cards == other._cards
 
+    def __hash__(self):
+        """Hash the cards, so that equal flops hash alike.
+
+        A hashed flop may be in a set or a dict: its cards can't be set
+        any more.
+        """
+        self._frozen = True
+        return hash(self._cards)
+
+    def _check_mutable(self):
+        """Refuse changes once the flop is hashed or interned (see pool)."""
+        if self._frozen:
+            raise AttributeError("hashed or interned flops can't change, "
+                                 "build a new Flop")
+
 
     def cards():
         doc = "The cards property."
@@ -39,9 +64,13 @@ class Flop:
             return [Card.int_to_str(card) for card in self._cards]
 
         def fset(self, value):
-            self._cards = [Card.new(card_str) for card_str in value]
+            self._check_mutable()
+            self._cards = card_tuple(value)
+            self._flop_type = 0
+            self._ranks = None
 
         def fdel(self):
+            self._check_mutable()
             del self._cards
         return locals()
     cards = property(**cards())
@@ -71,7 +100,13 @@ class Flop:
     @property
     def ranks(self):
         """Return an ordered list of card ranks."""
-        return [Card.get_rank_int(card) for card in self._cards]
+        return list(self._rank_list())
+
+    def _rank_list(self):
+        """The ordered card ranks, computed once; not to be modified."""
+        if self._ranks is None:
+            self._ranks = [(card >> 8) & 0xF for card in self._cards]
+        return self._ranks
 
     @property
     def char_ranks(self):
@@ -93,7 +128,33 @@ class Flop:
         """Return the list of unique suits."""
         return list(set(self.suits))
 
+    @property
+    def number(self):
+        """Return the flop's number in the flop index (3 card boards only)."""
+        return flop_index.flop_number(self._cards)
+
+    def canonical(self):
+        """Return the suit-isomorphic canonical flop, as a new Flop."""
+        return Flop(flop_index.flop_cards(flop_index.canonical_number(self.number)))
+
+    @property
+    def suit_permutation(self):
+        """Return the suit permutation mapping the flop to its canonical flop.
+
+        See flop_index.suit_permutation.
+        """
+        return flop_index.suit_permutation(self.number)
+
+    def is_monotone(self):
+        """Return true if all cards have the same suit."""
+        if len(self._cards) == 3:
+            return flop_index.is_monotone(self.number)
+        return len(self.unique_suits) == 1
+
     def _calculate_flop_type(self):
+        if len(self._cards) == 3:
+            return flop_index.flop_type(self.number)
+
         r = len(self._unique_ranks())
         s = len(self.unique_suits)
         if r == 1:
@@ -114,6 +175,14 @@ class Flop:
         return 0  # This should never happen.
 
     def paired_board(self):
-        """Return true if there's a pair on the board."""
+        """Return true if there's a pair on the board.
+
+        A pair is a rank on exactly two cards: XXY flops are paired, XXX
+        ones are not, and neither are turn or river boards with trips or
+        quads but no other pair.
+        """
+        if len(self._cards) == 3:
+            return flop_index.is_paired(self.number)
 
-        return len(self._unique_ranks()) == 2
+        ranks = self._rank_list()
+        return any(ranks.count(rank) == 2 for rank in ranks)
@@ -0,0 +1,181 @@
+"""Precomputed index of all 22,100 flops.
+
+Flops are numbered by the colexicographic rank of their sorted card
+indices. For every flop number the index holds the flop type, the flop
+number of its suit-isomorphic canonical representative, the suit
+permutation mapping the flop onto it, and the paired / monotone flags.
+
+Tables are compact arrays, built on first use.
+"""
+
+from array import array
+from collections import namedtuple
+from itertools import combinations, permutations
+
+from .cards import CARD_TO_INDEX, INDEX_TO_CARD, index_rank, index_suit
+
+
+NUM_FLOPS = 22100
+NUM_CANONICAL_FLOPS = 1755
+
+# Every permutation of the four suit positions.
+# A permutation maps suit position `s` to position `permutation[s]`.
+SUIT_PERMUTATIONS = list(permutations(range(4)))
+_PERMUTATION_NUMBER = {p: n for (n, p) in enumerate(SUIT_PERMUTATIONS)}
+
+# bits of the _flags table
+PAIRED = 1
+MONOTONE = 2
+
+FlopInfo = namedtuple(
+    "FlopInfo",
+    ["type", "canonical", "permutation", "paired", "monotone"])
+
+
+def _binomial(n, k):
+    result = 1
+    for i in range(k):
+        result = result * (n - i) // (i + 1)
+    return result
+
+
+# _COLEX[k][i] is C(i, k + 1)
+_COLEX = [[_binomial(i, k + 1) for i in range(52)] for k in range(3)]
+
+
+def _number_of_indices(a, b, c):
+    """Flop number of three sorted card indices."""
+    return _COLEX[0][a] + _COLEX[1][b] + _COLEX[2][c]
+
+
+def flop_number(cards):
+    """Return the flop number (0 to 22099) of three card ints, in any order."""
+    (a, b, c) = sorted(CARD_TO_INDEX[card] for card in cards)
+    return _COLEX[0][a] + _COLEX[1][b] + _COLEX[2][c]
+
+
+_tables = None
+
+
+def _flop_type(ranks, suits):
+    r = len(set(ranks))
+    s = len(set(suits))
+    if r == 1:
+        return 1
+    if r == 2:
+        return 2 if s == 3 else 3
+    return {3: 4, 2: 5, 1: 6}[s]
+
+
+def _canonical(indices):
+    """Return the canonical card indices of a flop and the suit permutation.
+
+    Suits are relabelled by decreasing number of cards, then decreasing
+    ranks; unused suits keep their relative order.
+    """
+    rank_masks = [0, 0, 0, 0]
+    for index in indices:
+        rank_masks[index_suit(index)] |= 1 << index_rank(index)
+    order = sorted(range(4),
+                   key=lambda s: (-bin(rank_masks[s]).count("1"), -rank_masks[s], s))
+    permutation = [0] * 4
+    for (new_suit, old_suit) in enumerate(order):
+        permutation[old_suit] = new_suit
+    canonical = sorted((index & ~3) | permutation[index & 3] for index in indices)
+    return (canonical, tuple(permutation))
+
+
+def _build():
+    flop_types = array("B", bytes(NUM_FLOPS))
+    flags = array("B", bytes(NUM_FLOPS))
+    canonical = array("H", [0] * NUM_FLOPS)
+    permutation = array("B", bytes(NUM_FLOPS))
+    cards = [None] * NUM_FLOPS
+
+    for indices in combinations(range(52), 3):
+        number = _number_of_indices(*indices)
+        ranks = [index_rank(i) for i in indices]
+        suits = [index_suit(i) for i in indices]
+        cards[number] = tuple(INDEX_TO_CARD[i] for i in indices)
+        flop_types[number] = _flop_type(ranks, suits)
+        flags[number] = (PAIRED if len(set(ranks)) == 2 else 0) | \
+            (MONOTONE if len(set(suits)) == 1 else 0)
+        (canonical_indices, suit_permutation) = _canonical(indices)
+        canonical[number] = _number_of_indices(*canonical_indices)
+        permutation[number] = _PERMUTATION_NUMBER[suit_permutation]
+
+    canonical_flops = sorted(set(canonical))
+    assert len(canonical_flops) == NUM_CANONICAL_FLOPS
+    canonical_id = array("H", [0] * NUM_FLOPS)
+    for (i, number) in enumerate(canonical_flops):
+        canonical_id[number] = i
+    for number in range(NUM_FLOPS):
+        canonical_id[number] = canonical_id[canonical[number]]
+
+    return {
+        "type": flop_types,
+        "flags": flags,
+        "canonical": canonical,
+        "canonical_id": canonical_id,
+        "canonical_flops": array("H", canonical_flops),
+        "permutation": permutation,
+        "cards": cards,
+    }
+
+
+def tables():
+    """Return the index tables, building them on first call."""
+    global _tables
+    if _tables is None:
+        _tables = _build()
+    return _tables
+
+
+def flop_cards(number):
+    """Return the sorted card ints of a flop number."""
+    return list(tables()["cards"][number])
+
+
+def flop_type(number):
+    """Return the type (1 to 6) of a flop number. See Flop.type."""
+    return tables()["type"][number]
+
+
+def is_paired(number):
+    """Return True if the flop has exactly two distinct ranks."""
+    return bool(tables()["flags"][number] & PAIRED)
+
+
+def is_monotone(number):
+    """Return True if the flop's cards all share a suit."""
+    return bool(tables()["flags"][number] & MONOTONE)
+
+
+def canonical_number(number):
+    """Return the flop number of the canonical isomorphic flop."""
+    return tables()["canonical"][number]
+
+
+def canonical_id(number):
+    """Return the canonical class (0 to 1754) of a flop number."""
+    return tables()["canonical_id"][number]
+
+
+def suit_permutation(number):
+    """Return the suit permutation mapping a flop to its canonical flop.
+
+    A tuple `p` such that suit position `s` becomes `p[s]`.
+    """
+    return SUIT_PERMUTATIONS[tables()["permutation"][number]]
+
+
+def info(cards):
+    """Return a FlopInfo for three card ints."""
+    t = tables()
+    number = flop_number(cards)
+    return FlopInfo(
+        t["type"][number],
+        t["canonical"][number],
+        SUIT_PERMUTATIONS[t["permutation"][number]],
+        bool(t["flags"][number] & PAIRED),
+        bool(t["flags"][number] & MONOTONE))
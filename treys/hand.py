@@ -1,9 +1,15 @@
 """Contains the Hand class definition."""
 
-from deuces import Card, Deck, Evaluator
-from functools import lru_cache
+from deuces import Card
 
+from . import features, hdsc
+from .cache import cached_method
+from .cards import card_tuple, combo_index
+from .deck import card_mask, mask_cards, remaining_mask
+from .evaluator import get_evaluator
 from .flop import Flop
+from .outs import NUM_RANK_CLASSES, extend_rank, outs_by_class
+from .preflop import COMBO_PAIRED, COMBO_RANKS, COMBO_SUITED
 
 
 class Hand:
@@ -16,40 +22,78 @@ class Hand:
 
     """
 
-    _cards = []
-    _board = []
-    rank = 0
+    __slots__ = ("_cards", "_combo", "_board", "ev", "_rank", "_rank_class",
+                 "_features", "_frozen", "__weakref__")
 
-    def __init__(self, cards, board, evaluator=None):
-        """Initialize new poker hand from a card array and an evaluator."""
-        assert len(cards) == 2
-        assert len(board) in [3, 4, 5]
+    def __init__(self, cards, board, evaluator=None, validate=True):
+        """Initialize new poker hand from a card array and an evaluator.
 
-        # checking there are 5, 6 or 7 unique cards
-        cardset = set(list(cards) + list(board))
-        assert len(cardset) == len(cards) + len(board)
+        Uses the shared evaluator (see evaluator.get_evaluator) if none is given.
+        The hand is only evaluated when its rank or rank class is needed.
+        With `validate` False, the numbers of cards and their uniqueness
+        are not checked; meant for trusted bulk input.
+        """
+        if validate:
+            assert len(cards) == 2
+            assert len(board) in [3, 4, 5]
+
+            # checking there are 5, 6 or 7 unique cards
+            cardset = set(list(cards) + list(board))
+            assert len(cardset) == len(cards) + len(board)
 
-        if isinstance(cards[0], str):
-            self._cards = [Card.new(card_str) for card_str in cards]
-        else:
-            self._cards = list(cards)
-        self._cards = sorted(self._cards)
+        self._cards = card_tuple(cards)
+        self._combo = combo_index(*self._cards)
 
         #TODO allow for Flop object to be passed
 
         self._board = Flop(board)
 
-        if evaluator:
-            self.ev = evaluator
-        else:
-            ev = Evaluator()
-            self.ev = ev
-
-        self.rank = self.ev.evaluate(self._cards, self._board._cards)
-        self.rank_class = self.ev.get_rank_class(self.rank)
-
-        self._hand_ranks = sorted([Card.get_rank_int(card) for card in self._cards])
-        self._board_ranks = self._board.ranks
+        self.ev = evaluator or get_evaluator()
+        self._rank = None
+        self._rank_class = None
+        self._features = None
+        self._frozen = False
+
+    @property
+    def rank(self):
+        """The hand's rank, evaluated on first access."""
+        if self._rank is None:
+            self._rank = self.ev.evaluate(self._cards, self._board._cards)
+        return self._rank
+
+    @property
+    def rank_class(self):
+        """The hand's rank class, 1 (straight flush) to 9 (high card)."""
+        if self._rank_class is None:
+            self._rank_class = self.ev.get_rank_class(self.rank)
+        return self._rank_class
+
+    def _forget_rank(self):
+        self._rank = None
+        self._rank_class = None
+        self._features = None
+
+    def _feature_set(self):
+        """The features the flags are derived from, see features."""
+        if self._features is None:
+            self._features = features.HandFeatures(self)
+        return self._features
+
+    def _check_mutable(self):
+        """Refuse changes once the hand is hashed or interned (see pool)."""
+        if self._frozen:
+            raise AttributeError("hashed or interned hands can't change, "
+                                 "build a new Hand")
+
+    @property
+    def _hand_ranks(self):
+        """The sorted ranks of the hand's cards, shared by equal combos."""
+        return COMBO_RANKS[self._combo]
+
+    @property
+    def _board_ranks(self):
+        """The sorted ranks of the board's cards, computed once per board."""
+        return self._board._rank_list()
 
     def cards():
         doc = "The cards property."
@@ -58,10 +102,15 @@ class Hand:
             return [Card.int_to_str(card) for card in self._cards]
 
         def fset(self, value):
-            self._cards = [Card.new(card_str) for card_str in value]
+            self._check_mutable()
+            self._cards = card_tuple(value)
+            self._combo = combo_index(*self._cards)
+            self._forget_rank()
 
         def fdel(self):
+            self._check_mutable()
             del self._cards
+            del self._combo
         return locals()
     cards = property(**cards())
 
@@ -72,13 +121,26 @@ class Hand:
             return [Card.int_to_str(card) for card in self._board._cards]
 
         def fset(self, value):
-            self._board = [Card.new(card_str) for card_str in value]
+            self._check_mutable()
+            self._board = Flop(value)
+            self._forget_rank()
 
         def fdel(self):
+            self._check_mutable()
             del self._board
         return locals()
     board = property(**board())
 
+    @property
+    def ranks(self):
+        """Return an ordered list of the hand's card ranks."""
+        return list(self._hand_ranks)
+
+    @property
+    def suits(self):
+        """Return a list of the hand's card suits, in order."""
+        return [Card.INT_SUIT_TO_CHAR_SUIT[Card.get_suit_int(card)] for card in self._cards]
+
     def __str__(self):
         """Provide a pretty looking string representation."""
         s = "%s on %s" % \
@@ -86,221 +148,275 @@ class Hand:
              self._board)
         return s
 
+    def __eq__(self, other):
+        """Hands are equal if they have the same cards and board."""
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return self._cards == other._cards and self._board == other._board
+
+    def __hash__(self):
+        """Hash the cards and board, so that equal hands hash alike.
+
+        A hashed hand may be in a set or a dict: its cards and board can't
+        be set any more.
+        """
+        self._frozen = True
+        return hash((self._cards, self._board._cards))
+
     def hand_is_suited(self):
-        return Card.get_suit_int(self._cards[0]) == Card.get_suit_int(self._cards[1])
+        return COMBO_SUITED[self._combo]
 
     def pair_in_hand(self):
         """Verify if the hand has a pair."""
-        ranks = list(map(Card.get_rank_int, self._cards))
-        return ranks[0] == ranks[1]
+        return COMBO_PAIRED[self._combo]
 
     def paired_board(self):
-        """Verify if the board has paired."""
+        """Verify if the board has paired, see Flop.paired_board."""
         return self._board.paired_board()
 
-    def rest_of_the_deck(self):
-        """Return a list with the rest of the cards in the deck."""
-        full_deck = Deck.GetFullDeck()
-        return [elem
-                for elem in full_deck
-                if elem not in (self._cards + self._board._cards)]
+    @property
+    def street(self):
+        """The street, from the number of board cards: 3, 4 or 5."""
+        return len(self._board._cards)
+
+    def deal(self, card):
+        """Return a new hand with `card` added to the board.
+
+        The hand is built incrementally from this one: the rank is updated
+        from this hand's rank (see outs.extend_rank) and the cards are not
+        validated or sorted again.
+        """
+        assert len(self._board._cards) < 5
+        (card,) = card_tuple([card])
+        assert card not in self._cards and card not in self._board._cards
+
+        rank = extend_rank(self.ev, self._cards + self._board._cards,
+                           self.rank, card)
+        return Hand._trusted(self._cards, self._board.extended(card), self.ev, rank)
+
+    @classmethod
+    def _trusted(cls, cards, board, evaluator, rank):
+        """Build a hand from already validated parts, without evaluating it.
+
+        `cards` is a sorted card tuple (see cards.card_tuple), `board` a
+        Flop and `rank` the hand's rank.
+        """
+        hand = cls.__new__(cls)
+        hand._cards = cards
+        hand._combo = combo_index(*cards)
+        hand._board = board
+        hand.ev = evaluator
+        hand._rank = rank
+        hand._rank_class = None
+        hand._features = None
+        hand._frozen = False
+        return hand
+
+    def rest_of_the_deck(self, dead=(), dead_mask=0):
+        """Return a list with the rest of the cards in the deck.
+
+        `dead` cards (opponent cards, burned or mucked cards) and the
+        cards of the deck mask `dead_mask` are left out too.
+        """
+        return mask_cards(remaining_mask(self._cards, self._board._cards, dead,
+                                         dead_mask=dead_mask))
 
     # Hand strength checks
     # These are gross hand rank checks.
     # Should be very fast.
+    # The rules of all the flags are in the features module.
     def is_straight_flush(self):
         """Verify if a hand is a straight flush."""
-        return self.rank_class is 1
+        return features.is_straight_flush(self._feature_set())
 
     def is_quads(self):
         """Verify if a hand is a four-of-a-kind."""
-        return self.rank_class is 2
+        return features.is_quads(self._feature_set())
 
     def is_full_house(self):
         """Verify if a hand is a full house."""
-        return self.rank_class is 3
+        return features.is_full_house(self._feature_set())
     is_fullhouse = is_full_house
     is_boat = is_full_house
 
     def is_flush(self):
         """Verify if a hand is a flush."""
-        return self.rank_class is 4
+        return features.is_flush(self._feature_set())
 
     def is_straight(self):
         """Verify if a hand is a straight."""
-        return self.rank_class is 5
+        return features.is_straight(self._feature_set())
 
     def is_trips(self):
         """Verify if a hand is a three-of-a-kind."""
-        return self.rank_class is 6 and not self.pair_in_hand()
+        return features.is_trips(self._feature_set())
 
     def is_set(self):
         """Verify is a hand has a set."""
-        return self.rank_class is 6 and self.pair_in_hand()
+        return features.is_set(self._feature_set())
 
     def is_two_pair(self):
         """Verify if a hand is a two-pair."""
-        return self.rank_class is 7
+        return features.is_two_pair(self._feature_set())
 
     def is_one_pair(self):
         """Verify if a hand is a one-pair."""
-        return self.rank_class is 8
+        return features.is_one_pair(self._feature_set())
 
     def is_high_card(self):
         """Verify if a hand is a high-card."""
-        return self.rank_class is 9
+        return features.is_high_card(self._feature_set())
 
     # Hand strength checks continue, with finer detail
     def has_overpair(self):
         """Verify if the hand is an overpair to the board."""
-        if not self.pair_in_hand():
-            return False
-        rank = Card.get_rank_int(self._cards[0])
-        return all(map(lambda x: rank > x, self._board_ranks))
+        return features.has_overpair(self._feature_set())
 
     def has_overpair_to_paired_board(self):
         """Verify if the hand is overpair to a paired board."""
-        return self.has_overpair() and self.paired_board()
+        return features.has_overpair_to_paired_board(self._feature_set())
 
     def has_top_pair(self):
         """Verify if the hand has paired the top card on the board."""
-        return max(self._board_ranks) in self._hand_ranks and \
-            self.is_one_pair()
+        return features.has_top_pair(self._feature_set())
 
     def has_under_top_pair(self):
         """Verify if the hand is an underpair to the board's top card."""
-        if not self.pair_in_hand() or self.paired_board():
-            return False
-        rank = self._hand_ranks[0]
-        higher_ranks = [x for x in self._board_ranks if x > rank]
-        return len(higher_ranks) is 1
+        return features.has_under_top_pair(self._feature_set())
 
     def has_bottom_pair(self):
         """Verify whether I've hit bottom pair."""
-        return min(self._board_ranks) in self._hand_ranks and \
-            self.is_one_pair()
+        return features.has_bottom_pair(self._feature_set())
 
     def has_middle_pair(self):
         """Verify whether i've hit middle pair.
 
-        Assumes we're on the flop.
+        On the turn and river, any board card between the top and bottom
+        ones is a middle card.
         """
-        if (len(self._board._cards) != 3) or self.pair_in_hand():
-            return False
-        return self.is_one_pair() and \
-            not self.has_top_pair() and \
-            not self.has_bottom_pair()
+        return features.has_middle_pair(self._feature_set())
 
     def has_under_middle_pair(self):
         """Verify if the hand is an underpair to the board's middle card."""
-        if not self.pair_in_hand() or self.paired_board():
-            return False
-        rank = self._hand_ranks[0]
-        higher_ranks = [x for x in self._board_ranks if x > rank]
-        return len(higher_ranks) is 2
+        return features.has_under_middle_pair(self._feature_set())
 
     def has_under_pair(self):
         """Verify if the hand is an underpair to the board."""
-        if not self.pair_in_hand():
-            return False
-        rank = Card.get_rank_int(self._cards[0])
-        return all(map(lambda x: rank < x, self._board_ranks))
+        return features.has_under_pair(self._feature_set())
 
     # Two pair tests start here.
     # has_overpair_to_paired_board defined earlier.
 
     def has_top_two_pair(self):
         """Verify if the hand has two top pairs."""
-        if self.pair_in_hand() or self.paired_board():
-            return False
-        return self._hand_ranks == self._board_ranks[-2:]
+        return features.has_top_two_pair(self._feature_set())
 
     def has_top_and_bottom(self):
         """Verify if the hand has top and bottom pairs."""
-        if self.pair_in_hand() or self.paired_board():
-            return False
-        return self._hand_ranks[0] == self._board_ranks[0] and \
-            self._hand_ranks[1] == self._board_ranks[-1]
+        return features.has_top_and_bottom(self._feature_set())
 
     def has_bottom_two_pair(self):
         """Verify if the hand has hit bottom two pairs."""
-        if self.pair_in_hand() or self.paired_board():
-            return False
-        return self._hand_ranks == self._board_ranks[:2]
+        return features.has_bottom_two_pair(self._feature_set())
 
     def has_under_high_pair(self):
-        """Verify the hand is of the form BB on AAC."""
-        if not self.pair_in_hand() or not self.paired_board():
-            return False
-        return self._hand_ranks[0] > self._board_ranks[0] and \
-            self._hand_ranks[0] < self._board_ranks[1]
+        """Verify the hand is of the form BB on AAC.
+
+        The board's top rank is paired, and the hand's pair is between it
+        and the next board rank.
+        """
+        return features.has_under_high_pair(self._feature_set())
 
     def has_over_low_pair(self):
-        """Verify the hand is of the form BB on ACC."""
-        if not self.pair_in_hand() or not self.paired_board():
-            return False
-        return self._hand_ranks[0] > self._board_ranks[1] and \
-            self._hand_ranks[0] < self._board_ranks[2]
+        """Verify the hand is of the form BB on ACC.
+
+        The board's bottom rank is paired, and the hand's pair is between
+        it and the next board rank.
+        """
+        return features.has_over_low_pair(self._feature_set())
 
     def has_under_pair_to_paired(self):
         """Verify if we have an underpair to a paired board."""
-        return self.paired_board() and self.has_under_pair()
+        return features.has_under_pair_to_paired(self._feature_set())
 
     # Sets start here
 
     def has_top_set(self):
         """Verify we've hit top set."""
-        return self.is_set() and self._hand_ranks[0] == self._board_ranks[2]
+        return features.has_top_set(self._feature_set())
 
     def has_middle_set(self):
-        """Verify we've hit top set."""
-        return self.is_set() and self._hand_ranks[0] == self._board_ranks[1]
+        """Verify we've hit middle set.
+
+        On the turn and river, a set of any board card between the top and
+        bottom ones is a middle set.
+        """
+        return features.has_middle_set(self._feature_set())
 
     def has_bottom_set(self):
-        """Verify we've hit top set."""
-        return self.is_set() and self._hand_ranks[0] == self._board_ranks[0]
+        """Verify we've hit bottom set."""
+        return features.has_bottom_set(self._feature_set())
 
     # Draws start here
     # All drawing hands should be included below,
     # plus supporting code.
     #
-    # Needed method for the draws
-    @lru_cache(maxsize=4096)
-    def outs_to(self, flag):
+    # Needed methods for the draws
+    def outs_by_class(self, dead=(), dead_mask=0):
+        """Count the outs to each rank class, in one pass over the deck.
+
+        Returns a tuple indexed by rank class (1 to 9), index 0 is unused.
+        `dead` and `dead_mask` cards, as in rest_of_the_deck, can't come.
+        """
+        return self._outs_by_class(card_mask(dead) | dead_mask)
+
+    @cached_method
+    def _outs_by_class(self, dead_mask):
+        if len(self._board._cards) == 5:
+            # No more cards to come.
+            return (0,) * (NUM_RANK_CLASSES + 1)
+        return tuple(outs_by_class(self._cards, self._board._cards, self.ev,
+                                   dead_mask=dead_mask))
+
+    def outs_to(self, flag, dead=(), dead_mask=0):
         """Count the number of outs to making a hand.
 
         Should be used as:
         hand.outs_to(is_flush)
 
         `flag` is any bool function, actually.
+        Plain rank class checks are answered from outs_by_class(),
+        other functions are called on the hand dealt every card left.
+        There are no outs on the river.
+        `dead` and `dead_mask` cards, as in rest_of_the_deck, can't come.
         """
+        return self._outs_to(flag, card_mask(dead) | dead_mask)
+
+    @cached_method
+    def _outs_to(self, flag, dead_mask):
+        rank_class = _RANK_CLASS_FLAGS.get(flag)
+        if rank_class is not None:
+            return self._outs_by_class(dead_mask)[rank_class]
+
+        if len(self._board._cards) == 5:
+            return 0
         count = 0
-        for c in self.rest_of_the_deck():
-            new_board = self._board._cards + [c]
-            new_hand = Hand(self._cards, new_board, self.ev)
-            if flag(new_hand):
+        for c in self.rest_of_the_deck(dead_mask=dead_mask):
+            if flag(self.deal(c)):
                 count += 1
         return count
 
     # Flags for the direct draws
     def has_straight_flush_draw(self):
         """Has a straight flush draw."""
-        if not any(self.has_flush_draw()):
-            return False
-        if not self.has_straight_draw():
-            return False
-        return self.outs_to(Hand.is_straight_flush) >= 2
+        return features.has_straight_flush_draw(self._feature_set())
 
-    @lru_cache(maxsize=128)
+    @cached_method
     def has_gutshot_straight_flush_draw(self):
         """Has a gutshot to a straight flush."""
-        if not any(self.has_flush_draw()):
-            return False
-        if not self.has_gutshot_straight_draw():
-            return False
-        return self.outs_to(Hand.is_straight_flush) is 1
+        return features.has_gutshot_straight_flush_draw(self._feature_set())
 
-    @lru_cache(maxsize=128)
+    @cached_method
     def has_flush_draw(self):
         """Verifies if there is a flush draw.
 
@@ -311,63 +427,23 @@ class Hand:
         (False, False) means no flush draw.
 
         Should return (True, False) if there's a flush draw with a pair in hand.
+        There are no draws on the river.
 
         Can be used with any() or all()
         """
-        if self.is_flush():
-            return (False, False)
+        return features.has_flush_draw(self._feature_set())
 
-        high_card = max(self._cards)
-        hc_suit = Card.get_suit_int(high_card)
-
-        low_card = min(self._cards)
-        lc_suit = Card.get_suit_int(low_card)
-
-        suits = list(map(Card.get_suit_int, self._cards + self._board._cards))
-
-        high_f_d = len([suit for suit in suits if suit == hc_suit]) == 4
-        low_f_d = len([suit for suit in suits if suit == lc_suit]) == 4
-
-        if any([high_f_d, low_f_d]) and self.pair_in_hand():
-            return (True, False)
+    def has_straight_draw(self):
+        """Has an up-and-down straight draw.
 
-        return (high_f_d, low_f_d)
+        Any two ranks completing a straight make one, so double gutshots
+        count too. See draws.
+        """
+        return features.has_straight_draw(self._feature_set())
 
-    @lru_cache(maxsize=128)
-    def has_straight_draw(self):
-        """Has an up-and-down straight draw."""
-        if any([self.is_straight_flush(),
-                self.is_quads(),
-                self.is_full_house(),
-                self.is_flush(),
-                self.is_straight(),
-                self.is_set(),
-                self.is_trips(),
-                self.is_two_pair()]):
-            return False
-        outs = self.outs_to(Hand.is_straight)
-        if any(self.has_flush_draw()):
-            return outs == 6
-        else:
-            return outs == 8
-
-    @lru_cache(maxsize=128)
     def has_gutshot_straight_draw(self):
-        """Has a gutshot straight draw."""
-        if any([self.is_straight_flush(),
-                self.is_quads(),
-                self.is_full_house(),
-                self.is_flush(),
-                self.is_straight(),
-                self.is_set(),
-                self.is_trips(),
-                self.is_two_pair()]):
-            return False
-        outs = self.outs_to(Hand.is_straight)
-        if any(self.has_flush_draw()):
-            return outs == 3
-        else:
-            return outs == 4
+        """Has a gutshot straight draw: one rank completes a straight."""
+        return features.has_gutshot_straight_draw(self._feature_set())
 
     # Backdoor draws come here
 
@@ -380,39 +456,21 @@ class Hand:
         (True, True) means the hand is suited, and there's a backdoor flush
             with a card on the flop.
         (False, False) means no backdoor flush draw.
+        Backdoor draws need two cards to come, so only exist on the flop.
 
         Can be used with any() or all()
         """
-
-        high_card = max(self._cards)
-        hc_suit = Card.get_suit_int(high_card)
-
-        low_card = min(self._cards)
-        lc_suit = Card.get_suit_int(low_card)
-
-        suits = list(map(Card.get_suit_int, self._cards + self._board._cards))
-
-        high_bd_f_d = len([suit for suit in suits if suit == hc_suit]) == 3
-        low_bd_f_d = len([suit for suit in suits if suit == lc_suit]) == 3
-
-        if any([high_bd_f_d, low_bd_f_d]) and self.pair_in_hand():
-            return (True, False)
-
-        return (high_bd_f_d, low_bd_f_d)
+        return features.has_backdoor_flush(self._feature_set())
 
     # Overcards tests
 
-    def _number_of_overcards(self):
-        overs = [rank for rank in self._hand_ranks if rank > max(self._board_ranks)]
-        return len(overs)
-
     def has_two_overcards(self):
         """Verify we have two overcards to the flop."""
-        return self._number_of_overcards() == 2
+        return features.has_two_overcards(self._feature_set())
 
     def has_one_over(self):
         """Verify we have one overcard to the flop."""
-        return self._number_of_overcards() == 1
+        return features.has_one_over(self._feature_set())
 
     FLAGS = [
         is_straight_flush,
@@ -453,12 +511,20 @@ class Hand:
     ]
 
 
-    def to_hdsc(self):
+    def to_hdsc(self, use_table=True):
         """Transform the hand's suits to HDSC.
 
         Returns a list of two cards (with the same ranks and changed suits)
+
+        On the flop, the answer is read from the HDSC table when one is
+        loaded (see hdsc.load_table), unless `use_table` is False.
         """
-        
+        table = hdsc.active_table()
+        if use_table and table is not None and len(self._board._cards) == 3:
+            new_cards = table.lookup(self._cards, self._board._cards)
+            if new_cards is not None:
+                return new_cards
+
         new_suits = ["c", "s"]  # Defaulting to this
 
         # Logic in google drive, building new_suits list
@@ -538,4 +604,17 @@ class Hand:
             new_card = card[0] + suit
             new_cards.append(new_card)
 
-        return new_cards
\ No newline at end of file
+        return new_cards
+
+
+# Flags depending only on the rank class, and the class they check for.
+_RANK_CLASS_FLAGS = {
+    Hand.is_straight_flush: 1,
+    Hand.is_quads: 2,
+    Hand.is_full_house: 3,
+    Hand.is_flush: 4,
+    Hand.is_straight: 5,
+    Hand.is_two_pair: 7,
+    Hand.is_one_pair: 8,
+    Hand.is_high_card: 9,
+}
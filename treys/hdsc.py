@@ -0,0 +1,136 @@
+"""Precomputed HDSC transforms for every flop and hole card combination.
+
+Hand.to_hdsc only depends on the suit pattern of the hand and the flop,
+so the table stores one row per canonical flop (see flop_index) and one
+byte per hole card combo (see cards.combo_index), holding the two new
+suit positions as `4 * first + second`. Hands are mapped onto the
+canonical flop with the flop's suit permutation before the lookup.
+
+The table is written by `generate` and memory-mapped by `load_table`.
+Once a table is loaded, Hand.to_hdsc reads flop transforms from it.
+
+File layout: the 8 byte MAGIC, the number of rows and of columns as
+two little-endian uint32, then the rows.
+"""
+
+import mmap
+import struct
+from multiprocessing import Pool
+
+from deuces import Card
+
+from . import flop_index
+from .evaluator import warm_up
+from .cards import COMBO_CARDS, NUM_COMBOS, SUIT_CHARS, combo_index, \
+    permute_suits
+
+
+MAGIC = b"TRYHDSC1"
+_HEADER = struct.Struct("<8sII")
+
+# Stored for blocked combos, and for hands to_hdsc cannot transform.
+NO_TRANSFORM = 0xFF
+
+
+class HDSCTable:
+    """A memory-mapped HDSC table."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, rows, columns) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or rows != flop_index.NUM_CANONICAL_FLOPS or \
+                columns != NUM_COMBOS:
+            self._map.close()
+            raise ValueError("%s is not an HDSC table" % path)
+        self.path = path
+
+    def close(self):
+        """Unmap the table."""
+        self._map.close()
+
+    def lookup(self, cards, board):
+        """Return the HDSC transform of a hand on the flop, or None.
+
+        `cards` are the two sorted hole card ints, `board` three card ints.
+        Returns a list of card strings, like Hand.to_hdsc.
+        """
+        number = flop_index.flop_number(board)
+        permutation = flop_index.suit_permutation(number)
+        mapped = [permute_suits(card, permutation) for card in cards]
+        offset = _HEADER.size + \
+            flop_index.canonical_id(number) * NUM_COMBOS + combo_index(*mapped)
+        code = self._map[offset]
+        if code == NO_TRANSFORM:
+            return None
+        return [Card.STR_RANKS[Card.get_rank_int(cards[0])] + SUIT_CHARS[code >> 2],
+                Card.STR_RANKS[Card.get_rank_int(cards[1])] + SUIT_CHARS[code & 3]]
+
+
+_table = None
+
+
+def load_table(path):
+    """Memory-map the table at `path` and use it in Hand.to_hdsc."""
+    global _table
+    table = HDSCTable(path)
+    unload_table()
+    _table = table
+    return table
+
+
+def unload_table():
+    """Stop using the loaded table, if any."""
+    global _table
+    if _table is not None:
+        _table.close()
+        _table = None
+
+
+def active_table():
+    """Return the loaded HDSCTable, or None."""
+    return _table
+
+
+def _compute_row(canonical_id):
+    """Compute the table row of a canonical flop."""
+    from .hand import Hand
+    board = flop_index.flop_cards(
+        flop_index.tables()["canonical_flops"][canonical_id])
+    row = bytearray([NO_TRANSFORM]) * NUM_COMBOS
+    for (combo, cards) in enumerate(COMBO_CARDS):
+        if cards[0] in board or cards[1] in board:
+            continue
+        hand = Hand(cards, board)
+        try:
+            new_cards = hand.to_hdsc(use_table=False)
+        except AssertionError:
+            continue
+        row[combo] = 4 * SUIT_CHARS.index(new_cards[0][1]) + \
+            SUIT_CHARS.index(new_cards[1][1])
+    return bytes(row)
+
+
+def generate(path, processes=None, canonical_ids=None):
+    """Compute the HDSC table and write it to `path`.
+
+    The work is spread over `processes` worker processes (all cores by
+    default). `canonical_ids` restricts the rows computed, others are
+    left as NO_TRANSFORM; meant for testing.
+    """
+    rows = flop_index.NUM_CANONICAL_FLOPS
+    wanted = range(rows) if canonical_ids is None else sorted(canonical_ids)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, rows, NUM_COMBOS))
+        f.write(bytes([NO_TRANSFORM]) * (rows * NUM_COMBOS))
+        with Pool(processes, initializer=warm_up) as pool:
+            for (canonical_id, row) in zip(wanted, pool.imap(_compute_row, wanted)):
+                f.seek(_HEADER.size + canonical_id * NUM_COMBOS)
+                f.write(row)
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m treys.hdsc OUTPUT_FILE")
+    generate(sys.argv[1])
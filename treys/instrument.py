@@ -0,0 +1,201 @@
+"""Opt-in profiling of Hand.
+
+enable() replaces the public methods of Hand (Hand.FLAGS included) with
+wrappers counting calls and wall time, counts the hands dealt by outs_to
+to look for outs, and counts classification cache hits and misses per
+memoized method. disable() puts the original methods back, so leaving
+the hooks in production code costs nothing while profiling is off.
+
+Times are inclusive: a method calling another counts the time of both.
+
+    from treys import instrument
+    with instrument.profiling():
+        run_the_workload()
+    print(instrument.prometheus())
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+from inspect import isfunction
+from threading import Lock, local
+from time import perf_counter
+
+from . import hand as hand_module
+from .cache import classification_cache
+from .hand import Hand
+
+
+_lock = Lock()
+_state = local()
+_originals = None
+
+_calls = {}
+_seconds = {}
+_cache_hits = {}
+_cache_misses = {}
+_sub_hands = 0
+
+
+def _record(name, elapsed):
+    with _lock:
+        _calls[name] = _calls.get(name, 0) + 1
+        _seconds[name] = _seconds.get(name, 0.0) + elapsed
+
+
+def _timed(name, function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(name, perf_counter() - start)
+    return wrapper
+
+
+def _looking_for_outs(function):
+    """Wrap Hand._outs_to, so that deal() knows it's dealing out hands."""
+    @wraps(function)
+    def wrapper(*args):
+        _state.depth = getattr(_state, "depth", 0) + 1
+        try:
+            return function(*args)
+        finally:
+            _state.depth -= 1
+    return wrapper
+
+
+def _counting_deals(function):
+    @wraps(function)
+    def wrapper(self, card):
+        global _sub_hands
+        if getattr(_state, "depth", 0):
+            with _lock:
+                _sub_hands += 1
+        return function(self, card)
+    return wrapper
+
+
+def _counting_get(key, default=None):
+    value = type(classification_cache).get(classification_cache, key, default)
+    name = getattr(key[0], "__name__", None) if isinstance(key, tuple) else None
+    if name is not None:
+        counts = _cache_misses if value is default else _cache_hits
+        with _lock:
+            counts[name] = counts.get(name, 0) + 1
+    return value
+
+
+def is_enabled():
+    """Return whether profiling is on."""
+    return _originals is not None
+
+
+def enable():
+    """Start profiling Hand. Statistics accumulate until reset()."""
+    global _originals
+    if _originals is not None:
+        return
+    _originals = dict(vars(Hand))
+
+    for (name, value) in _originals.items():
+        if isfunction(value) and (not name.startswith("_") or name == "__init__"):
+            setattr(Hand, name, _timed(name, value))
+    Hand.deal = _counting_deals(Hand.deal)
+    Hand._outs_to = _looking_for_outs(Hand._outs_to)
+    Hand.FLAGS = [getattr(Hand, flag.__name__) for flag in _originals["FLAGS"]]
+    # outs_to answers rank class flags from the outs table, wrapped or not.
+    for (flag, rank_class) in list(hand_module._RANK_CLASS_FLAGS.items()):
+        hand_module._RANK_CLASS_FLAGS[getattr(Hand, flag.__name__)] = rank_class
+    classification_cache.get = _counting_get
+
+
+def disable():
+    """Stop profiling, putting the original methods back.
+
+    The statistics are kept until reset().
+    """
+    global _originals
+    if _originals is None:
+        return
+    for (name, value) in vars(Hand).copy().items():
+        if _originals.get(name) is not value:
+            setattr(Hand, name, _originals[name])
+    for flag in list(hand_module._RANK_CLASS_FLAGS):
+        if _originals.get(flag.__name__) is not flag:
+            del hand_module._RANK_CLASS_FLAGS[flag]
+    del classification_cache.get
+    _originals = None
+
+
+@contextmanager
+def profiling():
+    """Profile Hand within a with block."""
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def reset():
+    """Forget the statistics."""
+    global _sub_hands
+    with _lock:
+        _calls.clear()
+        _seconds.clear()
+        _cache_hits.clear()
+        _cache_misses.clear()
+        _sub_hands = 0
+
+
+def statistics():
+    """Return the statistics as a dict.
+
+    "methods" maps method names to their calls and total seconds,
+    "outs_to_sub_hands" counts the hands outs_to dealt, and "cache" maps
+    memoized methods to their cache hits, misses and hit rate.
+    """
+    with _lock:
+        methods = {name: {"calls": _calls[name], "seconds": _seconds[name]}
+                   for name in _calls}
+        cache = {}
+        for name in set(_cache_hits) | set(_cache_misses):
+            hits = _cache_hits.get(name, 0)
+            misses = _cache_misses.get(name, 0)
+            cache[name] = {"hits": hits, "misses": misses,
+                           "hit_rate": hits / (hits + misses)}
+        return {"methods": methods, "outs_to_sub_hands": _sub_hands,
+                "cache": cache}
+
+
+def prometheus(prefix="treys"):
+    """Return the statistics in the Prometheus text exposition format."""
+    stats = statistics()
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append("# HELP %s_%s %s" % (prefix, name, help_text))
+        lines.append("# TYPE %s_%s %s" % (prefix, name, kind))
+        for (labels, value) in samples:
+            lines.append("%s_%s%s %r" % (prefix, name, labels, value))
+
+    def by(label, table, field):
+        return [('{%s="%s"}' % (label, name), table[name][field])
+                for name in sorted(table)]
+
+    metric("method_calls_total", "counter", "Calls of Hand methods.",
+           by("method", stats["methods"], "calls"))
+    metric("method_seconds_total", "counter",
+           "Wall time spent in Hand methods, callees included.",
+           by("method", stats["methods"], "seconds"))
+    metric("outs_to_sub_hands_total", "counter",
+           "Hands dealt by outs_to to look for outs.",
+           [("", stats["outs_to_sub_hands"])])
+    metric("cache_hits_total", "counter",
+           "Classification cache hits of memoized methods.",
+           by("method", stats["cache"], "hits"))
+    metric("cache_misses_total", "counter",
+           "Classification cache misses of memoized methods.",
+           by("method", stats["cache"], "misses"))
+    return "\n".join(lines) + "\n"
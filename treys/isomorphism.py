@@ -0,0 +1,271 @@
+"""Canonical forms of (hole cards, board) pairs under suit permutations.
+
+Relabelling the suits of a hand and its board does not change anything
+about it, so every (hole cards, board) pair has a canonical
+representative, and its class a dense index, from 0 to
+num_classes(board size) - 1, fit for keying arrays.
+
+The board is taken in dealing order: the flop (in any order), then the
+turn, then the river. A card dealt on the turn and one dealt on the
+river are told apart.
+
+Each suit holds a configuration: the ranks it has in the hole cards, on
+the flop, the turn and the river. Its shape is the number of cards it
+has in each of those rounds, and its configuration has an index among
+those of its shape. Canonical suits are ordered by decreasing (shape,
+index). A class is indexed by its multiset of suit configurations: the
+sorted shapes pick a range of indices, and within it the configurations
+of suits sharing a shape are ranked as multisets.
+"""
+
+from bisect import bisect_right
+from itertools import combinations_with_replacement, product
+from math import comb
+
+from .cards import CARD_TO_INDEX, INDEX_TO_CARD, to_ints
+from .flop_index import SUIT_PERMUTATIONS
+
+
+# Cards dealt in each round: hole cards, flop, turn, river.
+ROUNDS = (2, 3, 1, 1)
+
+STREETS = {0: 1, 3: 2, 4: 3, 5: 4}
+
+_POPCOUNT = [bin(mask).count("1") for mask in range(1 << 13)]
+
+_PERMUTATION_NUMBER = {p: n for (n, p) in enumerate(SUIT_PERMUTATIONS)}
+
+# _PERMUTED[n][i]: card index i with its suit moved by permutation n.
+_PERMUTED = [[(index & ~3) | permutation[index & 3] for index in range(52)]
+             for permutation in SUIT_PERMUTATIONS]
+
+
+def _shape_size(shape):
+    size = 1
+    left = 13
+    for count in shape:
+        size *= comb(left, count)
+        left -= count
+    return size
+
+
+class _Street:
+    """The index layout of one street."""
+
+    def __init__(self, rounds):
+        self.rounds = rounds
+        shapes = [shape for shape in product(*(range(n + 1) for n in rounds))
+                  if sum(shape) <= 13]
+        self.offsets = []
+        self.distributions = []
+        offset = 0
+        for distribution in combinations_with_replacement(
+                sorted(shapes, reverse=True), 4):
+            if tuple(map(sum, zip(*distribution))) != rounds:
+                continue
+            self.offsets.append(offset)
+            self.distributions.append(distribution)
+            offset += self._distribution_size(distribution)
+        self.size = offset
+        self.numbers = {d: n for (n, d) in enumerate(self.distributions)}
+
+    @staticmethod
+    def _groups(distribution):
+        """Return the (shape, suit count) of equal shape runs."""
+        groups = []
+        for shape in distribution:
+            if groups and groups[-1][0] == shape:
+                groups[-1][1] += 1
+            else:
+                groups.append([shape, 1])
+        return groups
+
+    def _distribution_size(self, distribution):
+        size = 1
+        for (shape, k) in self._groups(distribution):
+            size *= comb(_shape_size(shape) + k - 1, k)
+        return size
+
+
+_streets = {}
+
+
+def _street(board_size):
+    """Return the layout of a street, built on first use."""
+    street = _streets.get(board_size)
+    if street is None:
+        street = _streets[board_size] = _Street(ROUNDS[:STREETS[board_size]])
+    return street
+
+
+def num_classes(board_size):
+    """Return the number of classes of hands with `board_size` board cards."""
+    return _street(board_size).size
+
+
+def _rounds(cards, board):
+    """Return the card indices of each round."""
+    cards = [CARD_TO_INDEX[card] for card in to_ints(list(cards))]
+    board = [CARD_TO_INDEX[card] for card in to_ints(list(board))]
+    assert len(cards) == 2 and len(board) in STREETS
+    assert len(set(cards + board)) == len(cards) + len(board)
+    return [cards, board[:3], board[3:4], board[4:5]][:STREETS[len(board)]]
+
+
+def _configuration(rounds, suit):
+    """Return the shape and the index of a suit's configuration."""
+    shape = []
+    index = 0
+    used = 0
+    for cards in rounds:
+        mask = 0
+        for card in cards:
+            if card & 3 == suit:
+                mask |= 1 << (card >> 2)
+        count = _POPCOUNT[mask]
+        index = index * comb(13 - _POPCOUNT[used], count) + _mask_rank(mask, used)
+        shape.append(count)
+        used |= mask
+    return (tuple(shape), index)
+
+
+def _mask_rank(mask, used):
+    """Colex rank of `mask` among the masks of the ranks left by `used`."""
+    rank = 0
+    t = 0
+    while mask:
+        bit = mask & -mask
+        position = _POPCOUNT[(bit - 1) & ~used]
+        t += 1
+        rank += comb(position, t)
+        mask ^= bit
+    return rank
+
+
+def _mask_unrank(rank, count, used):
+    free = [r for r in range(13) if not used & (1 << r)]
+    mask = 0
+    for t in range(count, 0, -1):
+        position = t - 1
+        while comb(position + 1, t) <= rank:
+            position += 1
+        rank -= comb(position, t)
+        mask |= 1 << free[position]
+    return mask
+
+
+def _configurations(rounds):
+    configurations = [_configuration(rounds, suit) for suit in range(4)]
+    order = sorted(range(4), key=lambda s: configurations[s], reverse=True)
+    return (configurations, order)
+
+
+def canonicalize(cards, board):
+    """Return the canonical form of a hand and its board.
+
+    `cards` are the two hole cards, `board` zero to five board cards in
+    dealing order, as strings or ints. Returns (hole cards, board,
+    permutation): card ints with their suits relabelled, the hole cards
+    and flop sorted, and the suit permutation applied, a tuple `p` such
+    that suit position `s` became `p[s]` (see cards.permute_suits).
+    """
+    rounds = _rounds(cards, board)
+    (_, order) = _configurations(rounds)
+    permutation = [0] * 4
+    for (position, suit) in enumerate(order):
+        permutation[suit] = position
+    permuted = _PERMUTED[_PERMUTATION_NUMBER[tuple(permutation)]]
+    new_rounds = [sorted(INDEX_TO_CARD[permuted[card]] for card in cards)
+                  for cards in rounds]
+    return (tuple(new_rounds[0]), tuple(sum(new_rounds[1:], [])),
+            tuple(permutation))
+
+
+def class_index(cards, board):
+    """Return the index of the isomorphism class of a hand and its board.
+
+    Arguments are as for canonicalize. Indices run from 0 to
+    num_classes(len(board)) - 1.
+    """
+    rounds = _rounds(cards, board)
+    street = _street(len(board))
+    (configurations, order) = _configurations(rounds)
+    ordered = [configurations[suit] for suit in order]
+    distribution = tuple(shape for (shape, _) in ordered)
+    d = street.numbers[distribution]
+
+    index = 0
+    position = 0
+    for (shape, k) in street._groups(distribution):
+        indices = sorted(i for (_, i) in ordered[position:position + k])
+        rank = sum(comb(a + i, i + 1) for (i, a) in enumerate(indices))
+        index = index * comb(_shape_size(shape) + k - 1, k) + rank
+        position += k
+    return street.offsets[d] + index
+
+
+def class_cards(index, board_size):
+    """Return the canonical (hole cards, board) of a class index.
+
+    The inverse of class_index, for boards of `board_size` cards.
+    """
+    street = _street(board_size)
+    d = bisect_right(street.offsets, index) - 1
+    distribution = street.distributions[d]
+    index -= street.offsets[d]
+
+    groups = street._groups(distribution)
+    ranks = []
+    for (shape, k) in reversed(groups):
+        size = comb(_shape_size(shape) + k - 1, k)
+        ranks.append(index % size)
+        index //= size
+    ranks.reverse()
+
+    rounds = [[] for _ in street.rounds]
+    suit = 0
+    for ((shape, k), rank) in zip(groups, ranks):
+        for i in _multiset_unrank(rank, k, _shape_size(shape)):
+            masks = _configuration_masks(shape, i)
+            for (cards, mask) in zip(rounds, masks):
+                cards.extend(4 * r + suit for r in range(13) if mask & (1 << r))
+            suit += 1
+    cards = [[INDEX_TO_CARD[card] for card in sorted(c)] for c in rounds]
+    return (tuple(cards[0]), tuple(sum(cards[1:], [])))
+
+
+def _multiset_unrank(rank, k, n):
+    """Return the k sorted indices below n of a multiset rank, largest first."""
+    indices = []
+    for i in range(k - 1, -1, -1):
+        (low, high) = (0, n - 1)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if comb(middle + i, i + 1) <= rank:
+                low = middle
+            else:
+                high = middle - 1
+        rank -= comb(low + i, i + 1)
+        indices.append(low)
+    return indices
+
+
+def _configuration_masks(shape, index):
+    """Return the rank masks of each round, from a configuration index."""
+    sizes = []
+    left = 13
+    for count in shape:
+        sizes.append(comb(left, count))
+        left -= count
+    ranks = []
+    for size in reversed(sizes):
+        ranks.append(index % size)
+        index //= size
+    ranks.reverse()
+    masks = []
+    used = 0
+    for (count, rank) in zip(shape, ranks):
+        mask = _mask_unrank(rank, count, used)
+        masks.append(mask)
+        used |= mask
+    return masks
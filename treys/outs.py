@@ -0,0 +1,93 @@
+"""Outs enumeration working directly on card ints.
+
+Every next card is evaluated straight from the evaluator, without building
+intermediate Hand objects, and the results are tallied per made-hand class
+in a single pass over the rest of the deck.
+"""
+
+from bisect import bisect_left
+from itertools import combinations
+
+from deuces.lookup import LookupTable
+
+from .deck import CARD_BITS, mask_cards, remaining_mask
+
+
+# Highest (worst) hand rank of each rank class, best class first.
+CLASS_BOUNDS = [
+    LookupTable.MAX_STRAIGHT_FLUSH,
+    LookupTable.MAX_FOUR_OF_A_KIND,
+    LookupTable.MAX_FULL_HOUSE,
+    LookupTable.MAX_FLUSH,
+    LookupTable.MAX_STRAIGHT,
+    LookupTable.MAX_THREE_OF_A_KIND,
+    LookupTable.MAX_TWO_PAIR,
+    LookupTable.MAX_PAIR,
+    LookupTable.MAX_HIGH_CARD,
+]
+
+NUM_RANK_CLASSES = len(CLASS_BOUNDS)
+
+
+def rank_to_class(rank):
+    """Map an evaluator hand rank to its rank class (1 to 9).
+
+    Same result as Evaluator.get_rank_class, minus the if-chain.
+    """
+    return bisect_left(CLASS_BOUNDS, rank) + 1
+
+
+def extend_rank(evaluator, cards, rank, card):
+    """Return the rank of `cards` plus `card`, knowing the rank of `cards`.
+
+    `cards` holds the 5 or 6 card ints ranked `rank`. Only the five card
+    hands using the new card are evaluated: 5 of them instead of 6 for
+    six cards, 15 instead of 21 for seven.
+    """
+    best = rank
+    evaluate = evaluator.evaluate
+    new_card = [card]
+    for four in combinations(cards, 4):
+        score = evaluate(list(four), new_card)
+        if score < best:
+            best = score
+    return best
+
+
+def outs_masks(cards, board, evaluator, dead=(), dead_mask=0):
+    """Find the outs to every made-hand class, as deck masks.
+
+    `cards` and `board` are sequences of card ints; the board must have 3
+    or 4 cards so that one more can be dealt. `dead` cards (opponent,
+    burned or mucked cards, as card ints) and the cards of `dead_mask`
+    are not dealt.
+
+    Returns a list of NUM_RANK_CLASSES + 1 masks (see deck), indexed by
+    rank class; index 0 is unused. Mask `c` holds the next cards after
+    which the hand's rank class is exactly `c`.
+    """
+    assert len(board) in [3, 4]
+
+    masks = [0] * (NUM_RANK_CLASSES + 1)
+    cards = list(cards)
+    new_board = list(board) + [0]
+    evaluate = evaluator.evaluate
+    for card in mask_cards(remaining_mask(cards, board, dead, dead_mask=dead_mask)):
+        new_board[-1] = card
+        masks[bisect_left(CLASS_BOUNDS, evaluate(cards, new_board)) + 1] |= \
+            CARD_BITS[card]
+    return masks
+
+
+def outs_by_class(cards, board, evaluator, dead=(), dead_mask=0):
+    """Count the outs to every made-hand class.
+
+    Same as outs_masks, with the number of cards of each mask.
+    """
+    return [bin(mask).count("1")
+            for mask in outs_masks(cards, board, evaluator, dead, dead_mask)]
+
+
+def outs_to_class(cards, board, evaluator, rank_class, dead=(), dead_mask=0):
+    """Count the outs after which the hand is of class `rank_class`."""
+    return outs_by_class(cards, board, evaluator, dead, dead_mask)[rank_class]
@@ -0,0 +1,42 @@
+"""Evaluate several flags of a hand, sharing intermediate results.
+
+The flags of Hand.FLAGS are rules over features of the hand (rank class,
+board pairing, suit counts, overcards, outs...), see features. A
+FlagPlan resolves the rules of the requested flags once, and evaluates
+them all on the hand's features: each feature is computed at most once
+per hand, and only if a requested flag needs it.
+
+Results are the same as calling each Hand predicate, tuples included.
+"""
+
+from .features import RULES
+from .hand import Hand
+
+
+class FlagPlan:
+    """A set of flags to evaluate together on many hands."""
+
+    def __init__(self, flags=None):
+        """Plan the evaluation of `flags`, Hand.FLAGS entries or their names.
+
+        All of Hand.FLAGS by default. Unknown names raise KeyError.
+        """
+        if flags is None:
+            flags = Hand.FLAGS
+        self.names = [flag if isinstance(flag, str) else flag.__name__
+                      for flag in flags]
+        self._rules = [(name, RULES[name]) for name in self.names]
+
+    def evaluate(self, hand):
+        """Return {flag name: result} for a Hand, in the planned order."""
+        f = hand._feature_set()
+        return {name: rule(f) for (name, rule) in self._rules}
+
+    def evaluate_cards(self, cards, board, evaluator=None):
+        """Same as evaluate, from hole cards and board."""
+        return self.evaluate(Hand(cards, board, evaluator))
+
+
+def evaluate_flags(hand, flags=None):
+    """Evaluate some flags of one hand, see FlagPlan."""
+    return FlagPlan(flags).evaluate(hand)
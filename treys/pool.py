@@ -0,0 +1,68 @@
+"""Interning of Hand and Flop objects.
+
+intern_hand and intern_flop return the same object for equal inputs,
+whatever the order or the form (strings or ints) of the cards, so a hand
+seen again is neither sorted nor evaluated again, and keeps what it
+memoized. Interned hands share their interned boards.
+
+The pools only hold weak references: objects nobody uses any more are
+collected as usual. Interned objects are shared, so they are frozen:
+setting their cards or board raises AttributeError.
+"""
+
+from threading import Lock
+from weakref import WeakValueDictionary
+
+from .cards import card_tuple
+from .evaluator import get_evaluator
+from .flop import Flop
+from .hand import Hand
+
+
+_flops = WeakValueDictionary()
+_hands = WeakValueDictionary()
+_lock = Lock()
+
+
+def intern_flop(cards):
+    """Return the shared Flop of `cards`."""
+    key = card_tuple(cards)
+    flop = _flops.get(key)
+    if flop is None:
+        with _lock:
+            flop = _flops.get(key)
+            if flop is None:
+                flop = Flop(key)
+                flop._frozen = True
+                _flops[key] = flop
+    return flop
+
+
+def intern_hand(cards, board, evaluator=None):
+    """Return the shared Hand of `cards` on `board`.
+
+    Hands evaluated with different evaluators are distinct. The shared
+    evaluator (see evaluator.get_evaluator) is used if none is given.
+    """
+    evaluator = evaluator or get_evaluator()
+    key = (card_tuple(cards), card_tuple(board), evaluator)
+    hand = _hands.get(key)
+    if hand is None:
+        hand = Hand(key[0], key[1], evaluator)
+        hand._board = intern_flop(key[1])
+        hand._frozen = True
+        with _lock:
+            hand = _hands.setdefault(key, hand)
+    return hand
+
+
+def pool_sizes():
+    """Return the number of live interned (hands, flops)."""
+    return (len(_hands), len(_flops))
+
+
+def clear_pools():
+    """Forget every interned object; live ones are not shared any more."""
+    with _lock:
+        _hands.clear()
+        _flops.clear()
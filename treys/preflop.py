@@ -0,0 +1,86 @@
+"""Features of the 1,326 hole card combos.
+
+Tables are indexed by combo id (cards.combo_index), and give each
+combo's sorted ranks and suits, whether it's a pocket pair or suited,
+and its preflop class: one of the 169 hands like AKs, 72o or TT.
+
+Classes are numbered in the usual 13 x 13 grid order, row by row from
+aces down: pairs on the diagonal, suited hands above it, offsuit hands
+below it.
+"""
+
+from deuces import Card
+
+from .cards import COMBO_CARDS, NUM_COMBOS, combo_index, to_ints
+
+
+NUM_CLASSES = 169
+
+
+def _grid_class(high, low, suited):
+    (row, column) = (12 - high, 12 - low)
+    if suited:
+        return 13 * row + column
+    return 13 * column + row
+
+
+def _label(class_id):
+    (row, column) = divmod(class_id, 13)
+    if row == column:
+        return Card.STR_RANKS[12 - row] * 2
+    if row < column:
+        return Card.STR_RANKS[12 - row] + Card.STR_RANKS[12 - column] + "s"
+    return Card.STR_RANKS[12 - column] + Card.STR_RANKS[12 - row] + "o"
+
+
+CLASS_LABELS = [_label(class_id) for class_id in range(NUM_CLASSES)]
+_CLASS_IDS = {label: class_id for (class_id, label) in enumerate(CLASS_LABELS)}
+
+# Per combo: [low rank, high rank], (low card suit, high card suit)
+COMBO_RANKS = [[(card >> 8) & 0xF for card in cards] for cards in COMBO_CARDS]
+COMBO_SUITS = [tuple((card >> 12) & 0xF for card in cards) for cards in COMBO_CARDS]
+COMBO_PAIRED = [low == high for (low, high) in COMBO_RANKS]
+COMBO_SUITED = [low == high for (low, high) in COMBO_SUITS]
+COMBO_CLASS = [_grid_class(ranks[1], ranks[0], suited and not paired)
+               for (ranks, suited, paired)
+               in zip(COMBO_RANKS, COMBO_SUITED, COMBO_PAIRED)]
+
+
+def _class_combos():
+    combos = [[] for _ in range(NUM_CLASSES)]
+    for combo in range(NUM_COMBOS):
+        combos[COMBO_CLASS[combo]].append(combo)
+    return combos
+
+
+# Per class: its combo ids.
+CLASS_COMBOS = _class_combos()
+
+
+def combo_id(cards):
+    """Return the combo id of two hole cards, as strings or ints.
+
+    Raises ValueError if the two cards are the same.
+    """
+    (first, second) = to_ints(list(cards))
+    if first == second:
+        raise ValueError("the two cards are the same")
+    return combo_index(first, second)
+
+
+def class_id(label):
+    """Return the class id of a preflop hand label, like "AKs" or "TT"."""
+    try:
+        return _CLASS_IDS[label]
+    except KeyError:
+        raise ValueError("invalid preflop hand %r" % label)
+
+
+def label(combo):
+    """Return the preflop class label of a combo id."""
+    return CLASS_LABELS[COMBO_CLASS[combo]]
+
+
+def class_combos(label):
+    """Return the combo ids of a preflop hand label."""
+    return CLASS_COMBOS[class_id(label)]
@@ -0,0 +1,131 @@
+"""Range-vs-board classification over a process pool.
+
+Counts how many combos of a range hit each flag of Hand.FLAGS on a
+board, or on each of many boards. Combos blocked by the board are
+dropped, the rest are split into chunks classified with batch.classify,
+in worker processes when there are enough of them, and the per-flag
+counts are summed.
+
+Requires numpy.
+"""
+
+from collections import namedtuple
+from multiprocessing import Pool, cpu_count
+
+from .batch import FLAG_NAMES, classify, flag_column
+from .cards import COMBO_CARDS, to_ints
+from .evaluator import warm_up
+
+
+RangeBreakdown = namedtuple("RangeBreakdown", ["combos", "counts"])
+RangeBreakdown.__doc__ = """Per-flag counts over a range.
+
+`combos` is the number of combos classified (not blocked by the board),
+`counts` maps flag names to the number of combos hitting the flag.
+"""
+
+
+# Combos per task sent to a worker.
+_CHUNK_SIZE = 1024
+
+# Fewer combos are classified faster than worker processes start.
+_POOL_MIN_COMBOS = 50000
+
+
+def frequencies(breakdown):
+    """Return the fraction of the classified combos hitting each flag."""
+    if not breakdown.combos:
+        return {name: 0.0 for name in breakdown.counts}
+    return {name: count / breakdown.combos
+            for (name, count) in breakdown.counts.items()}
+
+
+def unblocked_combos(board, combos=None):
+    """Return the combos (pairs of card ints) not sharing a card with the board.
+
+    `combos` defaults to all 1,326 two card combos.
+    """
+    board = set(to_ints(board))
+    if combos is None:
+        combos = COMBO_CARDS
+    result = []
+    for combo in combos:
+        (first, second) = to_ints(list(combo))
+        if first != second and first not in board and second not in board:
+            result.append((first, second))
+    return result
+
+
+def _count_chunk(task):
+    (combos, board, columns) = task
+    matrix = classify(combos, [board] * len(combos))
+    return matrix[:, columns].sum(axis=0).tolist()
+
+
+def make_pool(workers=None):
+    """Return a process pool for analyze_range and analyze_ranges.
+
+    Its `workers` processes (all cores by default) build the evaluator,
+    the flop index and the ranking tables when they start (see
+    evaluator.warm_up), so a pool reused across calls pays for that
+    once. The caller closes it.
+    """
+    return Pool(workers, initializer=warm_up)
+
+
+def analyze_ranges(jobs, flags=None, workers=None, executor=None):
+    """Classify the combos of several (board, combos) jobs and count each flag.
+
+    Every job is as the arguments of analyze_range. The combos of all
+    the jobs are split into chunks of _CHUNK_SIZE, classified by
+    `executor` if given: a multiprocessing pool (see make_pool) or a
+    concurrent.futures executor, owned by the caller and reused across
+    calls. Otherwise, with `workers` above 1, a pool of that many
+    processes is started for the call; with 1, everything runs in this
+    process. By default, the combos run in this process if there are
+    fewer than _POOL_MIN_COMBOS of them, else on a pool of all cores.
+
+    Returns a RangeBreakdown per job.
+    """
+    names = FLAG_NAMES if flags is None else \
+        [name if isinstance(name, str) else name.__name__ for name in flags]
+    columns = [flag_column(name) for name in names]
+
+    jobs = [(to_ints(list(board)), combos) for (board, combos) in jobs]
+    jobs = [(board, unblocked_combos(board, combos)) for (board, combos) in jobs]
+    tasks = []
+    owners = []
+    for (number, (board, combos)) in enumerate(jobs):
+        for start in range(0, len(combos), _CHUNK_SIZE):
+            tasks.append((combos[start:start + _CHUNK_SIZE], board, columns))
+            owners.append(number)
+
+    if executor is not None:
+        results = list(executor.map(_count_chunk, tasks))
+    elif workers == 1 or (workers is None and
+                          sum(len(combos) for (_, combos) in jobs) < _POOL_MIN_COMBOS):
+        results = [_count_chunk(task) for task in tasks]
+    else:
+        with make_pool(workers or cpu_count()) as pool:
+            results = pool.map(_count_chunk, tasks)
+
+    totals = [[0] * len(columns) for _ in jobs]
+    for (number, result) in zip(owners, results):
+        totals[number] = [total + count
+                          for (total, count) in zip(totals[number], result)]
+    return [RangeBreakdown(len(combos), dict(zip(names, counts)))
+            for ((_, combos), counts) in zip(jobs, totals)]
+
+
+def analyze_range(board, combos=None, flags=None, workers=None, executor=None):
+    """Classify every combo of a range on a board and count each flag.
+
+    `board` holds three to five cards, as strings or ints; `combos` is an
+    iterable of two card combos (all 1,326 by default). `flags` restricts
+    the count to some flags of Hand.FLAGS, given as functions or names.
+    `workers` and `executor` are as for analyze_ranges: by default, a
+    single board is classified in this process.
+
+    Returns a RangeBreakdown.
+    """
+    return analyze_ranges([(board, combos)], flags, workers, executor)[0]
@@ -0,0 +1,203 @@
+"""Weighted ranges of hole card combos.
+
+A Range holds one weight per combo id (see cards.combo_index and
+preflop), in a numpy array of 1,326 floats. Ranges are parsed from the
+usual notation, a comma separated list of:
+
+    AA, AKs, AKo, AK        a preflop hand (AK is both AKs and AKo)
+    TT+, ATs+, KTo+, QT+    a pair and the higher ones, or a hand and
+                            the higher kickers
+    A5s-A2s, TT-77          the hands between two others
+    AhKh                    a single combo
+
+each optionally followed by a weight, as in "AKs:0.5" (1 by default).
+
+Requires numpy.
+"""
+
+import numpy as np
+from deuces import Card
+
+from .batch import FLAG_NAMES, classify, flag_column
+from .cards import CARD_TO_INDEX, COMBO_CARDS, NUM_COMBOS, to_ints
+from .deck import card_mask
+from .preflop import class_combos, combo_id
+
+
+# The deck mask of each combo.
+_COMBO_MASKS = np.array([(1 << CARD_TO_INDEX[first]) | (1 << CARD_TO_INDEX[second])
+                         for (first, second) in COMBO_CARDS], dtype=np.uint64)
+
+_COMBO_CARD_ARRAY = np.array(COMBO_CARDS, dtype=np.int64)
+
+
+def _rank(char):
+    try:
+        return Card.CHAR_RANK_TO_INT_RANK[char]
+    except KeyError:
+        raise ValueError("invalid rank %r" % char)
+
+
+def _hand(text):
+    """Parse "AKs", "AK" or "TT" into (high rank, low rank, suitedness)."""
+    if len(text) not in [2, 3] or (len(text) == 3 and text[2] not in "so"):
+        raise ValueError("invalid hand %r" % text)
+    (high, low) = sorted([_rank(text[0]), _rank(text[1])], reverse=True)
+    suitedness = text[2:]
+    if high == low and suitedness:
+        raise ValueError("invalid hand %r" % text)
+    return (high, low, suitedness)
+
+
+def _labels(high, low, suitedness):
+    """Return the preflop labels of a hand, both suitednesses if none."""
+    chars = Card.STR_RANKS[high] + Card.STR_RANKS[low]
+    if high == low:
+        return [chars]
+    return [chars + s for s in (suitedness or "so")]
+
+
+def _token_combos(token):
+    """Return the combo ids of one range token, without its weight."""
+    if len(token) == 4 and token[1] in "shdc" and token[3] in "shdc":
+        try:
+            return [combo_id([token[:2], token[2:]])]
+        except (KeyError, ValueError):
+            raise ValueError("invalid combo %r" % token)
+
+    if "-" in token:
+        (first, last) = [_hand(text) for text in token.split("-", 1)]
+        if first[2] != last[2]:
+            raise ValueError("invalid range %r" % token)
+        if first[0] == first[1] and last[0] == last[1]:
+            ranks = range(min(first[0], last[0]), max(first[0], last[0]) + 1)
+            hands = [(rank, rank, "") for rank in ranks]
+        elif first[0] == last[0] and first[0] != first[1] and last[0] != last[1]:
+            kickers = range(min(first[1], last[1]), max(first[1], last[1]) + 1)
+            hands = [(first[0], kicker, first[2]) for kicker in kickers]
+        else:
+            raise ValueError("invalid range %r" % token)
+    elif token.endswith("+"):
+        (high, low, suitedness) = _hand(token[:-1])
+        if high == low:
+            hands = [(rank, rank, "") for rank in range(high, 13)]
+        else:
+            hands = [(high, kicker, suitedness) for kicker in range(low, high)]
+    else:
+        hands = [_hand(token)]
+
+    return [combo for hand in hands for label in _labels(*hand)
+            for combo in class_combos(label)]
+
+
+class Range:
+    """A weighted range of hole card combos."""
+
+    def __init__(self, weights=None):
+        """Build a range from 1,326 weights indexed by combo id.
+
+        The range is empty by default.
+        """
+        if weights is None:
+            self.weights = np.zeros(NUM_COMBOS)
+        else:
+            self.weights = np.array(weights, dtype=np.float64)
+            if self.weights.shape != (NUM_COMBOS,):
+                raise ValueError("a range has %d weights" % NUM_COMBOS)
+
+    @classmethod
+    def parse(cls, notation):
+        """Build a range from its notation (see the module documentation).
+
+        Later tokens override the weights of earlier ones.
+        """
+        result = cls()
+        for token in notation.replace(" ", "").split(","):
+            if not token:
+                continue
+            (token, _, weight) = token.partition(":")
+            try:
+                weight = float(weight) if weight else 1.0
+            except ValueError:
+                raise ValueError("invalid weight in %r" % token)
+            result.weights[_token_combos(token)] = weight
+        return result
+
+    @classmethod
+    def full(cls):
+        """Return the range of all combos, with weight 1."""
+        return cls(np.ones(NUM_COMBOS))
+
+    def __repr__(self):
+        return "Range(%d combos, weight %g)" % (self.combo_count(), self.total())
+
+    def __eq__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+        return bool((self.weights == other.weights).all())
+
+    def __or__(self, other):
+        """The union: the highest weight of each combo."""
+        return Range(np.maximum(self.weights, other.weights))
+
+    def __and__(self, other):
+        """The intersection: the lowest weight of each combo."""
+        return Range(np.minimum(self.weights, other.weights))
+
+    def __sub__(self, other):
+        """The combos of this range that are not in the other one."""
+        return Range(np.where(other.weights > 0, 0.0, self.weights))
+
+    def combo_count(self):
+        """Return the number of combos with a weight."""
+        return int(np.count_nonzero(self.weights))
+
+    def total(self):
+        """Return the sum of the weights."""
+        return float(self.weights.sum())
+
+    def normalized(self):
+        """Return the range scaled so that its weights add up to 1."""
+        total = self.total()
+        if not total:
+            raise ValueError("empty range")
+        return Range(self.weights / total)
+
+    def combos(self):
+        """Return the (combo id, weight) of the combos with a weight."""
+        ids = np.flatnonzero(self.weights)
+        return list(zip(ids.tolist(), self.weights[ids].tolist()))
+
+    def blocked(self, cards):
+        """Return the boolean array of the combos sharing a card with `cards`.
+
+        `cards` are card ints or strings.
+        """
+        return (_COMBO_MASKS & np.uint64(card_mask(cards))) != 0
+
+    def without(self, cards):
+        """Return the range without the combos blocked by `cards`.
+
+        `cards` are a board or dead cards, as for blocked().
+        """
+        return Range(np.where(self.blocked(cards), 0.0, self.weights))
+
+    def flag_frequencies(self, board, flags=None, evaluator=None):
+        """Return the weighted fraction of the range hitting flags on a board.
+
+        `flags` selects entries of Hand.FLAGS (functions or names), all of
+        them by default. Only the combos with a weight and not blocked by
+        the board are classified. Returns {flag name: fraction}.
+        """
+        board = to_ints(list(board))
+        names = FLAG_NAMES if flags is None else \
+            [flag if isinstance(flag, str) else flag.__name__ for flag in flags]
+        live = self.without(board)
+        ids = np.flatnonzero(live.weights)
+        if not len(ids):
+            return {name: 0.0 for name in names}
+        weights = live.weights[ids]
+        matrix = classify(_COMBO_CARD_ARRAY[ids], [board] * len(ids), evaluator)
+        columns = [flag_column(name) for name in names]
+        shares = weights @ matrix[:, columns] / weights.sum()
+        return dict(zip(names, shares.tolist()))
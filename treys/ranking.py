@@ -0,0 +1,109 @@
+"""Hand ranks of many five to seven card hands at once.
+
+Hands are rows of card indices (see cards) in numpy arrays, and are
+ranked without calling the evaluator for each of them, from two tables
+built once from a deuces Evaluator's lookup tables:
+
+- the best rank of every multiset of five to seven ranks, suits aside,
+  keyed by the product of their rank primes;
+- the best flush of every mask of five to seven ranks of one suit.
+
+A hand's rank is the best of the two, as Evaluator.evaluate would find.
+
+Requires numpy.
+"""
+
+from itertools import combinations_with_replacement
+
+import numpy as np
+from deuces import Card, Evaluator
+
+from .cards import INDEX_TO_CARD
+from .evaluator import get_evaluator
+
+
+_PRIMES = np.array(Card.PRIMES, dtype=np.int64)
+
+# deuces suit ints (1, 2, 4, 8) to suit positions.
+_SUIT_POSITIONS = np.array([0, 0, 1, 0, 2, 0, 0, 0, 3], dtype=np.int64)
+
+# Worse than any hand: the flush rank of masks with no flush.
+_NO_FLUSH = 7463
+
+_tables = None
+
+
+def _product(ranks):
+    result = 1
+    for rank in ranks:
+        result *= Card.PRIMES[rank]
+    return result
+
+
+def _build_tables(table):
+    """Build the rank multiset and flush tables from a deuces LookupTable."""
+    # A multiset's best rank is the best of its multisets one rank smaller.
+    best = dict(table.unsuited_lookup)
+    for size in [6, 7]:
+        for ranks in combinations_with_replacement(range(13), size):
+            if any(ranks.count(rank) > 4 for rank in set(ranks)):
+                continue
+            product = _product(ranks)
+            best[product] = min(best[product // Card.PRIMES[rank]]
+                                for rank in set(ranks))
+    keys = np.array(sorted(best), dtype=np.int64)
+    values = np.array([best[key] for key in keys.tolist()], dtype=np.int32)
+
+    flushes = np.full(1 << 13, _NO_FLUSH, dtype=np.int32)
+    for mask in sorted(range(1 << 13), key=lambda mask: bin(mask).count("1")):
+        size = bin(mask).count("1")
+        if size == 5:
+            flushes[mask] = table.flush_lookup[Card.prime_product_from_rankbits(mask)]
+        elif size in [6, 7]:
+            flushes[mask] = min(flushes[mask & ~(1 << rank)]
+                                for rank in range(13) if mask & 1 << rank)
+    return (keys, values, flushes)
+
+
+def tables(evaluator=None):
+    """Return the ranking tables, built on first use from a deuces Evaluator.
+
+    The shared evaluator is used if none is given.
+    """
+    global _tables
+    if _tables is None:
+        _tables = _build_tables((evaluator or get_evaluator()).table)
+    return _tables
+
+
+def card_indices(cards):
+    """Return the card indices of an array of card ints."""
+    cards = np.asarray(cards, dtype=np.int64)
+    return 4 * ((cards >> 8) & 0xF) + _SUIT_POSITIONS[(cards >> 12) & 0xF]
+
+
+def rank_hands(indices, evaluator=None):
+    """Rank many hands at once.
+
+    `indices` is an (N, 5), (N, 6) or (N, 7) array of card indices.
+    Returns the N hand ranks, as evaluator.evaluate would. Evaluators
+    other than a deuces Evaluator may rank differently, so they are asked
+    for every hand.
+    """
+    evaluator = evaluator or get_evaluator()
+    indices = np.asarray(indices, dtype=np.int64)
+    assert indices.ndim == 2 and 5 <= indices.shape[1] <= 7
+
+    if type(evaluator) is not Evaluator:
+        cards = np.array(INDEX_TO_CARD, dtype=np.int64)[indices].tolist()
+        return np.fromiter((evaluator.evaluate(row[:2], row[2:]) for row in cards),
+                           dtype=np.int32, count=len(cards))
+
+    (keys, values, flushes) = tables(evaluator)
+    ranks = values[np.searchsorted(keys, _PRIMES[indices >> 2].prod(axis=1))]
+    rank_bits = 1 << (indices >> 2)
+    for suit in range(4):
+        masks = np.bitwise_or.reduce(
+            np.where((indices & 3) == suit, rank_bits, 0), axis=1)
+        ranks = np.minimum(ranks, flushes[masks])
+    return ranks
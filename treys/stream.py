@@ -0,0 +1,117 @@
+"""Streaming classification of hand-history files.
+
+The input is line oriented, one hand per line: the two hole cards, then
+the three to five board cards, as card strings separated by spaces. An
+optional `|` may separate the hole cards from the board, and cards may
+be written back to back:
+
+    Ks Jd | Js Qs 2h
+    AhAd 2c7d9hTs
+
+Blank lines and lines starting with `#` are skipped.
+
+Hands are read lazily and classified in chunks of bounded size with
+batch.classify, so memory use does not depend on the size of the input.
+
+Requires numpy.
+"""
+
+from collections import namedtuple
+
+from deuces import Card
+
+from .batch import FLAG_NAMES, classify, flag_column
+
+
+ClassifiedChunk = namedtuple("ClassifiedChunk", ["hands", "names", "flags"])
+ClassifiedChunk.__doc__ = """Classifications of consecutive hands.
+
+`hands` is a list of (line number, hole card ints, board card ints),
+`names` the flag names, and `flags` a boolean matrix with one row per
+hand and one column per name.
+"""
+
+
+def parse_line(line):
+    """Return (hole cards, board) of a line, as card ints, or None if blank.
+
+    Raises ValueError for malformed lines.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    tokens = line.replace("|", " ").split()
+    strs = [token[i:i + 2] for token in tokens for i in range(0, len(token), 2)]
+    try:
+        cards = [Card.new(card_str) for card_str in strs]
+    except (KeyError, IndexError):
+        raise ValueError("invalid card in %r" % line)
+    if len(cards) not in [5, 6, 7] or len(set(cards)) != len(cards):
+        raise ValueError("invalid hand %r" % line)
+    return (cards[:2], cards[2:])
+
+
+def read_hands(source, skip_invalid=False):
+    """Yield (line number, hole cards, board) for every hand of `source`.
+
+    `source` is a file name, or an iterable of lines such as an open file.
+    Malformed lines raise ValueError, or are skipped if `skip_invalid`.
+    """
+    if isinstance(source, str):
+        with open(source) as lines:
+            for hand in read_hands(lines, skip_invalid):
+                yield hand
+        return
+
+    for (number, line) in enumerate(source, 1):
+        try:
+            hand = parse_line(line)
+        except ValueError as error:
+            if skip_invalid:
+                continue
+            raise ValueError("line %d: %s" % (number, error))
+        if hand is not None:
+            yield (number, hand[0], hand[1])
+
+
+def _flag_names(flags):
+    if flags is None:
+        return list(FLAG_NAMES)
+    return [flag if isinstance(flag, str) else flag.__name__ for flag in flags]
+
+
+def classify_stream(source, flags=None, chunk_size=4096, skip_invalid=False,
+                    evaluator=None):
+    """Classify the hands of `source` lazily, yielding ClassifiedChunks.
+
+    `flags` selects entries of Hand.FLAGS (functions or names), all of
+    them by default. At most `chunk_size` hands are held at once.
+    """
+    names = _flag_names(flags)
+    columns = [flag_column(name) for name in names]
+    chunk = []
+    for hand in read_hands(source, skip_invalid):
+        chunk.append(hand)
+        if len(chunk) == chunk_size:
+            yield _classify_chunk(chunk, names, columns, evaluator)
+            chunk = []
+    if chunk:
+        yield _classify_chunk(chunk, names, columns, evaluator)
+
+
+def _classify_chunk(chunk, names, columns, evaluator):
+    matrix = classify([cards for (_, cards, _) in chunk],
+                      [board for (_, _, board) in chunk], evaluator)
+    return ClassifiedChunk(chunk, names, matrix[:, columns])
+
+
+def classify_lines(source, flags=None, chunk_size=4096, skip_invalid=False,
+                   evaluator=None):
+    """Yield (line number, hole cards, board, {flag name: bool}) per hand.
+
+    Same as classify_stream, one hand at a time.
+    """
+    for chunk in classify_stream(source, flags, chunk_size, skip_invalid,
+                                 evaluator):
+        for (hand, row) in zip(chunk.hands, chunk.flags.tolist()):
+            yield hand + (dict(zip(chunk.names, row)),)
@@ -0,0 +1,85 @@
+"""Street-by-street hand replays.
+
+A Street follows one hand from the flop to the river. Every dealt card
+updates the rank and suit histograms, the used cards and the hand rank in
+place, so replaying a hand never rebuilds what the previous street
+already computed.
+"""
+
+from deuces import Card
+
+from .cards import card_tuple
+from .deck import CARD_BITS
+from .evaluator import get_evaluator
+from .flop import Flop
+from .hand import Hand
+from .outs import extend_rank
+
+
+STREET_NAMES = {3: "flop", 4: "turn", 5: "river"}
+
+
+class Street:
+    """A hand whose board is dealt one card at a time."""
+
+    __slots__ = ("_cards", "_board", "ev", "rank", "rank_counts",
+                 "suit_counts", "used")
+
+    def __init__(self, cards, flop, evaluator=None):
+        """Start on the flop, from two hole cards and three board cards."""
+        assert len(cards) == 2
+        assert len(flop) == 3
+        self._cards = card_tuple(cards)
+        self._board = card_tuple(flop)
+        assert len(set(self._cards + self._board)) == 5
+
+        self.ev = evaluator or get_evaluator()
+        self.rank = self.ev.evaluate(list(self._cards), list(self._board))
+        self.rank_counts = [0] * 13
+        self.suit_counts = {suit: 0 for suit in Card.CHAR_SUIT_TO_INT_SUIT.values()}
+        self.used = 0
+        for card in self._cards + self._board:
+            self._count(card)
+
+    def _count(self, card):
+        self.rank_counts[(card >> 8) & 0xF] += 1
+        self.suit_counts[(card >> 12) & 0xF] += 1
+        self.used |= CARD_BITS[card]
+
+    @property
+    def name(self):
+        """The street's name: flop, turn or river."""
+        return STREET_NAMES[len(self._board)]
+
+    @property
+    def board(self):
+        """The board cards, as strings: the sorted flop, then turn and river."""
+        return [Card.int_to_str(card) for card in self._board]
+
+    @property
+    def rank_class(self):
+        """The hand's rank class on the current street."""
+        return self.ev.get_rank_class(self.rank)
+
+    def deal(self, card):
+        """Deal the next board card, updating the state in place."""
+        assert len(self._board) < 5
+        (card,) = card_tuple([card])
+        assert not self.used & CARD_BITS[card]
+
+        self.rank = extend_rank(self.ev, self._cards + self._board, self.rank, card)
+        self._board += (card,)
+        self._count(card)
+        return self
+
+    def hand(self):
+        """Return the Hand on the current street, without evaluating it again."""
+        return Hand._trusted(self._cards, Flop(self._board), self.ev, self.rank)
+
+    def flush_suits(self, count):
+        """Return the suit ints with exactly `count` cards, hole cards included."""
+        return [suit for (suit, n) in self.suit_counts.items() if n == count]
+
+    def paired_ranks(self):
+        """Return the ranks appearing at least twice among all the cards."""
+        return [rank for (rank, n) in enumerate(self.rank_counts) if n >= 2]